@@ -20,9 +20,9 @@ from nextcord.utils import get
 import injections
 import services
 from base.configurable import BasePlugin, NotLoadable, ConfigurableType, PluginClassNotFound, Configurable
-from base.data import Config, Lang, Storage, ConfigurableData
+from base.data import Config, Lang, Storage, ConfigurableData, WriteBehind
 from base.bot import Exitcode, BaseBot
-from botutils import utils, permchecks, converters, stringutils
+from botutils import utils, permchecks, converters, stringutils, restclient
 from botutils.utils import execute_anything_sync
 from services import timers, reactions, ignoring, dmlisteners, helpsys, presence, liveticker
 
@@ -50,6 +50,7 @@ class Geckarbot(BaseBot):
         super().__init__(*args, **kwargs)
 
         Lang().bot = self
+        Lang().load_all()
         Config().bot = self
         Storage().bot = self
         self.load_config()
@@ -364,6 +365,9 @@ class Geckarbot(BaseBot):
         logging.info("Shutting down.")
         logging.debug("Setting exit code: %s", status)
         self.exitcode = status
+        self.liveticker.flush_storage()
+        await WriteBehind().flush()
+        await restclient.Transport.close()
         await self.close()
 
     async def on_error(self, event_method, *args, **kwargs):
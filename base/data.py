@@ -1,8 +1,12 @@
 import os
 import json
+import atexit
+import asyncio
 import logging
+import threading
 from enum import Enum
 from botutils import jsonutils
+from botutils.formatutils import format_placeholders
 from string import ascii_lowercase
 
 from base.configurable import NotFound
@@ -21,6 +25,76 @@ class _Singleton(type):
         return cls._instances[cls]
 
 
+class WriteBehind(metaclass=_Singleton):
+    """
+    Collects ConfigurableData objects with unsaved containers and writes them to disk together, DELAY seconds after
+    the first change. Containers are serialized on the event loop, files are written in an executor.
+    If there is no running event loop, changes are written immediately.
+    """
+
+    DELAY = 5
+
+    def __init__(self):
+        self._dirty = {}  # ConfigurableData -> None; used as an ordered set
+        self._handle = None
+        self._lock = None
+
+    def mark(self, data):
+        """
+        Schedules writing the dirty containers of a ConfigurableData object.
+
+        :param data: ConfigurableData
+        """
+        self._dirty[data] = None
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush_sync()
+            return
+        if self._handle is None:
+            self._handle = loop.call_later(self.DELAY, lambda: loop.create_task(self.flush()))
+
+    async def flush(self):
+        """
+        Writes all pending changes to disk.
+        """
+        # pylint: disable=broad-except
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            while self._dirty:
+                batch = list(self._dirty)
+                self._dirty.clear()
+                for data in batch:
+                    for container in data.pop_dirty():
+                        try:
+                            data.encode(container)
+                            await loop.run_in_executor(None, data.write_pending, container)
+                        except Exception:
+                            logging.exception("Unable to write %s", data.filepath(container=container))
+
+    def flush_sync(self):
+        """
+        Writes all pending changes to disk without an event loop.
+        """
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        while self._dirty:
+            batch = list(self._dirty)
+            self._dirty.clear()
+            for data in batch:
+                data.flush()
+
+
+atexit.register(WriteBehind().flush_sync)
+
+
 class ConfigurableData:
     """Handles the data of a specific IODirectory-Configurable-combination."""
 
@@ -35,11 +109,19 @@ class ConfigurableData:
         self.configurable = configurable
         self.base_structure = {}
         self._structures = {}
+        self._dirty = set()
+        self._pending = {}
+        """container -> serialized structure that is not written yet"""
+        self._write_lock = threading.RLock()
 
     def _filebase(self):
         return f"{self.iodir.directory}/{self.configurable.get_name()}"
 
-    def _filepath(self, container=None):
+    def filepath(self, container=None):
+        """
+        :param container: Container name
+        :return: Path of the json file of the container
+        """
         base = self._filebase()
         if container is None:
             return f"{base}.json"
@@ -58,48 +140,62 @@ class ConfigurableData:
             return
         os.mkdir(directory)
 
-    def _write_file(self, config_data, container=None):
-        """Writes the config to file_name.json and returns if successfull"""
+    def _write_file(self, text, container=None):
+        """
+        Writes the serialized config to file_name.json. The file is replaced atomically.
+
+        :param text: Serialized structure
+        :param container: Container name
+        """
         if container is not None:
             self._mkdir()
+        path = self.filepath(container=container)
+        tmppath = f"{path}.{threading.get_ident()}.tmp"
         try:
-            with open(self._filepath(container=container), "w", encoding="utf-8") as f:
-                json.dump(config_data, f, cls=jsonutils.Encoder, indent=4)
-                return True
-        except (OSError, InterruptedError, OverflowError, ValueError, TypeError):
-            logging.error("Error writing config file %s", self._filepath(container=container))
+            with open(tmppath, "w", encoding="utf-8") as f:
+                f.write(text)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmppath, path)
+        except (OSError, InterruptedError):
+            logging.error("Error writing config file %s", path)
+            if os.path.exists(tmppath):
+                os.remove(tmppath)
             raise
 
     def _read_file(self, container=None, silent=False):
         """Reads the file_name.json and returns the content or None if errors"""
-        if not os.path.exists(self._filepath(container=container)):
+        if not os.path.exists(self.filepath(container=container)):
             return None
         try:
-            with open(self._filepath(container=container), "r", encoding="utf-8") as f:
+            with open(self.filepath(container=container), "r", encoding="utf-8") as f:
                 jsondata = json.load(f, cls=jsonutils.Decoder)
                 return jsondata
         except (IsADirectoryError, OSError, InterruptedError, json.JSONDecodeError):
             if not silent:
-                logging.error("Error reading %s.json", self._filepath(container=container))
+                logging.error("Error reading %s.json", self.filepath(container=container))
             return None
 
     def load(self):
         """Loads the saved data of the configurable from json"""
-        # Load default
-        if os.path.exists(self._filepath()):
-            self._structures[None] = self._read_file()
-        else:
-            self.get()
-
-        # Load containers
-        if os.path.exists(self._filebase()) and os.path.isdir(self._filebase()):
-            for el in os.listdir(self._filebase()):
-                if not el.endswith(".json"):
-                    continue
-                container = el[:-len(".json")]
-                el = self._read_file(container=container, silent=True)
-                if el is not None:
-                    self._structures[container] = el
+        with self._write_lock:
+            self.flush()
+
+            # Load default
+            if os.path.exists(self.filepath()):
+                self._structures[None] = self._read_file()
+            else:
+                self.get()
+
+            # Load containers
+            if os.path.exists(self._filebase()) and os.path.isdir(self._filebase()):
+                for el in os.listdir(self._filebase()):
+                    if not el.endswith(".json"):
+                        continue
+                    container = el[:-len(".json")]
+                    el = self._read_file(container=container, silent=True)
+                    if el is not None:
+                        self._structures[container] = el
 
     def structures(self):
         return self._structures.keys()
@@ -124,7 +220,56 @@ class ConfigurableData:
         self._structures[container] = data
 
     def save(self, container=None):
-        self._write_file(self._structures[container], container=container)
+        """
+        Marks the container as changed; it is written to disk by WriteBehind.
+
+        :param container: Container name
+        """
+        self._dirty.add(container)
+        WriteBehind().mark(self)
+
+    def pop_dirty(self):
+        """
+        :return: List of all changed containers; they are not considered dirty anymore.
+        """
+        r = [el for el in self._dirty if el in self._structures]
+        self._dirty.clear()
+        return r
+
+    def encode(self, container=None):
+        """
+        Serializes the current structure of a container for `write_pending()`. Has to be called from the thread that
+        modifies the structure, i.e. the event loop.
+
+        :param container: Container name
+        :raises: OverflowError, ValueError or TypeError if the structure cannot be serialized
+        """
+        try:
+            text = json.dumps(self._structures[container], cls=jsonutils.Encoder, indent=4)
+        except (OverflowError, ValueError, TypeError):
+            logging.error("Error serializing config file %s", self.filepath(container=container))
+            raise
+        with self._write_lock:
+            self._pending[container] = text
+
+    def write_pending(self, container=None):
+        """
+        Writes the latest serialized structure of a container to disk if it was not written yet. Thread-safe.
+
+        :param container: Container name
+        """
+        with self._write_lock:
+            text = self._pending.pop(container, None)
+            if text is not None:
+                self._write_file(text, container=container)
+
+    def flush(self):
+        """Writes all changed containers to disk immediately"""
+        with self._write_lock:
+            for container in self.pop_dirty():
+                self.encode(container)
+            for container in list(self._pending):
+                self.write_pending(container)
 
 
 class IODirectory(metaclass=_Singleton):
@@ -321,6 +466,48 @@ class Storage(IODirectory):
             raise
 
 
+class LangString:
+    """
+    Lang string with its format fields parsed once at load time.
+
+    :param text: lang file value
+    """
+    __slots__ = ("text", "literal", "positional", "named", "render")
+
+    def __init__(self, text):
+        self.text = text
+        self.literal = None
+        """The formatted string if `text` has no format fields, None otherwise"""
+        self.positional = 0
+        """Amount of positional args that `text` expects"""
+        self.named = frozenset()
+        """Names of the keyword fields of `text`"""
+        self.render = self._format
+        """Function that formats `text` with positional args like `str.format()`"""
+
+        if not isinstance(text, str):
+            return
+        try:
+            self.positional, self.named = format_placeholders(text)
+        except ValueError:
+            # invalid format string; format() raises as usual
+            return
+        if self.positional == 0 and not self.named:
+            self.literal = text.format()
+        else:
+            self.render = text.format
+
+    def _format(self, *args):
+        return self.text.format(*args)
+
+    @property
+    def signature(self):
+        """
+        :return: Tuple (amount of positional args, names of keyword fields)
+        """
+        return self.positional, self.named
+
+
 class Lang(metaclass=_Singleton):
     """Providing multi-language support for Plugins"""
     # pylint: disable=protected-access
@@ -374,6 +561,8 @@ class Lang(metaclass=_Singleton):
         self._bot = None
         self.directory = None
         self._cache = {}
+        self._files = {}
+        self._tables = {}
 
     @property
     def bot(self):
@@ -384,43 +573,105 @@ class Lang(metaclass=_Singleton):
         self._bot = bot
         self.directory = bot.LANG_DIR
 
+    @classmethod
+    def load_all(cls):
+        """
+        Reads and validates all lang files in the lang directory, so lookups do not need to touch the disk.
+        """
+        cls()._files = {}
+        cls().clear_cache()
+        if cls().directory is None or not os.path.isdir(cls().directory):
+            logging.warning("Lang directory %s not found", cls().directory)
+            return
+        for filename in sorted(os.listdir(cls().directory)):
+            if filename.endswith(".json"):
+                cls()._load_file(filename[:-len(".json")])
+
+    def _load_file(self, name):
+        """
+        Reads the lang file `name`, logs placeholder mismatches between languages and stores it in `_files`.
+
+        :param name: configurable name
+        :return: lang dict; empty dict if the file could not be read
+        """
+        # pylint: disable=broad-except
+        try:
+            with open(f"{self.directory}/{name}.json", encoding="utf-8") as f:
+                lang = json.load(f)
+        except (IsADirectoryError, FileNotFoundError, PermissionError, OSError):
+            logging.warning("Language file not found or unable to open for plugin %s", name)
+            lang = {}
+        except Exception as e:
+            lang = {}
+            logging.error("Uncaught exception while loading lang file from plugin %s: %s", name, e)
+
+        for str_name, signatures in lang_placeholder_mismatches(lang).items():
+            logging.warning("Lang file %s: placeholders of %s differ between languages: %s", name, str_name,
+                            ", ".join("{}: {}".format(code, format_signature(sig)) for code, sig in signatures.items()))
+        self._files[name] = lang
+        return lang
+
     @classmethod
     def clear_cache(cls):
         cls()._cache = {}
+        cls()._tables = {}
 
     @classmethod
     def remove_from_cache(cls, configurable):
+        """
+        Drops the lang data of `configurable` and re-reads its lang file if it was loaded before, e.g. on reload.
+
+        :param configurable: Configurable
+        """
         if configurable in cls()._cache:
             del cls()._cache[configurable]
+        for key in [key for key in cls()._tables if key[0] is configurable]:
+            del cls()._tables[key]
+        if configurable.get_name() in cls()._files:
+            cls()._load_file(configurable.get_name())
 
     @classmethod
     def read_from_cache(cls, configurable):
         """Reads the language data of the given configurable from cache, or builds it of not available"""
-        # pylint: disable=broad-except
         # Read from cache
         if configurable in cls()._cache:
             return cls()._cache[configurable]
 
-        # Read from file or configurable
+        # Read from configurable, preloaded files or file
         try:
             lang = configurable.get_lang()
         except NotFound:
             lang = None
         if lang is None:
-            try:
-                with open(f"{cls().directory}/{configurable.get_name()}.json", encoding="utf-8") as f:
-                    lang = json.load(f)
-            except (IsADirectoryError, FileNotFoundError, PermissionError, OSError):
-                logging.warning("Language file not found or unable to open for plugin %s",
-                                configurable.get_name())
-                lang = {}
-            except Exception as e:
-                lang = {}
-                logging.error("Uncaught exception while loading lang file from plugin %s: %s",
-                              configurable.get_name, e)
+            lang = cls()._files.get(configurable.get_name())
+        if lang is None:
+            lang = cls()._load_file(configurable.get_name())
         cls()._cache[configurable] = lang
         return lang
 
+    @classmethod
+    def table(cls, configurable, lang_code):
+        """
+        Returns the lang strings of `configurable` in `lang_code`, with `bot.DEFAULT_LANG` as fallback for missing
+        strings; cached.
+
+        :param configurable: The Configurable instance
+        :param lang_code: Language code
+        :return: dict str_name -> string without format fields or function that formats the string, see
+            `LangString.render`
+        """
+        key = (configurable, lang_code)
+        r = cls()._tables.get(key)
+        if r is None:
+            lang = cls().read_from_cache(configurable)
+            r = {}
+            for code in (cls().bot.DEFAULT_LANG, lang_code):
+                for str_name, text in lang.get(code, {}).items():
+                    langstr = LangString(text)
+                    r[str_name] = langstr.render if langstr.literal is None else langstr.literal
+            cls()._tables[key] = r
+        return r
+
     @classmethod
     def lang_no_failsafe(cls, configurable, str_name, *args):
         """
@@ -433,21 +684,22 @@ class Lang(metaclass=_Singleton):
         :param args: The strings to insert into the returning string via format()
         :return: The most applicable lang string for the given configurable and str_name. None if nothing is found.
         """
-        lang = cls().read_from_cache(configurable)
+        self = cls()
         lang_code = None
         try:
             lang_code = configurable.get_lang_code()
         except NotFound:
             pass
         if lang_code is None:
-            lang_code = cls().bot.LANGUAGE_CODE
-        if lang_code not in lang or str_name not in lang[lang_code]:
-            lang_code = cls().bot.DEFAULT_LANG
+            lang_code = self.bot.LANGUAGE_CODE
 
-        langstr = lang.get(lang_code, {}).get(str_name, None)
-        if langstr is not None:
-            langstr = langstr.format(*args)
-        return langstr
+        table = self._tables.get((configurable, lang_code))
+        if table is None:
+            table = cls.table(configurable, lang_code)
+        langstr = table.get(str_name)
+        if langstr is None or isinstance(langstr, str):
+            return langstr
+        return langstr(*args)
 
     @classmethod
     def lang(cls, configurable, str_name, *args) -> str:
@@ -479,6 +731,32 @@ class Lang(metaclass=_Singleton):
         return cls.EMOJI["lettermap"][ascii_lowercase.index(letter.lower())]
 
 
+def lang_placeholder_mismatches(lang: dict) -> dict:
+    """
+    Finds lang strings whose format fields differ between the languages of a lang dict.
+
+    :param lang: lang dict (lang code -> str_name -> string)
+    :return: dict str_name -> {lang code: signature} for every mismatching string, see `LangString.signature`
+    """
+    signatures = {}
+    for code, strings in lang.items():
+        if not isinstance(strings, dict):
+            continue
+        for str_name, text in strings.items():
+            if isinstance(text, str):
+                signatures.setdefault(str_name, {})[code] = LangString(text).signature
+    return {str_name: sigs for str_name, sigs in signatures.items() if len(set(sigs.values())) > 1}
+
+
+def format_signature(signature) -> str:
+    """
+    :param signature: signature as returned by `LangString.signature`
+    :return: Human-readable signature
+    """
+    positional, named = signature
+    return ", ".join(["{} positional".format(positional)] + sorted(named))
+
+
 def reconfigure(bot):
     """
     Loads the config of all registered plugins. If config of a
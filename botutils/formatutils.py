@@ -0,0 +1,28 @@
+from string import Formatter
+from typing import Tuple, FrozenSet
+
+# This module is imported by tools/langdiff.py and must not depend on anything outside of the standard library.
+
+
+def format_placeholders(text: str) -> Tuple[int, FrozenSet[str]]:
+    """
+    Parses the format fields of a `str.format()` format string.
+
+    :param text: format string
+    :return: Tuple (amount of positional args that `text` expects, names of its keyword fields)
+    :raises ValueError: If `text` is not a valid format string
+    """
+    auto = 0
+    positional = 0
+    named = set()
+    for _, field, _, _ in Formatter().parse(text):
+        if field is None:
+            continue
+        field = field.split(".", 1)[0].split("[", 1)[0]
+        if field == "":
+            auto += 1
+        elif field.isdigit():
+            positional = max(positional, int(field) + 1)
+        else:
+            named.add(field)
+    return max(positional, auto), frozenset(named)
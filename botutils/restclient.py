@@ -1,9 +1,12 @@
 #!/usr/bin/env python3
 
 import json
+import time
 import urllib.request
 import urllib.error
-from typing import Any, Optional
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from typing import Any, Optional, Dict, Iterable, Tuple
 from urllib.parse import urlencode
 from enum import Enum
 import base64
@@ -11,8 +14,6 @@ import logging
 
 import aiohttp
 
-from botutils.utils import execute_anything_sync
-
 
 class AuthError(Exception):
     """Raisen on authentication errors"""
@@ -23,10 +24,153 @@ class Auth(Enum):
     BEARER = 1
 
 
+class Transport:
+    """
+    Bot-wide HTTP transport. Holds one pooled aiohttp session with keep-alive connections that is shared
+    by all Client instances. The session is created lazily on first use and closed on bot shutdown.
+    """
+    LIMIT = 100
+    """Max number of simultaneous connections"""
+    LIMIT_PER_HOST = 10
+    """Max number of simultaneous connections to the same host"""
+    KEEPALIVE_TIMEOUT = 60
+    """Seconds an idle connection is kept open for reuse"""
+    DNS_CACHE_TTL = 300
+
+    _session = None  # type: Optional[aiohttp.ClientSession]
+
+    @classmethod
+    def session(cls) -> aiohttp.ClientSession:
+        """
+        Returns the shared session and (re)creates it if necessary.
+
+        :return: Shared aiohttp session
+        """
+        if cls._session is None or cls._session.closed:
+            connector = aiohttp.TCPConnector(limit=cls.LIMIT, limit_per_host=cls.LIMIT_PER_HOST,
+                                             keepalive_timeout=cls.KEEPALIVE_TIMEOUT,
+                                             ttl_dns_cache=cls.DNS_CACHE_TTL)
+            cls._session = aiohttp.ClientSession(connector=connector)
+            logging.getLogger(__name__).debug("Created shared http session")
+        return cls._session
+
+    @classmethod
+    async def close(cls):
+        """Closes the shared session and all of its pooled connections."""
+        if cls._session is not None and not cls._session.closed:
+            await cls._session.close()
+            logging.getLogger(__name__).debug("Closed shared http session")
+        cls._session = None
+
+
+class CacheEntry:
+    """A cached http response"""
+
+    def __init__(self, body: str, expires: float, etag: Optional[str] = None, last_modified: Optional[str] = None):
+        self.body = body
+        self.expires = expires
+        self.etag = etag
+        self.last_modified = last_modified
+
+    def is_fresh(self) -> bool:
+        return time.monotonic() < self.expires
+
+    def can_revalidate(self) -> bool:
+        return self.etag is not None or self.last_modified is not None
+
+
+class ResponseCache:
+    """
+    LRU cache for http responses that can be attached to one or more Clients. Entries live for a TTL;
+    expired entries that came with an ETag or Last-Modified header are revalidated with a conditional request
+    instead of being fetched again.
+    """
+
+    def __init__(self, ttl: float = 60, maxsize: int = 256, ttls: Optional[Dict[str, float]] = None,
+                 ignore_params: Iterable[str] = ()):
+        """
+        :param ttl: Default TTL in seconds; 0 disables caching for endpoints that are not in `ttls`
+        :param maxsize: Max number of cached responses, the least recently used one is dropped first
+        :param ttls: TTLs per endpoint; keys are glob patterns like `"soccer/*/standings"`
+        :param ignore_params: URL parameters that are not part of the cache key, e.g. cache busters
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.ttls = ttls if ttls is not None else {}
+        self.ignore_params = frozenset(ignore_params)
+        self._entries = OrderedDict()  # type: OrderedDict[Tuple, CacheEntry]
+
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+
+    def get_ttl(self, endpoint: str) -> float:
+        """
+        :param endpoint: Request endpoint
+        :return: TTL for the endpoint
+        """
+        endpoint = endpoint.strip("/")
+        for pattern, ttl in self.ttls.items():
+            if fnmatchcase(endpoint, pattern.strip("/")):
+                return ttl
+        return self.ttl
+
+    def build_key(self, method: str, url: str, params: Optional[dict]) -> Tuple:
+        """
+        Builds the cache key of a request.
+
+        :param method: http method
+        :param url: URL without parameters
+        :param params: URL parameters
+        :return: cache key
+        """
+        if params:
+            params = tuple(sorted((str(k), str(v)) for k, v in params.items() if k not in self.ignore_params))
+        else:
+            params = ()
+        return method, url, params
+
+    def get(self, key: Tuple) -> Optional[CacheEntry]:
+        """
+        :param key: cache key
+        :return: The cached entry (possibly expired) or None if there is none
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: Tuple, entry: CacheEntry):
+        """
+        Adds or replaces an entry and drops the least recently used ones if the cache is full.
+
+        :param key: cache key
+        :param entry: entry to cache
+        """
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def remove(self, key: Tuple):
+        self._entries.pop(key, None)
+
+    def clear(self):
+        """Removes all entries"""
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
 class Client:
-    """Client for HTTP requests, e.g. for REST APIs"""
+    """Client for HTTP requests, e.g. for REST APIs. All clients share the pooled connections of `Transport`."""
 
-    def __init__(self, url):
+    def __init__(self, url, cache: Optional[ResponseCache] = None):
+        """
+        :param url: Base URL
+        :param cache: Response cache for GET requests; None disables caching
+        """
         self.credentials = {}
 
         # build api url
@@ -37,13 +181,17 @@ class Client:
 
         self.cookie = None
         self.auth = None
+        self.cache = cache
 
         self.decoder = json.JSONDecoder()
         self.encoder = json.JSONEncoder()
 
         self.logger = logging.getLogger(__name__)
 
-        self.aiosession = aiohttp.ClientSession()
+    @property
+    def aiosession(self) -> aiohttp.ClientSession:
+        """The shared aiohttp session"""
+        return Transport.session()
 
     @staticmethod
     def _normalize_url_part(part) -> str:
@@ -180,7 +328,7 @@ class Client:
 
     async def request(self, endpoint: str, appendix: str = None, params: dict = None, data: Any = None,
                       headers: dict = None, method: str = "GET",
-                      parse_json: bool = True, encode_json: bool = True) -> Any:
+                      parse_json: bool = True, encode_json: bool = True, cache_ttl: Optional[float] = None) -> Any:
         """
         Sends a http request.
 
@@ -192,11 +340,37 @@ class Client:
         :param method: http method ("GET", "POST" etc)
         :param parse_json: Treat response as json and parse it
         :param encode_json: Treat data as structure that is to be encoded in json
+        :param cache_ttl: Overrides the cache TTL for this request, 0 bypasses the cache.
+            Only used for GET requests if the client has a cache.
         :return: parsed response
         :raises RuntimeError: Raised if method is an unknown http method
         """
         headers = self._build_headers(headers)
         url = self.url(endpoint=endpoint, appendix=appendix, params=params)
+
+        # cache lookup
+        cache_key = None
+        entry = None
+        if self.cache is not None and method == "GET" and data is None:
+            if cache_ttl is None:
+                cache_ttl = self.cache.get_ttl(endpoint)
+            if cache_ttl > 0:
+                cache_key = self.cache.build_key(method, self.url(endpoint=endpoint, appendix=appendix), params)
+                entry = self.cache.get(cache_key)
+                if entry is not None and entry.is_fresh():
+                    self.cache.hits += 1
+                    self.logger.debug("Cache hit for %s", url)
+                    return self.parse_response(entry.body) if parse_json else entry.body
+                self.cache.misses += 1
+                if entry is not None and entry.can_revalidate():
+                    if entry.etag is not None:
+                        headers["If-None-Match"] = entry.etag
+                    if entry.last_modified is not None:
+                        headers["If-Modified-Since"] = entry.last_modified
+                elif entry is not None:
+                    self.cache.remove(cache_key)
+                    entry = None
+
         if encode_json:
             data = self.encode_request_data(data)
         self._maskprint(data, prefix="data: ")
@@ -220,7 +394,20 @@ class Client:
 
         self.logger.debug("Doing async http request to %s", url)
         async with f(url, headers=headers, data=data) as response:
+            status = response.status
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
             response = await response.text()
+
+        if cache_key is not None:
+            if status == 304 and entry is not None:
+                self.cache.revalidations += 1
+                self.logger.debug("Cached response for %s is still valid", url)
+                entry.expires = time.monotonic() + cache_ttl
+                response = entry.body
+            elif status == 200:
+                self.cache.put(cache_key, CacheEntry(response, time.monotonic() + cache_ttl,
+                                                     etag=etag, last_modified=last_modified))
         self.logger.debug("Response: %s", response)
         if parse_json:
             response = json.loads(response)
@@ -263,9 +450,6 @@ class Client:
             response = self.parse_response(response)
         return response
 
-    def __del__(self):
-        execute_anything_sync(self.aiosession.close())
-
     def _maskprint(self, d, prefix=""):
         """
         Prints the dictionary d but replaces any `"password"` values with `***`
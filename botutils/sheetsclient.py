@@ -1,7 +1,9 @@
+import asyncio
 import logging
 import os
 import re
 import string
+import urllib.error
 import urllib.parse
 from typing import Optional, Dict, Tuple, Union, List
 
@@ -221,35 +223,85 @@ class CellRange:
 
 
 # pylint: disable=missing-return-type-doc
-def get_service():
-    """Returns the service for the google sheets"""
-    # pylint: disable=import-outside-toplevel
-    try:
-        from google.oauth2 import service_account
-        from googleapiclient import discovery
-        scopes = ["https://www.googleapis.com/auth/drive", "https://www.googleapis.com/auth/drive.file",
-                  "https://www.googleapis.com/auth/spreadsheets"]
-        secret_file = os.path.join(os.getcwd(), "config/google_service_account.json")
-        credentials = service_account.Credentials.from_service_account_file(secret_file, scopes=scopes)
-        service = discovery.build('sheets', 'v4', credentials=credentials)
-    except ImportError as e:
-        raise NotLoadable("Google API modules not installed.") from e
-    except Exception as e:
-        raise NoCredentials() from e
-    else:
-        return service
+class SheetsApiError(Exception):
+    """Raised if the Sheets API responds with an error"""
+
+    def __init__(self, error: dict):
+        self.code = error.get("code")
+        self.status = error.get("status")
+        super().__init__("Sheets API error {} ({}): {}".format(self.code, self.status, error.get("message")))
+
+
+class ServiceAccount:
+    """
+    Holds the service account credentials and their access token. Expired tokens are refreshed in an executor.
+    """
+    SCOPES = ["https://www.googleapis.com/auth/drive", "https://www.googleapis.com/auth/drive.file",
+              "https://www.googleapis.com/auth/spreadsheets"]
+
+    _credentials = None
+
+    @classmethod
+    def credentials(cls):
+        """
+        :return: Service account credentials
+        :raises NotLoadable: If Google API packages are not installed
+        :raises NoCredentials: If the credentials file is missing or invalid
+        """
+        # pylint: disable=import-outside-toplevel
+        if cls._credentials is None:
+            try:
+                from google.oauth2 import service_account
+                secret_file = os.path.join(os.getcwd(), "config/google_service_account.json")
+                cls._credentials = service_account.Credentials.from_service_account_file(secret_file,
+                                                                                         scopes=cls.SCOPES)
+            except ImportError as e:
+                raise NotLoadable("Google API modules not installed.") from e
+            except Exception as e:
+                raise NoCredentials() from e
+        return cls._credentials
+
+    @classmethod
+    def token_sync(cls) -> str:
+        """
+        Returns a valid access token; refreshes it synchronously if necessary.
+
+        :return: access token
+        """
+        # pylint: disable=import-outside-toplevel
+        credentials = cls.credentials()
+        if not credentials.valid:
+            import httplib2
+            from google_auth_httplib2 import Request
+            credentials.refresh(Request(httplib2.Http()))
+        return credentials.token
+
+    @classmethod
+    async def token(cls) -> str:
+        """
+        Returns a valid access token; a necessary refresh is done in an executor.
+
+        :return: access token
+        """
+        credentials = cls.credentials()
+        if credentials.valid:
+            return credentials.token
+        return await asyncio.get_running_loop().run_in_executor(None, cls.token_sync)
 
 
 class Client(restclient.Client):
     """
     REST Client for Google Sheets API.
     Further infos: https://developers.google.com/sheets/api
+
+    The `*_async` methods go through the bot's shared http session and do not block the event loop;
+    the other methods are their synchronous counterparts.
     """
 
     def __init__(self, bot, spreadsheet_id: str):
         """
         Creates a new REST Client for Google Sheets API using the API Key given in Geckarbot.json.
-        If no API Key is given, the Client can't set up.
+        Reading requests use the API key if there is one, everything else uses the service account.
 
         :param bot: Geckarbot reference
         :param spreadsheet_id: The ID of the spreadsheet
@@ -278,25 +330,139 @@ class Client(restclient.Client):
         params.append(('key', self.bot.GOOGLE_API_KEY))
         return params
 
-    def _make_request(self, route: str, params=None) -> Dict:
+    def _prepare(self, route: str, params: Optional[list], body: Optional[dict], read_only: bool) -> Tuple:
         """
-        Makes a Sheets Request
+        Prepares route, params and headers of a Sheets request.
+
+        :param route: route relative to the spreadsheets endpoint
+        :param params: List of params
+        :param body: json body
+        :param read_only: Whether the request can be authenticated with the API key
+        :return: route, params, headers, whether a bearer token is needed
         """
         route = urllib.parse.quote(route, safe="/:")
-        params = self._params_add_api_key(params)
-        # self.logger.debug("Making Sheets request {}, params: {}".format(route, params))
-        response = self.make_request(route, params=params)
-        # self.logger.debug("Response: {}".format(response))
+        params = list(params) if params else []
+        headers = {}
+        if body is not None:
+            headers["Content-Type"] = "application/json"
+        use_key = read_only and self.bot.GOOGLE_API_KEY
+        if use_key:
+            params = self._params_add_api_key(params)
+        return route, params, headers, not use_key
+
+    @staticmethod
+    def _check(response: Dict) -> Dict:
+        """
+        :param response: Parsed response
+        :return: response
+        :raises SheetsApiError: If the response is an error response
+        """
+        if isinstance(response, dict) and "error" in response:
+            raise SheetsApiError(response["error"])
         return response
 
+    async def _execute(self, method: str, route: str, params: list = None, body: dict = None,
+                       read_only: bool = False) -> Dict:
+        """
+        Makes a Sheets request asynchronously.
+
+        :param method: http method
+        :param route: route relative to the spreadsheets endpoint
+        :param params: List of params
+        :param body: json body
+        :param read_only: Whether the request can be authenticated with the API key
+        :return: parsed response
+        :raises SheetsApiError: If the API responds with an error
+        """
+        route, params, headers, needs_token = self._prepare(route, params, body, read_only)
+        if needs_token:
+            headers["Authorization"] = "Bearer {}".format(await ServiceAccount.token())
+        response = await self.request(route, params=params, data=body, headers=headers, method=method)
+        return self._check(response)
+
+    def _execute_sync(self, method: str, route: str, params: list = None, body: dict = None,
+                      read_only: bool = False) -> Dict:
+        """
+        Makes a Sheets request synchronously.
+
+        :param method: http method
+        :param route: route relative to the spreadsheets endpoint
+        :param params: List of params
+        :param body: json body
+        :param read_only: Whether the request can be authenticated with the API key
+        :return: parsed response
+        :raises SheetsApiError: If the API responds with an error
+        """
+        route, params, headers, needs_token = self._prepare(route, params, body, read_only)
+        if needs_token:
+            headers["Authorization"] = "Bearer {}".format(ServiceAccount.token_sync())
+        try:
+            response = self.make_request(route, params=params, data=body, headers=headers, method=method)
+        except urllib.error.HTTPError as e:
+            response = self.parse_response(e.read().decode("utf-8"))
+        return self._check(response)
+
+    #######
+    # Request definitions; (method, route, params, body, read_only) as to be passed to _execute()
+    #######
+    def _get_request(self, cellrange: str, formatted: bool) -> Tuple:
+        value_render_option = "FORMATTED_VALUE" if formatted else "UNFORMATTED_VALUE"
+        return ("GET", "{}/values/{}".format(self.spreadsheet_id, cellrange),
+                [('valueRenderOption', value_render_option)], None, True)
+
+    def _get_multiple_request(self, ranges: List[str], formatted: bool) -> Tuple:
+        value_render_option = "FORMATTED_VALUE" if formatted else "UNFORMATTED_VALUE"
+        params = [('valueRenderOption', value_render_option)]
+        for cellrange in ranges:
+            params.append(("ranges", cellrange))
+        return "GET", "{}/values:batchGet".format(self.spreadsheet_id), params, None, True
+
+    def _update_request(self, cellrange: str, values: List[List[str]], raw: bool) -> Tuple:
+        value_input_option = 'RAW' if raw else 'USER_ENTERED'
+        return ("PUT", "{}/values/{}".format(self.spreadsheet_id, cellrange),
+                [('valueInputOption', value_input_option)], {'values': values}, False)
+
+    def _update_multiple_request(self, data_dict: dict, raw: bool) -> Tuple:
+        data = []
+        for cellrange in data_dict:
+            data.append({
+                'range': cellrange,
+                'values': data_dict[cellrange]
+            })
+        body = {
+            'valueInputOption': 'RAW' if raw else 'USER_ENTERED',
+            'data': data
+        }
+        return "POST", "{}/values:batchUpdate".format(self.spreadsheet_id), None, body, False
+
+    def _append_request(self, cellrange: str, values: List[List[str]], raw: bool) -> Tuple:
+        value_input_option = 'RAW' if raw else 'USER_ENTERED'
+        return ("POST", "{}/values/{}:append".format(self.spreadsheet_id, cellrange),
+                [('valueInputOption', value_input_option)], {'values': values}, False)
+
+    def _clear_request(self, cellrange: str) -> Tuple:
+        return "POST", "{}/values/{}:clear".format(self.spreadsheet_id, cellrange), None, {}, False
+
+    def _clear_multiple_request(self, ranges: List[str]) -> Tuple:
+        return "POST", "{}/values:batchClear".format(self.spreadsheet_id), None, {'ranges': ranges}, False
+
+    def _batch_update_request(self, requests: List[Dict]) -> Tuple:
+        return "POST", "{}:batchUpdate".format(self.spreadsheet_id), None, {"requests": requests}, False
+
+    @staticmethod
+    def _value_ranges(response: Dict) -> List[List[List[str]]]:
+        values = []
+        for vrange in response.get('valueRanges', []):
+            values.append(vrange.get('values', []))
+        return values
+
     def _get_sheets(self) -> List:
         """
         Gets all sheets
 
         :return: List of sheets
         """
-        # pylint: disable=no-member
-        info = get_service().spreadsheets().get(spreadsheetId=self.spreadsheet_id).execute()
+        info = self._execute_sync("GET", self.spreadsheet_id)
         sheets = info.get('sheets', [])
         return sheets
 
@@ -324,7 +490,7 @@ class Client(restclient.Client):
             return sheet
         return self._get_sheet_properties(sheet).get('sheetId')
 
-    def get(self, cellrange: str, formatted: bool = True) -> List[List[str]]:
+    async def get_async(self, cellrange: str, formatted: bool = True) -> List[List[str]]:
         """
         Reads a single range
 
@@ -332,19 +498,14 @@ class Client(restclient.Client):
         :param formatted: whether the cell values should be read formatted/as seen in the sheet or not
         :return: values of that range
         """
-        value_render_option = "FORMATTED_VALUE" if formatted else "UNFORMATTED_VALUE"
-        if self.bot.GOOGLE_API_KEY:
-            route = "{}/values/{}".format(self.spreadsheet_id, cellrange)
-            response = self._make_request(route, params=[('valueRenderOption', value_render_option)])
-        else:
-            response = get_service().spreadsheets().values().get(  # pylint: disable=no-member
-                spreadsheetId=self.spreadsheet_id, range=cellrange, valueRenderOption=value_render_option).execute()
-            self.logger.debug("Response: %s", response)
+        response = await self._execute(*self._get_request(cellrange, formatted))
+        return response.get('values', [])
 
-        values = response.get('values', [])
-        return values
+    def get(self, cellrange: str, formatted: bool = True) -> List[List[str]]:
+        """Synchronous version of `get_async()`"""
+        return self._execute_sync(*self._get_request(cellrange, formatted)).get('values', [])
 
-    def get_multiple(self, ranges: List[str], formatted: bool = True) -> List[List[List[str]]]:
+    async def get_multiple_async(self, ranges: List[str], formatted: bool = True) -> List[List[List[str]]]:
         """
         Reads multiple ranges
 
@@ -352,25 +513,13 @@ class Client(restclient.Client):
         :param formatted: whether the cell values should be read formatted/as seen in the sheet or not
         :return: values list
         """
-        value_render_option = "FORMATTED_VALUE" if formatted else "UNFORMATTED_VALUE"
-        if self.bot.GOOGLE_API_KEY:
-            route = "{}/values:batchGet".format(self.spreadsheet_id)
-            params = [('valueRenderOption', value_render_option)]
-            for cellrange in ranges:
-                params.append(("ranges", cellrange))
-            response = self._make_request(route, params=params)
-        else:
-            response = get_service().spreadsheets().values().batchGet(  # pylint: disable=no-member
-                spreadsheetId=self.spreadsheet_id, ranges=ranges, valueRenderOption=value_render_option).execute()
-            self.logger.debug("Response: %s", response)
+        return self._value_ranges(await self._execute(*self._get_multiple_request(ranges, formatted)))
 
-        value_ranges = response.get('valueRanges', [])
-        values = []
-        for vrange in value_ranges:
-            values.append(vrange.get('values', []))
-        return values
+    def get_multiple(self, ranges: List[str], formatted: bool = True) -> List[List[List[str]]]:
+        """Synchronous version of `get_multiple_async()`"""
+        return self._value_ranges(self._execute_sync(*self._get_multiple_request(ranges, formatted)))
 
-    def update(self, cellrange: str, values: List[List[str]], raw: bool = True) -> Dict:
+    async def update_async(self, cellrange: str, values: List[List[str]], raw: bool = True) -> Dict:
         """
         Updates the content of a range
 
@@ -379,18 +528,13 @@ class Client(restclient.Client):
         :param raw: if True, values are put in 'raw', if False as 'user_entered'
         :return: UpdateValuesResponse
         """
-        data = {
-            'values': values
-        }
-        value_input_option = 'RAW' if raw else 'USER_ENTERED'
-        # pylint: disable=no-member
-        response = get_service().spreadsheets().values().update(
-            spreadsheetId=self.spreadsheet_id, range=cellrange,
-            valueInputOption=value_input_option, body=data).execute()
-        self.logger.debug("Response: %s", response)
-        return response
+        return await self._execute(*self._update_request(cellrange, values, raw))
 
-    def update_multiple(self, data_dict: dict, raw: bool = True) -> Dict:
+    def update(self, cellrange: str, values: List[List[str]], raw: bool = True) -> Dict:
+        """Synchronous version of `update_async()`"""
+        return self._execute_sync(*self._update_request(cellrange, values, raw))
+
+    async def update_multiple_async(self, data_dict: dict, raw: bool = True) -> Dict:
         """
         Updates the content of multiple ranges
 
@@ -399,25 +543,13 @@ class Client(restclient.Client):
                           (as following: [[cells..], rows..])
         :return: response with information about the updates
         """
+        return await self._execute(*self._update_multiple_request(data_dict, raw))
 
-        data = []
-        for cellrange in data_dict:
-            data.append({
-                'range': cellrange,
-                'values': data_dict[cellrange]
-            })
-        value_input_option = 'RAW' if raw else 'USER_ENTERED'
-        body = {
-            'valueInputOption': value_input_option,
-            'data': data
-        }
-        # pylint: disable=no-member
-        response = get_service().spreadsheets().values().batchUpdate(
-            spreadsheetId=self.spreadsheet_id, body=body).execute()
-        self.logger.debug("Response: %s", response)
-        return response
+    def update_multiple(self, data_dict: dict, raw: bool = True) -> Dict:
+        """Synchronous version of `update_multiple_async()`"""
+        return self._execute_sync(*self._update_multiple_request(data_dict, raw))
 
-    def append(self, cellrange: str, values: List[List[str]], raw: bool = True) -> Dict:
+    async def append_async(self, cellrange: str, values: List[List[str]], raw: bool = True) -> Dict:
         """
         Appends values to a table (Warning: can maybe overwrite cells below the table)
 
@@ -426,43 +558,38 @@ class Client(restclient.Client):
         :param raw: whether valueInputOption should be 'raw'
         :return: UpdateValuesResponse
         """
-        data = {
-            'values': values
-        }
-        value_input_option = 'RAW' if raw else 'USER_ENTERED'
-        # pylint: disable=no-member
-        response = get_service().spreadsheets().values().append(
-            spreadsheetId=self.spreadsheet_id, range=cellrange, valueInputOption=value_input_option,
-            body=data).execute()
-        self.logger.debug("Response: %s", response)
+        response = await self._execute(*self._append_request(cellrange, values, raw))
         return response.get('updates', {})
 
-    def clear(self, cellrange: str) -> Dict:
+    def append(self, cellrange: str, values: List[List[str]], raw: bool = True) -> Dict:
+        """Synchronous version of `append_async()`"""
+        return self._execute_sync(*self._append_request(cellrange, values, raw)).get('updates', {})
+
+    async def clear_async(self, cellrange: str) -> Dict:
         """
         Clears a range
 
         :param cellrange: range to be cleared
         :return: response
         """
-        # pylint: disable=no-member
-        response = get_service().spreadsheets().values().clear(
-            spreadsheetId=self.spreadsheet_id, range=cellrange).execute()
-        return response
+        return await self._execute(*self._clear_request(cellrange))
 
-    def clear_multiple(self, ranges: List[str]) -> Dict:
+    def clear(self, cellrange: str) -> Dict:
+        """Synchronous version of `clear_async()`"""
+        return self._execute_sync(*self._clear_request(cellrange))
+
+    async def clear_multiple_async(self, ranges: List[str]) -> Dict:
         """
         Clears multiple ranges
 
         :param ranges: list of ranges
         :return: response
         """
-        body = {
-            'ranges': ranges
-        }
-        # pylint: disable=no-member
-        response = get_service().spreadsheets().values().batchClear(
-            spreadsheetId=self.spreadsheet_id, body=body).execute()
-        return response
+        return await self._execute(*self._clear_multiple_request(ranges))
+
+    def clear_multiple(self, ranges: List[str]) -> Dict:
+        """Synchronous version of `clear_multiple_async()`"""
+        return self._execute_sync(*self._clear_multiple_request(ranges))
 
     def add_sheet(self, title: str, rows: int = 1000, columns: int = 26) -> Optional[Dict]:
         """
@@ -474,33 +601,23 @@ class Client(restclient.Client):
         :return: AddSheetResponse if successful, None instead
         :raises NotLoadable: If Google API packages are not installed
         """
-        # pylint: disable=import-outside-toplevel
-        body = {
-            "requests": [
-                {
-                    "addSheet": {
-                        "properties": {
-                            "title": title,
-                            "gridProperties": {
-                                "rowCount": rows,
-                                "columnCount": columns,
-                            }
+        requests = [
+            {
+                "addSheet": {
+                    "properties": {
+                        "title": title,
+                        "gridProperties": {
+                            "rowCount": rows,
+                            "columnCount": columns,
                         }
                     }
                 }
-            ]
-        }
+            }
+        ]
         try:
-            from googleapiclient.errors import HttpError
-            try:
-                # pylint: disable=no-member
-                response = get_service().spreadsheets().batchUpdate(spreadsheetId=self.spreadsheet_id,
-                                                                    body=body).execute()
-                return response
-            except HttpError:
-                return None
-        except ImportError as e:
-            raise NotLoadable("Google API modules not installed.") from e
+            return self._execute_sync(*self._batch_update_request(requests))
+        except SheetsApiError:
+            return None
 
     def duplicate_sheet(self, sheet: Union[str, int], new_title: str = None, index: int = None,
                         new_id: int = None) -> Optional[Dict]:
@@ -515,7 +632,6 @@ class Client(restclient.Client):
         :return: DuplicateSheetResponse if successful, None instead
         :raises NotLoadable: If google API packages are not installed
         """
-        # pylint: disable=import-outside-toplevel
         properties = self._get_sheet_properties(sheet)
         if properties is None:
             return None
@@ -532,22 +648,10 @@ class Client(restclient.Client):
             request['newSheetName'] = new_title
         if new_id:
             request['newSheetId'] = new_id
-        body = {
-            "requests": [{
-                "duplicateSheet": request
-            }]
-        }
         try:
-            from googleapiclient.errors import HttpError
-            try:
-                # pylint: disable=no-member
-                response = get_service().spreadsheets().batchUpdate(
-                    spreadsheetId=self.spreadsheet_id, body=body).execute()
-                return response
-            except HttpError:
-                return None
-        except ImportError as e:
-            raise NotLoadable("Google API modules not installed.") from e
+            return self._execute_sync(*self._batch_update_request([{"duplicateSheet": request}]))
+        except SheetsApiError:
+            return None
 
     def duplicate_and_archive_sheet(self, sheet: str, new_title: str = None, index: int = None,
                                     new_id: int = None) -> Optional[Tuple[Dict, Dict]]:
@@ -595,7 +699,6 @@ class Client(restclient.Client):
         :raises NotLoadable: if Google API modules not installed
         :return: FindReplaceResponse
         """
-        # pylint: disable=import-outside-toplevel
         request = {
             "find": find,
             "replacement": replace,
@@ -631,19 +734,7 @@ class Client(restclient.Client):
                 return None
         else:
             return None
-        body = {
-            "requests": [{
-                "findReplace": request
-            }]
-        }
         try:
-            from googleapiclient.errors import HttpError
-            try:
-                # pylint: disable=no-member
-                response = get_service().spreadsheets().batchUpdate(
-                    spreadsheetId=self.spreadsheet_id, body=body).execute()
-                return response
-            except HttpError:
-                return None
-        except ImportError as e:
-            raise NotLoadable("Google API modules not installed.") from e
+            return self._execute_sync(*self._batch_update_request([{"findReplace": request}]))
+        except SheetsApiError:
+            return None
@@ -5,7 +5,7 @@ import random
 import logging
 import abc
 from math import ceil
-from typing import Optional, Union, Dict, Type, List
+from typing import Optional, Union, Dict, Type, List, Tuple, Callable
 
 import aiohttp
 from nextcord import User, Message, Member, Embed
@@ -28,6 +28,7 @@ QUOTATION_SIGNS = "\"‘‚‛“„‟⹂「」『』〝〞﹁﹂﹃﹄＂｢
 cmd_re = re.compile(rf"([{QUOTATION_SIGNS}]([^{QUOTATION_SIGNS}]*)[{QUOTATION_SIGNS}]|\S+)")
 arg_list_re = re.compile(r"(%(\d)(\*?))")
 mention_re = re.compile(r"<[@!#&]{0,2}\d+>")
+wildcard_re = re.compile(rf"{WILDCARD_UMENTION}|{WILDCARD_USER}|{WILDCARD_ALL_ARGS}|%(\d)(\*?)")
 
 
 def _get_all_arg_str(start_index, all_arg_list):
@@ -43,6 +44,87 @@ def _get_all_arg_str(start_index, all_arg_list):
     return arg.strip()
 
 
+class TextTemplate:
+    """
+    A custom cmd text that is parsed once into literal segments and wildcard slots and can then be rendered
+    in a single pass.
+    """
+    LITERAL = 0
+    USER = 1
+    UMENTION = 2
+    ALL_ARGS = 3
+    ARG = 4
+
+    def __init__(self, text: str):
+        """
+        :param text: Raw cmd text
+        """
+        self.text = text
+        self.segments: List[Tuple] = []
+        """(LITERAL, str), (USER,), (UMENTION,), (ALL_ARGS,) or (ARG, arg index, all following args, raw)"""
+        self.arg_count = 0
+        """Number of numbered argument wildcards"""
+
+        pos = 0
+        for m in wildcard_re.finditer(text):
+            if m.start() > pos:
+                self.segments.append((self.LITERAL, text[pos:m.start()]))
+            pos = m.end()
+            wildcard = m.group(0)
+            if wildcard == WILDCARD_UMENTION:
+                self.segments.append((self.UMENTION,))
+            elif wildcard == WILDCARD_USER:
+                self.segments.append((self.USER,))
+            elif wildcard == WILDCARD_ALL_ARGS:
+                self.segments.append((self.ALL_ARGS,))
+            else:
+                self.arg_count += 1
+                self.segments.append((self.ARG, int(m.group(1)) - 1, bool(m.group(2)), wildcard))
+        if pos < len(text):
+            self.segments.append((self.LITERAL, text[pos:]))
+
+    def render(self, author_mention: str, author_name: str, cmd_args,
+               arg_hook: Optional[Callable[[str], None]] = None) -> str:
+        """
+        Renders the text.
+
+        :param author_mention: Replacement for `%um`
+        :param author_name: Replacement for `%u`
+        :param cmd_args: The used command arguments as found by `cmd_re`
+        :param arg_hook: Is called with every argument that is inserted for a numbered wildcard
+        :return: The rendered text
+        """
+        # if only one argument in cmd text and no arg given: mention the user
+        if self.arg_count == 1 and len(cmd_args) == 0:
+            cmd_args = [(author_mention, "")]
+
+        r = []
+        checked = set()
+        for segment in self.segments:
+            kind = segment[0]
+            if kind == self.LITERAL:
+                r.append(segment[1])
+            elif kind == self.UMENTION:
+                r.append(author_mention)
+            elif kind == self.USER:
+                r.append(author_name)
+            elif kind == self.ALL_ARGS:
+                r.append(_get_all_arg_str(0, cmd_args))
+            else:
+                _, arg_num, all_following, raw = segment
+                if arg_num < 0 or arg_num >= len(cmd_args):
+                    r.append(raw)
+                    continue
+                arg = cmd_args[arg_num][1] if cmd_args[arg_num][1] else cmd_args[arg_num][0]  # [1] = args inside ""
+                if all_following:
+                    arg += " " + _get_all_arg_str(arg_num + 1, cmd_args)
+                if arg_hook is not None and arg not in checked:
+                    checked.add(arg)
+                    arg_hook(arg)
+                r.append(arg)
+        return "".join(r)
+
+
 class CmdEmpty(Exception):
     """
     Flow control, raised by Cmd.delete_by_id() when the cmd is now empty and can be safely deleted.
@@ -197,6 +279,7 @@ class TextCmd(Cmd):
         super().__init__(plugin, name, creator_id, aliases=aliases)
         self.author_ids = [author_ids[i] if author_ids is not None else creator_id for i in range(0, len(*texts))]
         self.texts = list(*texts)
+        self._templates: Dict[str, TextTemplate] = {}
 
     def __len__(self):
         return len(self.texts)
@@ -276,35 +359,13 @@ class TextCmd(Cmd):
         :raises UserBlockedCommand: If a mentioned user has the command on its ignore list
         """
 
-        cmd_content = self.texts[text_id]
-
-        # general replaces
-        cmd_content = cmd_content.replace(WILDCARD_UMENTION, msg.author.mention)
-        cmd_content = cmd_content.replace(WILDCARD_USER, converters.get_best_username(msg.author))
-
-        if WILDCARD_ALL_ARGS in cmd_content:
-            cmd_content = cmd_content.replace(WILDCARD_ALL_ARGS, _get_all_arg_str(0, cmd_args))
-
-        all_args_positions = arg_list_re.findall(cmd_content)
-
-        # if only one argument in cmd text and no arg given: mention the user
-        if len(all_args_positions) == 1 and len(cmd_args) == 0:
-            cmd_args = [(msg.author.mention, "")]
-
-        # numbered arguments
-        for i in range(0, len(all_args_positions)):
-            if i >= len(cmd_args):
-                break
-
-            # Replace args
-            wildcard = all_args_positions[i][0]
-            arg_num = int(all_args_positions[i][1]) - 1
-            arg = cmd_args[arg_num][1] if cmd_args[arg_num][1] else cmd_args[arg_num][0]  # [1] = args inside ""
-
-            # All following args
-            if all_args_positions[i][2]:
-                arg += " " + _get_all_arg_str(i + 1, cmd_args)
+        text = self.texts[text_id]
+        template = self._templates.get(text)
+        if template is None:
+            template = TextTemplate(text)
+            self._templates[text] = template
 
+        def arg_hook(arg):
             # Ignoring, passive user command blocking
             try:
                 member = converters.convert_member(arg)
@@ -313,9 +374,8 @@ class TextCmd(Cmd):
 
             if member is not None and Config().bot.ignoring.check_passive_usage(member, self.name):
                 raise UserBlockedCommand(member, self.name)
-            cmd_content = cmd_content.replace(wildcard, arg)
 
-        return cmd_content
+        return template.render(msg.author.mention, converters.get_best_username(msg.author), cmd_args, arg_hook)
 
     async def _cmd_raw_single_page(self, ctx, index):
         """
@@ -346,6 +406,7 @@ class TextCmd(Cmd):
         if user.id != self.author_ids[del_id] and user.id != self.creator_id and not permchecks.check_mod_access(user):
             raise NoPermissions
         del self.author_ids[del_id]
+        self._templates.pop(self.texts[del_id], None)
         del self.texts[del_id]
         if not self.texts:
             raise CmdEmpty
@@ -699,6 +760,8 @@ class Plugin(BasePlugin, name="Custom CMDs"):
         }
         self.prefix = Config.get(self)['prefix']
         self.commands = {}
+        self._index: Dict[str, Cmd] = {}
+        """Cmd name and alias -> Cmd"""
 
         self._load()
 
@@ -761,20 +824,29 @@ class Plugin(BasePlugin, name="Custom CMDs"):
             self._update_config_from_2_to_3()
 
         # actually load the commands
-        for k in Storage.get(self).keys():
-            self.commands[str(k)] = Cmd.deserialize(self, k, Storage.get(self)[k])
-            self.bot.ignoring.add_additional_command(k)
+        storage = Storage.get(self)
+        for k in list(storage.keys()):
+            cmd = Cmd.deserialize(self, k, storage[k])
+            if cmd.name != k:
+                storage[cmd.name] = storage.pop(k)
+            self.commands[cmd.name] = cmd
+            self.bot.ignoring.add_additional_command(cmd.name)
+        self._rebuild_index()
+
+    def _save(self, *cmds: Cmd, config: bool = False):
+        """
+        Updates the storage entries of the given changed cmds and saves storage (and config).
 
-    def _save(self):
-        """Saves the commands to the storage and the plugin config"""
-        cmd_dict = {}
-        for k, cmd in self.commands.items():
-            cmd_dict[k] = cmd.serialize()
+        :param cmds: Cmds that were changed
+        :param config: Set to True if the plugin config was changed
+        """
+        storage = Storage.get(self)
+        for cmd in cmds:
+            storage[cmd.name] = cmd.serialize()
 
-        Storage.set(self, cmd_dict)
         Storage.save(self)
-
-        Config.save(self)
+        if config:
+            Config.save(self)
 
     def _update_config_from_2_to_3(self):
         """Updates the configuration from version 2 to version 3 (adding authors for output texts)"""
@@ -826,14 +898,13 @@ class Plugin(BasePlugin, name="Custom CMDs"):
         cmd_name = msg_args[0][1].lower() if msg_args[0][1] else msg_args[0][0].lower()
 
         cmd_args = msg_args[1:]
-        if cmd_name not in self.commands.values():
+        cmd = self._find_cmd(cmd_name)
+        if cmd is None:
             return
         if (self.bot.ignoring.check_command_name(cmd_name, msg.channel)
                 or self.bot.ignoring.check_passive_usage(msg.author, cmd_name)):
             raise commands.DisabledCommand()
 
-        cmd = self._find_cmd(cmd_name)
-        assert cmd
         await cmd.invoke(msg, *cmd_args)
 
     def _find_cmd(self, name) -> Optional[TextCmd]:
@@ -843,16 +914,49 @@ class Plugin(BasePlugin, name="Custom CMDs"):
         :param name: Cmd name or alias
         :return: Command if found, None otherwise
         """
-        for el in self.commands.values():
-            if el == name:
-                return el
-        return None
-
-    def _register_cmd(self, name: str, cmd: Cmd):
-        self.commands[name] = cmd
-        self.bot.ignoring.add_additional_command(name)
+        return self._index.get(name)
+
+    def _rebuild_index(self):
+        """Rebuilds the name and alias index"""
+        self._index = {}
+        for cmd in self.commands.values():
+            self._index_cmd(cmd)
+
+    def _index_cmd(self, cmd: Cmd):
+        """Adds the name and aliases of cmd to the index; names take precedence over aliases of other cmds."""
+        self._index[cmd.name] = cmd
+        for alias in cmd.aliases:
+            self._index.setdefault(alias, cmd)
+
+    def _unindex_cmd(self, cmd: Cmd):
+        """Removes the name and aliases of cmd from the index"""
+        for key in [cmd.name] + cmd.aliases:
+            if self._index.get(key) is cmd:
+                del self._index[key]
+
+    def _register_cmd(self, cmd: Cmd):
+        self.commands[cmd.name] = cmd
+        self._index_cmd(cmd)
+        self.bot.ignoring.add_additional_command(cmd.name)
+        self._save(cmd)
+
+    def _unregister_cmd(self, cmd: Cmd):
+        del self.commands[cmd.name]
+        Storage.get(self).pop(cmd.name, None)
+        self._unindex_cmd(cmd)
+        self._rebuild_index_for_aliases([cmd.name] + cmd.aliases)
         self._save()
 
+    def _rebuild_index_for_aliases(self, aliases: List[str]):
+        """Re-resolves aliases that may have been shadowed by a removed cmd"""
+        for alias in aliases:
+            if alias in self._index:
+                continue
+            for cmd in self.commands.values():
+                if alias in cmd.aliases:
+                    self._index[alias] = cmd
+                    break
+
     def format_aliases(self, aliases: List[str]) -> str:
         """
         Formats the display of aliases in a standard manner. Intended for use in cmd info.
@@ -890,7 +994,7 @@ class Plugin(BasePlugin, name="Custom CMDs"):
             await ctx.send(Lang.lang(self, 'invalid_prefix'))
         else:
             Config.get(self)['prefix'] = new_prefix
-            self._save()
+            self._save(config=True)
             await utils.add_reaction(ctx.message, Lang.CMDSUCCESS)
 
     def _format_cmd_list(self, full="", incl_prefix=False):
@@ -965,12 +1069,12 @@ class Plugin(BasePlugin, name="Custom CMDs"):
     @cmd.command(name="search")
     async def cmd_search(self, ctx, cmd_name, *args):
         cmd_name = cmd_name.lower()
-        if cmd_name not in self.commands.values():
+        cmd = self._find_cmd(cmd_name)
+        if cmd is None:
             await ctx.send(Lang.lang(self, "raw_doesnt_exist"))
             return
 
         found = []
-        cmd = self._find_cmd(cmd_name)
         for i in range(len(cmd)):
             text = cmd.texts[i]
             hit = False
@@ -1013,7 +1117,7 @@ class Plugin(BasePlugin, name="Custom CMDs"):
         cmd = self._find_cmd(cmd_name)
         if isinstance(cmd, TextCmd):
             cmd.add(ctx.author, message)
-            self._save()
+            self._save(cmd)
 
             await utils.add_reaction(ctx.message, Lang.CMDSUCCESS)
             await utils.write_mod_channel(Lang.lang(self, 'cmd_text_added', cmd.name, message))
@@ -1028,7 +1132,7 @@ class Plugin(BasePlugin, name="Custom CMDs"):
         if cmd is None:
             cmd = TextCmd(self, cmd_name, ctx.author.id, [])
             cmd.add(ctx.author, message)
-            self._register_cmd(cmd_name, cmd)
+            self._register_cmd(cmd)
 
             await utils.add_reaction(ctx.message, Lang.CMDSUCCESS)
             await utils.write_mod_channel(Lang.lang(self, 'cmd_added', cmd_name,
@@ -1078,7 +1182,7 @@ class Plugin(BasePlugin, name="Custom CMDs"):
                 return
 
             # Remove command
-            del self.commands[cmd.name]
+            self._unregister_cmd(cmd)
 
         else:
             # remove text
@@ -1089,13 +1193,14 @@ class Plugin(BasePlugin, name="Custom CMDs"):
                 await ctx.send(Lang.lang(self, "text_id_not_found"))
                 return
             except CmdEmpty:
-                del self.commands[cmd.name]
+                self._unregister_cmd(cmd)
             except NoPermissions:
                 await add_reaction(ctx.message, Lang.CMDNOPERMISSIONS)
                 await ctx.send(Lang.lang(self, 'del_perm_missing'))
                 return
+            else:
+                self._save(cmd)
 
-        self._save()
         # await utils.log_to_admin_channel(ctx)
         await utils.add_reaction(ctx.message, Lang.CMDSUCCESS)
 
@@ -1130,7 +1235,7 @@ class Plugin(BasePlugin, name="Custom CMDs"):
         if not found:
             cmd = EmbedCmd(self, name, ctx.author.id)
             cmd.add_field()
-            self._register_cmd(name, cmd)
+            self._register_cmd(cmd)
             await add_reaction(ctx.message, Lang.CMDSUCCESS)
             return
 
@@ -1144,7 +1249,7 @@ class Plugin(BasePlugin, name="Custom CMDs"):
         # existing cmd
         r = found.add_field()
         if r:
-            self._save()
+            self._save(found)
             await add_reaction(ctx.message, Lang.CMDSUCCESS)
         else:
             await add_reaction(ctx.message, Lang.CMDNOCHANGE)
@@ -1182,7 +1287,7 @@ class Plugin(BasePlugin, name="Custom CMDs"):
             return
 
         field.set_title(title, ctx.author)
-        self._save()
+        self._save(self._find_cmd(cmd_name))
         await add_reaction(ctx.message, Lang.CMDSUCCESS)
 
     @cmd_embed.command(name="title")
@@ -1199,7 +1304,7 @@ class Plugin(BasePlugin, name="Custom CMDs"):
             return
 
         field.set_value(value, ctx.author)
-        self._save()
+        self._save(self._find_cmd(cmd_name))
         await add_reaction(ctx.message, Lang.CMDSUCCESS)
 
     @cmd_embed.command(name="value")
@@ -1228,7 +1333,7 @@ class Plugin(BasePlugin, name="Custom CMDs"):
             return
 
         cmd.header = msg
-        self._save()
+        self._save(cmd)
         await add_reaction(ctx.message, Lang.CMDSUCCESS)
 
     @cmd_embed.command(name="header")
@@ -1266,7 +1371,7 @@ class Plugin(BasePlugin, name="Custom CMDs"):
 
         cmd.fields[index1 - 1] = field2
         cmd.fields[index2 - 1] = field1
-        self._save()
+        self._save(cmd)
         await add_reaction(ctx.message, Lang.CMDSUCCESS)
 
     @cmd_embed.command(name="swap")
@@ -1324,7 +1429,8 @@ class Plugin(BasePlugin, name="Custom CMDs"):
             return
 
         existing.add_alias(alias)
-        self._save()
+        self._index.setdefault(alias, existing)
+        self._save(existing)
         await utils.add_reaction(ctx.message, Lang.CMDSUCCESS)
 
     @cmd.command(name="aliasclear")
@@ -1334,8 +1440,12 @@ class Plugin(BasePlugin, name="Custom CMDs"):
             await utils.add_reaction(ctx.message, Lang.CMDERROR)
             return
 
+        aliases = c.aliases
+        self._unindex_cmd(c)
         c.clear_aliases()
-        self._save()
+        self._index_cmd(c)
+        self._rebuild_index_for_aliases(aliases)
+        self._save(c)
         await utils.add_reaction(ctx.message, Lang.CMDSUCCESS)
 
     @cmd.command(name="random", aliases=["rnd", "rng"])
@@ -329,12 +329,13 @@ class Plugin(BasePlugin, name="Testing and debug things"):
             msgs.append("**#{}:**".format(i))
             msgs.append("  **td:** {}".format(job._timedict))
             msgs.append("  **coro:** {}".format(job._coro))
-            msgs.append("  **lock is locked:** {}".format(job._lock.locked()))
             msgs.append("  **is scheduled:** {}".format(job._is_scheduled))
             msgs.append("  **cancelled:** {}".format(job._cancelled))
             msgs.append("  **last exec:** {}".format(job._last_exec))
-            msgs.append("  **task:** {}".format(job._task))
-            msgs.append("  **task done:** {}".format(job._task.done()))
+            msgs.append("  **next exec:** {}".format(job._cached_next_exec))
+        msgs.append("")
+        msgs.append("**heap size:** {}".format(len(self.bot.timers._heap)))
+        msgs.append("**scheduler task:** {}".format(self.bot.timers._task))
 
         for msg in stringutils.paginate(msgs):
             await ctx.send(msg)
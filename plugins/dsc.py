@@ -59,9 +59,6 @@ class Plugin(BasePlugin, name="Discord Song Contest"):
         if Storage.get(self)["state"] == DscState.VOTING:
             self.register_presence()
 
-        self._fill_rule_link()
-        Storage().save(self)
-
     def default_config(self, container=None):
         return {
             'rule_cell': "Aktuell!E2",
@@ -100,19 +97,20 @@ class Plugin(BasePlugin, name="Discord Song Contest"):
     def _get_doc_link(self):
         return "https://docs.google.com/spreadsheets/d/{}".format(Config.get(self)['contestdoc_id'])
 
-    def _get_rule_link(self):
+    async def _get_rule_link(self):
         try:
             c = self.get_api_client()
-            values = c.get(Config.get(self)['rule_cell'])
+            values = await c.get_async(Config.get(self)['rule_cell'])
             return values[0][0]
         except IndexError:
             self.log.error("Can't read rules link from Contestdoc sheet. "
                            "Is Google Sheets not reachable or do you set the wrong cell?")
             return ""
 
-    def _fill_rule_link(self):
+    async def _fill_rule_link(self):
         if not Storage.get(self)['rule_link']:
-            Storage.get(self)['rule_link'] = self._get_rule_link()
+            Storage.get(self)['rule_link'] = await self._get_rule_link()
+            Storage().save(self)
 
     def register_presence(self):
         """Registers the presence message"""
@@ -159,7 +157,7 @@ class Plugin(BasePlugin, name="Discord Song Contest"):
             raise ConfigError(self, 'config_error_reset')
 
         if rules:
-            self._fill_rule_link()
+            await self._fill_rule_link()
             embed.add_field(name=Lang.lang(self, 'title_rules'), value=f"<{Storage.get(self)['rule_link']}>")
 
         if songmasters:
@@ -190,7 +188,7 @@ class Plugin(BasePlugin, name="Discord Song Contest"):
 
     @cmd_dsc.command(name="rules", aliases=["regeln"])
     async def cmd_dsc_rules(self, ctx):
-        self._fill_rule_link()
+        await self._fill_rule_link()
         await ctx.send(f"<{Storage.get(self)['rule_link']}>")
 
     @cmd_dsc.command(name="status")
@@ -206,7 +204,7 @@ class Plugin(BasePlugin, name="Discord Song Contest"):
     async def cmd_dsc_winners(self, ctx):
         async with ctx.typing():
             c = self.get_api_client()
-            winners = c.get(Config.get(self)['winners_range'])
+            winners = await c.get_async(Config.get(self)['winners_range'])
 
         regex = re.compile(r"\d+")
         w_table = [[Lang.lang(self, 'winner_msg_no'),
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from datetime import datetime, timedelta
 from typing import Union, List, Dict, Optional
@@ -277,8 +278,34 @@ class Plugin(BasePlugin, name="NFL Fantasy"):
         """Callback method for the timer to auto-send current scores to fantasy channel"""
         channel = self.bot.get_channel(Config.get(self)['channel_id'])
         if channel is not None:
+            await self._prefetch_boxscores(previous_week=job.data)
             await self._write_scores(channel=channel, show_errors=False, previous_week=job.data)
 
+    async def _prefetch_boxscores(self, previous_week=False):
+        """
+        Fetches the current boxscores of all ESPN leagues concurrently, so the score embeds are built from the
+        leagues' boxscore snapshots. Other platforms don't keep snapshots and are skipped. Errors are left to the
+        score output.
+        """
+        leagues = [league for league in self.leagues.values() if league.platform == Platform.ESPN]
+        results = await asyncio.gather(*[league.get_boxscores(self._league_week(league, 0, previous_week))
+                                         for league in leagues], return_exceptions=True)
+        for league, result in zip(leagues, results):
+            if isinstance(result, Exception):
+                log.debug("Prefetching boxscores of %s failed: %s", league.name, result)
+
+    @staticmethod
+    def _league_week(league: FantasyLeague, week: int, previous_week: bool) -> int:
+        """
+        :return: The week to show for `league`; the current week if `week` is 0
+        """
+        lweek = week
+        if week == 0:
+            lweek = league.current_week
+        if previous_week:
+            lweek -= 1
+        return max(lweek, 1)
+
     async def _write_scores(self, *, channel: TextChannel, week: int = 0, team_name: str = None,
                             show_errors=True, previous_week=False, league_name: str = None):
         """Send the current scores of given week to given channel"""
@@ -329,12 +356,7 @@ class Plugin(BasePlugin, name="NFL Fantasy"):
                  None if no output possible based on input data,
                  or a Tuple(team_name, platform, boxscore_url) if platform doesn't support API boxscores.
         """
-        lweek = week
-        if week == 0:
-            lweek = league.current_week
-        if previous_week:
-            lweek -= 1
-        lweek = max(lweek, 1)
+        lweek = self._league_week(league, week, previous_week)
 
         try:
             # full league score
@@ -584,12 +606,14 @@ class Plugin(BasePlugin, name="NFL Fantasy"):
     async def cmd_fantasy_reload(self, ctx):
         has_errors = False
         async with ctx.typing():
-            for league in self.leagues.values():
-                try:
-                    await league.reload()
-                except (ValueError, IndexError):
+            leagues = list(self.leagues.values())
+            results = await asyncio.gather(*[league.reload() for league in leagues], return_exceptions=True)
+            for league, result in zip(leagues, results):
+                if isinstance(result, (ValueError, IndexError)):
                     has_errors = True
-                    ctx.send(Lang.lang(self, "api_error", league.name))
+                    await ctx.send(Lang.lang(self, "api_error", league.name))
+                elif isinstance(result, Exception):
+                    raise result
         if has_errors:
             await add_reaction(ctx.message, Lang.CMDERROR)
         else:
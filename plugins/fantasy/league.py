@@ -1,8 +1,10 @@
+import asyncio
 import logging
 import operator
+import time
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
 from nextcord import User
 from espn_api.football import League
@@ -207,20 +209,47 @@ async def deserialize_league(plugin, d: dict) -> FantasyLeague:
 
 
 class EspnLeague(FantasyLeague):
-    """Fantasy League on the ESPN Platform"""
+    """
+    Fantasy League on the ESPN Platform. espn_api is blocking, so its calls are run in the default executor.
+    Boxscores and standings are converted to immutable snapshots in the worker thread and cached; boxscores
+    for `SNAPSHOT_TTL` seconds, standings until the next reload.
+    """
+
+    SNAPSHOT_TTL = 60
+    """Max age of a cached boxscore snapshot in seconds"""
 
     def __init__(self):
         super().__init__()
         self._espn = None  # type: Optional[League]
+        self._lock = asyncio.Lock()
+        self._boxscores = {}  # type: Dict[int, Tuple[float, Tuple[Match, ...]]]
+        self._standings = None  # type: Optional[Tuple[Tuple[str, TeamStanding], ...]]
+
+    async def _run(self, func, *args):
+        """
+        Runs a blocking espn_api call in the default executor. Calls of the same league are serialized, as
+        the League object is not thread-safe.
+
+        :param func: function to call
+        :param args: arguments for `func`
+        :return: return value of `func`
+        """
+        async with self._lock:
+            return await asyncio.get_running_loop().run_in_executor(None, func, *args)
 
     async def load_league_data(self):
-        self._espn = League(year=self.plugin.year, league_id=self.league_id,
-                            espn_s2=Config.get(self.plugin)["espn_credentials"]["espn_s2"],
-                            swid=Config.get(self.plugin)["espn_credentials"]["swid"])
+        config = Config.get(self.plugin)["espn_credentials"]
+        self._espn = await asyncio.get_running_loop().run_in_executor(
+            None, lambda: League(year=self.plugin.year, league_id=self.league_id,
+                                 espn_s2=config["espn_s2"], swid=config["swid"]))
+        self._boxscores = {}
+        self._standings = None
         log.info("League %s, ID %d on platform ESPN connected", self.name, self.league_id)
 
     async def reload(self):
-        self._espn.refresh()
+        await self._run(self._espn.refresh)
+        self._boxscores = {}
+        self._standings = None
 
     @property
     def platform(self) -> Platform:
@@ -272,56 +301,83 @@ class EspnLeague(FantasyLeague):
             teams.append(Team(t.team_name, t.team_abbrev, t.team_id, 0))
         return teams
 
-    async def get_boxscores(self, week, match_id=-1) -> List[Match]:
-        boxscores = self._espn.box_scores(week)
+    def _fetch_boxscores(self, week: int) -> Tuple[Match, ...]:
+        """
+        Fetches the boxscores of a week from ESPN. Blocking, runs in the executor.
+
+        :param week: The week to get the boxscores from
+        :return: Boxscore snapshot
+        """
         matches = []
-        for i in range(len(boxscores)):
-            if match_id > -1 and match_id != i:
-                continue
-            score = boxscores[i]
+        for score in self._espn.box_scores(week):
             home_team, away_team = None, None
-            home_lineup, away_lineup = [], []
 
             if score.home_team is not None and score.home_team != 0:
                 home_team = Team(score.home_team.team_name, score.home_team.team_abbrev, score.home_team.team_id, 0)
             if score.away_team is not None and score.away_team != 0:
                 away_team = Team(score.away_team.team_name, score.away_team.team_abbrev, score.away_team.team_id, 0)
 
-            for hp in score.home_lineup:
-                home_lineup.append(Player(_set_flex_pos_name(hp.slot_position), hp.name, hp.proTeam,
-                                          hp.projected_points, hp.points))
-            for al in score.away_lineup:
-                away_lineup.append(Player(_set_flex_pos_name(al.slot_position), al.name, al.proTeam,
-                                          al.projected_points, al.points))
+            home_lineup = tuple(Player(_set_flex_pos_name(hp.slot_position), hp.name, hp.proTeam,
+                                       hp.projected_points, hp.points) for hp in score.home_lineup)
+            away_lineup = tuple(Player(_set_flex_pos_name(al.slot_position), al.name, al.proTeam,
+                                       al.projected_points, al.points) for al in score.away_lineup)
 
             matches.append(Match(home_team, score.home_score, home_lineup,
                                  away_team, score.away_score, away_lineup))
-        return matches
+        return tuple(matches)
 
-    async def get_overall_standings(self) -> List[TeamStanding]:
+    def _fetch_standings(self) -> Tuple[Tuple[str, TeamStanding], ...]:
+        """
+        Builds the standings from the loaded league data. Runs in the executor.
+
+        :return: Standings snapshot as `(division name, TeamStanding)` in standings order
+        """
         standings = []
         for team in self._espn.standings():
             wins = int(team.wins)
             losses = int(team.losses)
             record = wins / (wins + losses)
-            standing = TeamStanding(team.team_name, wins, losses, record, float(team.points_for))
-            standings.append(standing)
-        return standings
+            standings.append((team.division_name,
+                              TeamStanding(team.team_name, wins, losses, record, float(team.points_for))))
+        return tuple(standings)
+
+    async def get_boxscores(self, week, match_id=-1) -> List[Match]:
+        snapshot = self._boxscores.get(week)
+        if snapshot is None or time.monotonic() - snapshot[0] > self.SNAPSHOT_TTL:
+            async with self._lock:
+                # a concurrent call might have fetched the snapshot in the meantime
+                snapshot = self._boxscores.get(week)
+                if snapshot is None or time.monotonic() - snapshot[0] > self.SNAPSHOT_TTL:
+                    matches = await asyncio.get_running_loop().run_in_executor(None, self._fetch_boxscores, week)
+                    snapshot = (time.monotonic(), matches)
+                    self._boxscores[week] = snapshot
+
+        matches = snapshot[1]
+        if match_id > -1:
+            return list(matches[match_id:match_id + 1])
+        return list(matches)
+
+    async def _get_standings(self) -> Tuple[Tuple[str, TeamStanding], ...]:
+        if self._standings is None:
+            async with self._lock:
+                # a concurrent call might have fetched the standings in the meantime
+                if self._standings is None:
+                    self._standings = await asyncio.get_running_loop().run_in_executor(None, self._fetch_standings)
+        return self._standings
+
+    async def get_overall_standings(self) -> List[TeamStanding]:
+        return [standing for _, standing in await self._get_standings()]
 
     async def get_divisional_standings(self) -> Dict[str, List[TeamStanding]]:
         divisions = {}
-        for team in self._espn.standings():
-            if team.division_name not in divisions:
-                divisions[team.division_name] = []
-            wins = int(team.wins)
-            losses = int(team.losses)
-            record = wins / (wins + losses)
-            standing = TeamStanding(team.team_name, wins, losses, record, float(team.points_for))
-            divisions[team.division_name].append(standing)
+        for division, standing in await self._get_standings():
+            if division not in divisions:
+                divisions[division] = []
+            divisions[division].append(standing)
         return divisions
 
     async def get_most_recent_activity(self):
-        activities = self._espn.recent_activity()
+        activities = await self._run(self._espn.recent_activity)
         act_date = from_epoch_ms(activities[0].date)
         act_team = activities[0].actions[0][0].team_name
         act_type = activities[0].actions[0][1]
@@ -1,13 +1,15 @@
+import time
 from urllib.error import HTTPError
-from typing import List, Optional, Any, Dict
+from typing import List, Optional, Any, Dict, Tuple
 
-from botutils.restclient import Client
+from botutils.restclient import Client, ResponseCache
 from botutils.utils import add_reaction
 from base.data import Lang
 
 from plugins.lastfm.lfm_base import Song
 
 BASEURL = "https://ws.audioscrobbler.com/2.0/"
+USERINFO_TTL = 600
 
 
 class UnexpectedResponse(Exception):
@@ -29,14 +31,17 @@ class Api:
     """
     def __init__(self, plugin):
         self.plugin = plugin
-        self.client = Client(BASEURL)
+        self.client = Client(BASEURL, cache=ResponseCache(ttl=0))
+        self.nowplaying: Dict[str, Tuple[float, Optional[Song]]] = {}
+        """lfmuser -> (monotonic time of the last check, nowplaying song or None)"""
 
-    async def request(self, params: Dict[str, Any], method: str = "GET") -> Any:
+    async def request(self, params: Dict[str, Any], method: str = "GET", cache_ttl: float = 0) -> Any:
         """
         Does a request to last.fm API and parses the reponse to a dict.
 
         :param params: URL parameters
         :param method: HTTP method
+        :param cache_ttl: Seconds the response is cached, 0 to not cache it
         :return: Response dict
         """
         params["format"] = "json"
@@ -46,7 +51,7 @@ class Api:
             "User-Agent": "Geckarbot/{}".format(self.plugin.bot.VERSION)
         }
         before = self.plugin.perf_timenow()
-        r = await self.client.request("", params=params, headers=headers, method=method)
+        r = await self.client.request("", params=params, headers=headers, method=method, cache_ttl=cache_ttl)
         after = self.plugin.perf_timenow()
         self.plugin.perf_add_lastfm_time(after - before)
         return r
@@ -76,7 +81,7 @@ class Api:
         return r
 
     async def get_recent_tracks(self, lfmuser: str, page: int = 1, pagelen: int = 10,
-                                extended: bool = False, first: bool = True) -> List[Song]:
+                                extended: bool = False, first: bool = True, cache_ttl: float = 0) -> List[Song]:
         """
         Gets a list of lfmuser's recent scrobbles
 
@@ -85,6 +90,7 @@ class Api:
         :param pagelen: page length
         :param extended: whether to get extended song info (includes e.g. loved)
         :param first: If False, removes a leading "nowplaying" song if existant.
+        :param cache_ttl: Seconds the page is cached, 0 to always fetch it
         :return: list of songs
         """
         extended = 1 if extended else 0
@@ -95,15 +101,27 @@ class Api:
             "limit": pagelen,
             "extended": extended,
         }
-        return self.build_songs(await self.request(params), first=first)
+        songs = self.build_songs(await self.request(params, cache_ttl=cache_ttl), first=first)
+        if page == 1 and first:
+            self.nowplaying[lfmuser] = time.monotonic(), songs[0] if songs and songs[0].nowplaying else None
+        return songs
 
-    async def get_current_scrobble(self, lfmuser: str) -> Optional[Song]:
+    async def get_current_scrobble(self, lfmuser: str, max_age: Optional[float] = None) -> Optional[Song]:
         """
-        Gets the song lfmuser is currently scrobbling.
+        Gets the song lfmuser is currently scrobbling. Reuses the result of a recent request for the first
+        page of lfmuser's scrobbles if it is not older than `max_age` seconds.
 
         :param lfmuser: Last.fm username
+        :param max_age: Max age of a reused result; defaults to the `nowplaying_ttl` config value, 0 to always fetch
         :return: The song lfmuser is currently scrobbling; None if there is none.
         """
+        if max_age is None:
+            max_age = self.plugin.get_config("nowplaying_ttl")
+        if lfmuser in self.nowplaying:
+            checked, song = self.nowplaying[lfmuser]
+            if time.monotonic() - checked < max_age:
+                return song
+
         song = (await self.get_recent_tracks(lfmuser, page=1, pagelen=1))[0]
         if song.nowplaying:
             return song
@@ -121,7 +139,7 @@ class Api:
             "user": lfmuser
         }
         try:
-            userinfo = await self.request(params)
+            userinfo = await self.request(params, cache_ttl=USERINFO_TTL)
         except HTTPError:
             return None
 
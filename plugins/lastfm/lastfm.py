@@ -1,5 +1,6 @@
+import asyncio
 import logging
-from typing import Union, Optional
+from typing import Union, Optional, Dict, AsyncIterator
 import time
 import random
 import re
@@ -46,6 +47,8 @@ class NotRegistered(Exception):
 
 BASE_CONFIG = {
     "limit": [int, 5],
+    "expand_prefetch": [int, 2],
+    "expand_page_ttl": [int, 60],
     "min_artist": [float, 0.5],
     "min_album": [float, 0.4],
     "min_title": [float, 0.5],
@@ -58,6 +61,8 @@ BASE_CONFIG = {
     "quote_restrict_del": [bool, True],
     "presence": [bool, True],
     "presence_tick": [int, 60],
+    "presence_probe_batch": [int, 5],
+    "nowplaying_ttl": [int, 30],
     "presence_include_listener": [bool, True],
     "presence_artist_only": [bool, False],
     "presence_title_only": [bool, True],
@@ -925,6 +930,44 @@ class Plugin(BasePlugin, name="LastFM"):
         """
         return current_matches / current_index > (top_matches - 2) / top_index
 
+    def prefetch_pages(self, lfmuser: str, page_len: int, page_index: int, prefetched: Dict[int, asyncio.Task]):
+        """
+        Makes sure that the page `page_index` and up to `expand_prefetch` following pages (within `limit`)
+        are being fetched.
+
+        :param lfmuser: Last.fm user name
+        :param page_len: Last.fm request page length
+        :param page_index: Page that is needed next
+        :param prefetched: page index -> fetch task; is updated with the new tasks
+        """
+        last = min(page_index + max(self.get_config("expand_prefetch"), 0), self.get_config("limit"))
+        for i in range(page_index, last + 1):
+            if i not in prefetched:
+                prefetched[i] = asyncio.create_task(
+                    self.api.get_recent_tracks(lfmuser, page=i, pagelen=page_len, first=False,
+                                               cache_ttl=self.get_config("expand_page_ttl")))
+
+    async def recent_pages(self, lfmuser: str, page_len: int, first_page: list) -> AsyncIterator[list]:
+        """
+        Iterates over the recent tracks pages of a user up to `limit` while the following pages are prefetched
+        (see `prefetch_pages()`). Pending prefetches are cancelled when the iterator is closed.
+
+        :param lfmuser: Last.fm user name
+        :param page_len: Last.fm request page length
+        :param first_page: First page of songs, which was fetched already
+        :return: Async iterator over the pages
+        """
+        yield first_page
+        prefetched: Dict[int, asyncio.Task] = {}
+        try:
+            for page_index in range(2, self.get_config("limit") + 1):
+                self.logger.debug("Expand: Fetching page %i", page_index)
+                self.prefetch_pages(lfmuser, page_len, page_index, prefetched)
+                yield await prefetched.pop(page_index)
+        finally:
+            for task in prefetched.values():
+                task.cancel()
+
     async def expand(self, lfmuser, page_len, so_far, layer, example):
         """
         Expands a streak on the first page to the longest it can find across multiple pages.
@@ -940,7 +983,7 @@ class Plugin(BasePlugin, name="LastFM"):
             criterion and `repr` the most recent representative song of criterion.
         """
         self.logger.debug("Expanding")
-        page_index = 1
+        page_index = 0
 
         prototype = {
             "top_index": 1,
@@ -954,45 +997,41 @@ class Plugin(BasePlugin, name="LastFM"):
             Layer.TITLE: prototype.copy(),
         }
         current_index = 0
-        current_page = so_far
-        while True:
-            improved = False
-            for song in current_page:
-                current_index += 1
-                for current_criterion in Layer:
-                    if self.interest_match(song, current_criterion, example):
-                        c = counters[current_criterion]
-
-                        # Set repr
-                        if c["repr"] is None:
-                            c["repr"] = song
-
-                        # Calc matches
-                        c["current_matches"] += 1
-                        logging.debug("Comparison: %f > %f on song %s",
-                                      c["current_matches"] / current_index,
-                                      (c["top_matches"] - 2) / c["top_index"],
-                                      str(current_index))
-                        # This match improves our overall situation
-                        if self.expand_formula(c["top_index"], c["top_matches"],
-                                               current_index, c["current_matches"]):
-                            improved = True
-                            c["top_index"] = current_index
-                            c["top_matches"] = c["current_matches"]
-
-            self.logger.debug("Expand: Iteration done; counters: %s", pprint.pformat(counters))
-
-            if not improved and page_index > 1:
-                self.logger.debug("Expand: Done")
-                break
-
-            # Done, prepare next loop
-            page_index += 1
-            if page_index > self.get_config("limit"):
-                break
-            self.logger.debug("Expand: Fetching page %i", page_index)
-            current_page = await self.api.get_recent_tracks(lfmuser, page=page_index, pagelen=page_len, first=False)
-
+        pages = self.recent_pages(lfmuser, page_len, so_far)
+        try:
+            async for current_page in pages:
+                page_index += 1
+                improved = False
+                for song in current_page:
+                    current_index += 1
+                    for current_criterion in Layer:
+                        if self.interest_match(song, current_criterion, example):
+                            c = counters[current_criterion]
+
+                            # Set repr
+                            if c["repr"] is None:
+                                c["repr"] = song
+
+                            # Calc matches
+                            c["current_matches"] += 1
+                            logging.debug("Comparison: %f > %f on song %s",
+                                          c["current_matches"] / current_index,
+                                          (c["top_matches"] - 2) / c["top_index"],
+                                          str(current_index))
+                            # This match improves our overall situation
+                            if self.expand_formula(c["top_index"], c["top_matches"],
+                                                   current_index, c["current_matches"]):
+                                improved = True
+                                c["top_index"] = current_index
+                                c["top_matches"] = c["current_matches"]
+
+                self.logger.debug("Expand: Iteration done; counters: %s", pprint.pformat(counters))
+
+                if not improved and page_index > 1:
+                    self.logger.debug("Expand: Done")
+                    break
+        finally:
+            await pages.aclose()
         self.logger.debug("counters: %s", str(counters))
 
         if not self.get_config("mi_enable_downgrade"):
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import random
 from typing import Optional
@@ -149,22 +150,42 @@ class LfmPresenceMessage(PresenceMessage):
     async def get_random_lastfm_listener(self):
         """
         :return: Discord user, Lastfm user, song (can be None if nobody is listening)
+        :raises Exception: Error of the first user of a probe batch in which every user failed; users with an
+            unexpected response are skipped
         """
         users = Storage.get(self.plugin)["users"]
-        candidates = list(users.keys())
-        random.shuffle(candidates)
-
-        for userid in candidates:
-            lfmuser = users[userid]
+        candidates = []
+        for userid, lfmuser in users.items():
             if lfmuser.get("presence_optout", not self.plugin.get_config("presence_optout")):
                 self.logger.debug("Skipping user %s", lfmuser["lfmuser"])
                 continue
-            lfmuser = lfmuser["lfmuser"]
+            candidates.append((userid, lfmuser["lfmuser"]))
+        random.shuffle(candidates)
 
-            song = await self.plugin.api.get_current_scrobble(lfmuser)
-            if song:
-                self.logger.debug("Got random listener %s: %s", lfmuser, song)
-                return get_best_user(userid), lfmuser, song
+        # Probe in concurrent batches, first hit in (random) candidate order wins
+        batch_size = max(self.plugin.get_config("presence_probe_batch"), 1)
+        for i in range(0, len(candidates), batch_size):
+            batch = candidates[i:i + batch_size]
+            results = await asyncio.gather(*[self.plugin.api.get_current_scrobble(lfmuser) for _, lfmuser in batch],
+                                           return_exceptions=True)
+            errors = []
+            succeeded = False
+            for (userid, lfmuser), song in zip(batch, results):
+                if isinstance(song, UnexpectedResponse):
+                    self.logger.debug("Unexpected response while probing %s", lfmuser)
+                    continue
+                if isinstance(song, Exception):
+                    self.logger.debug("Error while probing %s: %s", lfmuser, song)
+                    errors.append(song)
+                    continue
+                succeeded = True
+                if song:
+                    self.logger.debug("Got random listener %s: %s", lfmuser, song)
+                    return get_best_user(userid), lfmuser, song
+
+            # every user that did not respond unexpectedly failed, e.g. last.fm is not reachable
+            if errors and not succeeded:
+                raise errors[0]
         self.logger.debug("No random listener found")
         return None, None, None
 
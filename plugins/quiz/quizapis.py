@@ -37,6 +37,7 @@ class OpenTDBQuizAPI(BaseQuizAPI):
     TOKEN_ROUTE = "api_token.php"
     API_ROUTE = "api.php"
     API_COUNT_ROUTE = "api_count.php"
+    CACHE = restclient.ResponseCache(ttl=0, ttls={API_COUNT_ROUTE: 3600})
     CAT_MAP = {
         DefaultCategory.ALL: -1,
         DefaultCategory.MISC: 9,
@@ -169,7 +170,7 @@ class OpenTDBQuizAPI(BaseQuizAPI):
             cats = [el for _, el in cls.CAT_MAP.items() if el != -1]
         else:
             cats = [cat]
-        client = restclient.Client(cls.BASE_URL)
+        client = restclient.Client(cls.BASE_URL, cache=cls.CACHE)
 
         tasks = []
         result = []
@@ -0,0 +1,174 @@
+import asyncio
+import logging
+import re
+from typing import Optional, List, Dict, Tuple, Callable, Awaitable
+from urllib.parse import urlparse, urljoin
+
+from bs4 import BeautifulSoup
+
+from botutils import restclient
+
+BASE_URL = "https://www.transfermarkt.de"
+page_re = re.compile(r"/page/(\d+)")
+whitespace_re = re.compile(r'(?:(?!\n)\s){2,}')
+
+
+def clean_text(text: str) -> List[str]:
+    """
+    Collapses whitespace runs and splits a forum text into lines.
+
+    :param text: raw text of a post
+    :return: list of lines
+    """
+    return whitespace_re.sub(' ', text.replace('\u2013', '-')).split("\n")
+
+
+class ForumPage:
+    """
+    Parsed page of a forum thread
+
+    :param number: page number
+    :param init: lines of the initial post, only set on the first page
+    :param posts: list of `(post id, post dict)` in page order
+    :param last_page: number of the last page of the thread as found in the pagination, None if not found
+    :param page_href: link to any numbered page of the thread, used as template for other page links
+    :param next_href: link to the next page, None if there is none
+    """
+
+    def __init__(self, number: int, init: Optional[List[str]], posts: List[Tuple[str, dict]],
+                 last_page: Optional[int], page_href: Optional[str], next_href: Optional[str]):
+        self.number = number
+        self.init = init
+        self.posts = posts
+        self.last_page = last_page
+        self.page_href = page_href
+        self.next_href = next_href
+
+
+def parse_page(html: str, number: int) -> ForumPage:
+    """
+    Parses a forum thread page. Does not touch the event loop, so this can be run in a worker thread.
+
+    :param html: page html
+    :param number: page number
+    :return: parsed page
+    """
+    soup = BeautifulSoup(html, "html.parser")
+
+    init = None
+    init_post = soup.find(id="initialPost")
+    if init_post is not None:
+        init = clean_text(init_post.find('div', 'forum-post-data').text)
+
+    posts = []
+    post_list = soup.find(id="postList")
+    for p in post_list.find_all('div', 'box') if post_list is not None else []:
+        p_time = p.find('div', 'post-header-datum')
+        p_user = p.find('a', 'forum-user')
+        p_data = p.find('div', 'forum-post-data')
+        p_id = p.find('span', 'link-zum-post')
+        if p_time and p_user and p_data:
+            posts.append((p_id.text, {
+                'user': p_user.text,
+                'time': p_time.text.strip(),
+                'link': p_id.a['href'],
+                'content': clean_text(p_data.text)
+            }))
+
+    # Pagination
+    last_page = None
+    page_href = None
+    for link in soup.select("li.tm-pagination__list-item a[href]"):
+        m = page_re.search(link['href'])
+        if m is None:
+            continue
+        page_href = link['href']
+        last_page = max(last_page or 0, int(m.group(1)))
+    next_href = None
+    next_page = soup.find_all('li', 'tm-pagination__list-item--icon-next-page')
+    if next_page and next_page[0].a:
+        next_href = next_page[0].a['href']
+
+    return ForumPage(number, init, posts, last_page, page_href, next_href)
+
+
+class ForumScraper:
+    """
+    Scrapes all posts of a transfermarkt forum thread. The page count is taken from the pagination of the
+    first fetched page, the remaining pages are fetched concurrently and parsed in worker threads. Pages beyond
+    that are found by following the next page links.
+
+    :param url: thread url
+    :param progress: coroutine function that is awaited with the current post count after each page
+    """
+    CONCURRENCY = 4
+    """Max number of pages that are fetched at the same time"""
+
+    def __init__(self, url: str, progress: Optional[Callable[[int], Awaitable]] = None):
+        self.url = url
+        self.progress = progress
+        self.logger = logging.getLogger(__name__)
+
+        self.client = restclient.Client(BASE_URL)
+        self._semaphore = asyncio.Semaphore(self.CONCURRENCY)
+        self._post_count = 0
+
+    def page_url(self, template: str, number: int) -> str:
+        """
+        :param template: link to any numbered page of the thread
+        :param number: page number
+        :return: url of the page with the given number
+        """
+        return urljoin(self.url, page_re.sub(f"/page/{number}", template, count=1))
+
+    async def fetch(self, url: str, number: int) -> ForumPage:
+        """
+        Fetches and parses a single page.
+
+        :param url: page url
+        :param number: page number
+        :return: parsed page
+        """
+        async with self._semaphore:
+            self.logger.debug("Fetching forum page %d: %s", number, url)
+            html = await self.client.request(urlparse(url).path, parse_json=False)
+        page = await asyncio.get_running_loop().run_in_executor(None, parse_page, html, number)
+        self._post_count += len(page.posts)
+        if self.progress is not None:
+            await self.progress(self._post_count)
+        return page
+
+    async def scrape(self, start_page: int = 1,
+                     page_href: Optional[str] = None) -> Tuple[Optional[List[str]], Dict[str, dict], int, str]:
+        """
+        Scrapes the thread, beginning with `start_page`.
+
+        :param start_page: first page to fetch; pages before this one are skipped
+        :param page_href: page link template as returned by a previous scrape; required if `start_page` is not 1
+        :return: lines of the initial post (None if `start_page` is not the first page), posts by post id in thread
+            order, number of the last page, page link template
+        """
+        url = self.url
+        if start_page > 1 and page_href:
+            url = self.page_url(page_href, start_page)
+        else:
+            start_page = 1
+        first = await self.fetch(url, start_page)
+        pages = [first]
+
+        if first.page_href is not None and first.last_page is not None:
+            # Page count is known, fetch the rest concurrently
+            numbers = range(start_page + 1, first.last_page + 1)
+            pages += await asyncio.gather(*[self.fetch(self.page_url(first.page_href, n), n) for n in numbers])
+
+        # Follow the next page links, e.g. if there is no pagination, the pagination only shows some of the pages or
+        # the thread grew during the scrape
+        page = pages[-1]
+        while page.next_href:
+            page = await self.fetch(urljoin(self.url, page.next_href), page.number + 1)
+            pages.append(page)
+
+        posts = {}
+        for page in pages:
+            posts.update(page.posts)
+        return first.init, posts, pages[-1].number, first.page_href or page_href
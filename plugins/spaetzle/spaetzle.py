@@ -2,19 +2,19 @@ import logging
 import re
 from datetime import datetime
 from typing import Literal, List, Optional, Dict, Tuple
-from urllib.parse import urlparse, urljoin
+from urllib.parse import urlparse
 
-from bs4 import BeautifulSoup
 from nextcord import Embed, Interaction
 from nextcord.ext import commands
 from nextcord.ext.commands import Context
 
 from Geckarbot import BasePlugin
 from base.data import Config, Lang, Storage
-from botutils import sheetsclient, restclient
+from botutils import sheetsclient
 from botutils.sheetsclient import CellRange
 from botutils.uiutils import SingleConfirmView, SingleItemView, CoroButton
 from botutils.utils import helpstring_helper, add_reaction, paginate_embeds
+from plugins.spaetzle.scraper import ForumScraper
 from plugins.spaetzle.utils import SpaetzleUtils
 from services.helpsys import DefaultCategories
 from services.liveticker import LeagueRegistrationOLDB
@@ -113,17 +113,18 @@ class Plugin(BasePlugin, SpaetzleUtils, name="Spaetzle-Tippspiel"):
             team_cells = []
             match_cells = []
             _matchday = interaction.message.embeds[0].title.split(" ")[-1]
-            for row in interaction.message.embeds[0].description.split("\n"):
-                dt, teams = row.split(" | ")
+            rows = [row.split(" | ") for row in interaction.message.embeds[0].description.split("\n")]
+            teamnames = Config().bot.liveticker.teamname_converter.get_many(
+                (team for _, teams in rows for team in teams.split(" - ")), fuzzy=True)
+            for dt, teams in rows:
                 kickoff_time = datetime.strptime(dt, "%a. %d.%m.%Y, %H:%M Uhr")
                 home, away = teams.split(" - ")
-                match = "{} - {}".format(Config().bot.liveticker.teamname_converter.get(home).abbr,
-                                         Config().bot.liveticker.teamname_converter.get(away).abbr)
+                match = "{} - {}".format(teamnames[home].abbr, teamnames[away].abbr)
                 time_cells.extend([kickoff_time.strftime("%d.%m.%Y %H:%M"), None])
                 team_cells.extend([home, away])
                 match_cells.extend([match, None])
-            self.get_api_client().update(f"'ST {_matchday}'!{Config().get(self)['ranges']['matches']}",
-                                         [time_cells, team_cells, match_cells], raw=False)
+            await self.get_api_client().update_async(f"'ST {_matchday}'!{Config().get(self)['ranges']['matches']}",
+                                                     [time_cells, team_cells, match_cells], raw=False)
 
         matchday = Storage().get(self)['matchday']
         match_list = await LeagueRegistrationOLDB.get_matches_by_matchday(league="bl1", matchday=matchday)
@@ -165,7 +166,7 @@ class Plugin(BasePlugin, SpaetzleUtils, name="Spaetzle-Tippspiel"):
                     CellRange.from_a1(Config().get(self)['ranges']['opp_points_column'])).rangename()
                 data_dict[f"ST {Storage().get(self)['matchday']}!{duel_range}"] = duels_rows
                 data_dict[f"ST {Storage().get(self)['matchday']}!{opponent_range}"] = list(opponent_cells.values())
-            self.get_api_client().update_multiple(data_dict, raw=False)
+            await self.get_api_client().update_multiple_async(data_dict, raw=False)
 
         embed = Embed(title=Lang.lang(self, 'duels_mx', Storage().get(self)['matchday']))
         participants = Storage().get(self)['participants']
@@ -177,15 +178,23 @@ class Plugin(BasePlugin, SpaetzleUtils, name="Spaetzle-Tippspiel"):
                                                            confirm_label=Lang.lang(self, 'confirm'), data=schedules))
 
     @cmd_spaetzle.command(name="scrape")
-    async def cmd_spaetzle_scrape(self, ctx: Context, url: str = None):
+    async def cmd_spaetzle_scrape(self, ctx: Context, *args: str):
         async def continue_extract(button: CoroButton, interaction: Interaction):
             if button.data == interaction.user.id:
                 button.view.stop()
                 await ctx.invoke(self.bot.get_command("spaetzle extract"))
 
-        init_content = ""
-        post_list = {}
-        original_url = url
+        async def progress(post_count: int):
+            await botmessage.edit(content="{}\n{}".format(start_msg,
+                                                          Lang.lang(self, 'scrape_intermediate', post_count)))
+
+        url = None
+        full = False
+        for arg in args:
+            if arg.lower() == "full":
+                full = True
+            else:
+                url = arg
         if url is None:
             url = Storage().get(self)['predictions_thread']
 
@@ -193,43 +202,29 @@ class Plugin(BasePlugin, SpaetzleUtils, name="Spaetzle-Tippspiel"):
             await ctx.send(Lang.lang(self, 'scrape_incorrect_url', url))
             return
 
-        botmessage = await ctx.send(Lang.lang(self, 'scrape_start', url))
+        # Incremental scrape: continue at the last scraped page of the same thread
+        forumposts = Storage().get(self, container='forumposts')
+        incremental = not full and forumposts.get('url') == url and forumposts.get('last_page')
+        init_content = forumposts.get('init', "") if incremental else ""
+        post_list = dict(forumposts.get('posts', {})) if incremental else {}
+        start_page = forumposts['last_page'] if incremental else 1
+
+        start_msg = Lang.lang(self, 'scrape_start', url)
+        botmessage = await ctx.send(start_msg)
         async with ctx.typing():
-            while True:
-                response = await restclient.Client("https://www.transfermarkt.de").request(urlparse(url).path,
-                                                                                           parse_json=False)
-                soup = BeautifulSoup(response, "html.parser")
-
-                if not init_content:
-                    init_post = soup.find(id="initialPost").find('div', 'forum-post-data')
-                    init_content = re.sub(r'(?:(?!\n)\s){2,}', ' ', init_post.text.replace('\u2013', '-')).split("\n")
-                posts = soup.find(id="postList").find_all('div', 'box')
-                for p in posts:
-                    p_time = p.find('div', 'post-header-datum')
-                    p_user = p.find('a', 'forum-user')
-                    p_data = p.find('div', 'forum-post-data')
-                    p_id = p.find('span', 'link-zum-post')
-                    if p_time and p_user and p_data:
-                        post_list[p_id.text] = {
-                            'user': p_user.text,
-                            'time': p_time.text.strip(),
-                            'link': p_id.a['href'],
-                            'content': re.sub(r'(?:(?!\n)\s){2,}', ' ', p_data.text.replace('\u2013', '-')).split("\n")
-                        }
-
-                await botmessage.edit(content="{}\n{}".format(botmessage.content,
-                                                              Lang.lang(self, 'scrape_intermediate', len(post_list))))
-                next_page = soup.find_all('li', 'tm-pagination__list-item--icon-next-page')
-                if next_page and next_page[0].a:
-                    url = urljoin(Storage().get(self)['predictions_thread'], next_page[0].a['href'])
-                else:
-                    await ctx.send(Lang.lang(self, 'scrape_end'),
-                                   view=SingleItemView(item=CoroButton(coro=continue_extract, data=ctx.author.id,
-                                                                       label="!spaetzle extract")))
-                    break
-
-            Storage().set(self, {'init': init_content, 'posts': post_list, 'url': original_url}, container='forumposts')
+            scraper = ForumScraper(url, progress=progress)
+            init, posts, last_page, page_href = await scraper.scrape(start_page=start_page,
+                                                                     page_href=forumposts.get('page_href'))
+            if init:
+                init_content = init
+            post_list.update(posts)
+
+            Storage().set(self, {'init': init_content, 'posts': post_list, 'url': url,
+                                 'last_page': last_page, 'page_href': page_href}, container='forumposts')
             Storage().save(self, container='forumposts')
+        await ctx.send(Lang.lang(self, 'scrape_end'),
+                       view=SingleItemView(item=CoroButton(coro=continue_extract, data=ctx.author.id,
+                                                           label="!spaetzle extract")))
         await add_reaction(ctx.message, Lang.CMDSUCCESS)
 
     @cmd_spaetzle.command(name="extract")
@@ -275,7 +270,7 @@ class Plugin(BasePlugin, SpaetzleUtils, name="Spaetzle-Tippspiel"):
             data_range = CellRange.from_a1(Config().get(self)['ranges']['league_rows'][league]).overlay_range(
                 CellRange.from_a1(Config().get(self)['ranges']['pred_columns'])).rangename()
             data_dict[f"ST {matchday}!{data_range}"] = l_data
-        self.get_api_client().update_multiple(data_dict, raw=False)
+        await self.get_api_client().update_multiple_async(data_dict, raw=False)
         await add_reaction(ctx.message, Lang.CMDSUCCESS)
 
         # Output discord
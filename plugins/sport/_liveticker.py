@@ -48,7 +48,8 @@ class _Liveticker:
                 for action in LivetickerActions:
                     await add_reaction(msg, action.value)
                 react = self.bot.reaction_listener.register(msg, self._liveticker_reaction,
-                                                            data={'user': ctx.author.id, 'react': False})
+                                                            data={'user': ctx.author.id, 'react': False},
+                                                            emojis=[x.value for x in LivetickerActions])
                 await asyncio.sleep(60)
                 if react and not react.data['react']:
                     embed.clear_fields()
@@ -102,10 +103,11 @@ class _Liveticker:
             elif reaction == LivetickerActions.RESCHEDULE:
                 # Reschedule matches
                 until = self.bot.liveticker.semiweekly_timer.next_execution()
-                for c_reg in list(self.bot.liveticker.search_coro(plugin_names=[self.get_name()])):
-                    for l_reg in c_reg.l_regs:
-                        await l_reg.schedule_kickoffs(until)
-                    break
+                with self.bot.liveticker.storage_batch():
+                    for c_reg in list(self.bot.liveticker.search_coro(plugin_names=[self.get_name()])):
+                        for l_reg in c_reg.l_regs:
+                            await l_reg.schedule_kickoffs(until)
+                        break
             event.data['react'] = True
             event.callback.deregister()
             for action in LivetickerActions:
@@ -253,7 +255,7 @@ class _Liveticker:
         match_msgs = [Lang.lang(self, 'liveticker_prefix_kickoff', event.league, event.kickoff.strftime('%H:%M'))]
         for match in event.matches:
             predictions = await self._get_predictions(match.home_team,
-                                                      match.away_team, match.kickoff)
+                                                      match.away_team, match.kickoff, max_age=60)
             match_msg = f"{match.home_team.emoji} {match.home_team.long_name} - " \
                         f"{match.away_team.emoji} {match.away_team.long_name}"
             if predictions:
@@ -307,7 +309,7 @@ class _Liveticker:
 
     @cmd_teamname.command(name="info")
     async def cmd_teamname_info(self, ctx, *, team: str):
-        teamname_dict = self.bot.liveticker.teamname_converter.get(team)
+        teamname_dict = self.bot.liveticker.teamname_converter.get(team, fuzzy=True)
         if not teamname_dict:
             await ctx.send(Lang.lang(self, 'team_not_found'))
         else:
@@ -1,8 +1,10 @@
+import asyncio
 import logging
+from time import monotonic
 from datetime import datetime, timedelta
 from itertools import groupby
 from operator import itemgetter
-from typing import List, Tuple, Union
+from typing import List, Tuple, Union, Dict, Optional
 
 from nextcord import User, Member, Embed
 from nextcord import TextChannel
@@ -18,16 +20,134 @@ from services.liveticker import TeamnameDict, LeagueRegistrationESPN
 logger = logging.getLogger(__name__)
 
 
+class PredictionRow:
+    """
+    Parsed match row of a prediction sheet
+
+    :param index: row index in the prediction range
+    :param row: raw row, padded to the width of the prediction range
+    :param people: player names
+    :param teams: resolved team names, see `TeamnameConverter.get_many()`
+    """
+
+    def __init__(self, index: int, row: list, people: List[str], teams: Dict[str, TeamnameDict]):
+        self.index = index
+        self.day = row[0]
+        self.time = row[1]
+        self.team1: Optional[TeamnameDict] = teams.get(row[2])
+        self.team2: Optional[TeamnameDict] = teams.get(row[5])
+        self.preds = ["{} {}:{}".format(people[x],
+                                        row[6 + x * 2] if row[6 + x * 2] else "-",
+                                        row[7 + x * 2] if row[7 + x * 2] else "-"
+                                        ) for x in range(len(people))]
+        try:
+            self.kickoff = datetime.strptime(f"{row[0][-6:]} {row[1]} {datetime.now().year}", "%d.%m. %H:%M %Y")
+        except (TypeError, ValueError):
+            self.kickoff = None
+
+    def matches_kickoff(self, kickoff: datetime) -> bool:
+        """
+        :param kickoff: kickoff to check
+        :return: True if day and time of this row do not contradict kickoff
+        """
+        if self.day is not None and not self.day.endswith(kickoff.strftime("%d.%m.")):
+            return False
+        if self.time is not None and not self.time.endswith(kickoff.strftime("%H:%M")):
+            return False
+        return True
+
+    def format(self) -> str:
+        return "{} - {} // {}\n".format(self.team1.short_name, self.team2.short_name, " / ".join(self.preds))
+
+
+class PredictionSnapshot:
+    """
+    In-memory copy of the prediction sheet ranges of a league. Match rows are parsed once and indexed
+    by team pair and kickoff date.
+
+    :param league: league key
+    :param settings: league settings from storage the snapshot was taken with
+    :param names: values of the player names range
+    :param points: values of the total points range
+    :param data: values of the prediction range
+    :param converter: TeamnameConverter to resolve the team names with
+    """
+
+    def __init__(self, league: str, settings: dict, names: list, points: list, data: list, converter):
+        self.league = league
+        self.settings = dict(settings)
+        self.names = names
+        self.points = points
+        self.data = data
+        self.timestamp = monotonic()
+
+        self.by_teams: Dict[Tuple[str, str], List[PredictionRow]] = {}
+        self.by_date: Dict[str, List[PredictionRow]] = {}
+        people = [x for x in names[0] if x != ""] if names else []
+        rows = [row + [None] * (len(data[0]) + 1 - len(row)) for row in data[1:]]
+        teams = converter.get_many((name for row in rows for name in (row[2], row[5])), fuzzy=True)
+        for i, row in enumerate(rows):
+            if not row[2] or not row[5]:
+                continue
+            prow = PredictionRow(i, row, people, teams)
+            if prow.team1 is None or prow.team2 is None:
+                continue
+            self.by_teams.setdefault((prow.team1.long_name, prow.team2.long_name), []).append(prow)
+            if prow.day is not None:
+                self.by_date.setdefault(prow.day[-6:], []).append(prow)
+
+    def age(self) -> float:
+        """
+        :return: Seconds since the snapshot was taken
+        """
+        return monotonic() - self.timestamp
+
+    def find(self, team1: TeamnameDict = None, team2: TeamnameDict = None,
+             kickoff: datetime = None) -> List[PredictionRow]:
+        """
+        Finds the match rows for a match. If no teams are given, finds the matches that are currently running.
+
+        :param team1: team1 TeamnameDict object
+        :param team2: team2 TeamnameDict object
+        :param kickoff: kickoff datetime object
+        :return: List of matching rows in sheet order
+        """
+        if team1 is not None and team2 is not None:
+            candidates = self.by_teams.get((team1.long_name, team2.long_name), [])
+        else:
+            now = datetime.now()
+            days = {(now + delta).strftime("%d.%m.")
+                    for delta in (timedelta(hours=-2), timedelta(), timedelta(minutes=30))}
+            if kickoff is not None:
+                days = {kickoff.strftime("%d.%m.")}
+            candidates = sorted((r for day in days for r in self.by_date.get(day, [])), key=lambda r: r.index)
+
+        r = []
+        for row in candidates:
+            if kickoff is not None and not row.matches_kickoff(kickoff):
+                continue
+            if team1 is None or team2 is None:
+                if row.kickoff is None:
+                    continue
+                time_diff = datetime.now() - row.kickoff
+                if time_diff < timedelta(minutes=-30) or time_diff > timedelta(hours=2):
+                    continue
+            r.append(row)
+        return r
+
+
 class _Predgame:
 
     def __init__(self, bot):
         self.bot = bot
+        self._snapshots: Dict[str, PredictionSnapshot] = {}
+        self._snapshot_tasks: Dict[str, asyncio.Task] = {}
 
     @commands.group(name="predgame", aliases=["tippspiel"], invoke_without_command=True)
     async def cmd_predgame(self, ctx, *args):
         if len(args) >= 2:
-            team1_dict = self.bot.liveticker.teamname_converter.get(args[0])
-            team2_dict = self.bot.liveticker.teamname_converter.get(args[1])
+            team1_dict = self.bot.liveticker.teamname_converter.get(args[0], fuzzy=True)
+            team2_dict = self.bot.liveticker.teamname_converter.get(args[1], fuzzy=True)
             if team1_dict is not None and team2_dict is not None:
                 date = args[2] if len(args) >= 3 else None
                 time = args[3] if len(args) >= 4 else None
@@ -100,6 +220,12 @@ class _Predgame:
         for msg in paginate(msgs):
             await ctx.send(msg)
 
+    @cmd_predgame.command(name="refresh", aliases=["update"])
+    async def cmd_predgame_refresh(self, ctx):
+        async with ctx.typing():
+            failed = await self.refresh_predictions()
+        await add_reaction(ctx.message, Lang.CMDERROR if failed else Lang.CMDSUCCESS)
+
     @cmd_predgame.command(name="preds", aliases=["tipps"])
     async def cmd_predgame_preds(self, ctx, team1: str = "", team2: str = "", date: str = None, time: str = None):
         kickoff = None
@@ -108,8 +234,8 @@ class _Predgame:
         elif date is not None and time is not None:
             kickoff = timeutils.parse_time_input(date, time)
 
-        team1_dict = self.bot.liveticker.teamname_converter.get(team1)
-        team2_dict = self.bot.liveticker.teamname_converter.get(team2)
+        team1_dict = self.bot.liveticker.teamname_converter.get(team1, fuzzy=True)
+        team2_dict = self.bot.liveticker.teamname_converter.get(team2, fuzzy=True)
         if team1_dict is None and team2_dict is not None:
             await ctx.send(Lang.lang(self, "pred_cant_find_team", team1))
             return
@@ -126,55 +252,99 @@ class _Predgame:
             pass
 
     async def _get_predictions(self, team1: TeamnameDict = None, team2: TeamnameDict = None,
-                               kickoff: datetime = None) -> str:
+                               kickoff: datetime = None, max_age: Optional[float] = None) -> str:
         """Returns a list of the predictions for the first found match
 
         :param kickoff: kickoff datetime object
         :param team1: team1 TeamnameDict object with all its names
         :param team2: team2 TeamnameDict object with all its names
+        :param max_age: Max age of the prediction snapshots in seconds, see `_get_snapshots()`
         :return: the predictions output string
         """
 
         match_msg = ""
-        for league in Storage.get(self)["predictions"]:
-            c = sheetsclient.Client(self.bot, Storage().get(self)["predictions"][league]['sheet'])
-            people_range, data = c.get_multiple([Storage().get(self)["predictions"][league]['name_range'],
-                                                 Storage.get(self)["predictions"][league]["prediction_range"]])
-            people = [x for x in people_range[0] if x != ""]
-            for row in data[1:]:
-                # parse data from sheet
-                row.extend([None] * (len(data[0]) + 1 - len(row)))
-                if kickoff is not None and (
-                        (len(row) >= 1 and row[0] is not None and not row[0].endswith(kickoff.strftime("%d.%m."))) or
-                        (len(row) >= 2 and row[1] is not None and not row[1].endswith(kickoff.strftime("%H:%M")))
-                ):
-                    continue
-                if not row[2] or not row[5]:
-                    continue
-                pred_team1 = self.bot.liveticker.teamname_converter.get(row[2])
-                pred_team2 = self.bot.liveticker.teamname_converter.get(row[5])
+        for snapshot in await self._get_snapshots(max_age=max_age):
+            for row in snapshot.find(team1, team2, kickoff):
+                match_msg += row.format()
 
-                # decide what to show
-                if pred_team1 is None or pred_team2 is None:
-                    continue
-                if team1 is None or team2 is None:
-                    now = datetime.now()
-                    kickoff_dt = datetime.strptime(f"{row[0][-6:]} {row[1]} {now.year}", "%d.%m. %H:%M %Y")
-                    time_diff = now - kickoff_dt
-                    if time_diff < timedelta(minutes=-30) or time_diff > timedelta(hours=2):
-                        continue
-
-                elif team1.long_name != pred_team1.long_name or team2.long_name != pred_team2.long_name:
-                    continue
+        return match_msg
 
-                # put match into string
-                preds = ["{} {}:{}".format(people[x],
-                                           row[6 + x * 2] if row[6 + x * 2] else "-",
-                                           row[7 + x * 2] if row[7 + x * 2] else "-"
-                                           ) for x in range(len(people))]
-                match_msg += "{} - {} // {}\n".format(pred_team1.short_name, pred_team2.short_name, " / ".join(preds))
+    async def _snapshot_coro(self, _job):
+        if Storage.get(self)["predictions"]:
+            await self.refresh_predictions()
 
-        return match_msg
+    async def refresh_predictions(self, *leagues: str) -> Dict[str, Exception]:
+        """
+        Refreshes the prediction snapshots of the given leagues concurrently.
+        Refreshes that are already running are awaited instead of being started again. Failed refreshes are logged
+        and leave the previous snapshot of their league in place.
+
+        :param leagues: league keys; all leagues if omitted
+        :return: Exceptions of the failed refreshes by league key
+        """
+        if not leagues:
+            leagues = list(Storage.get(self)["predictions"].keys())
+        tasks = []
+        for league in leagues:
+            task = self._snapshot_tasks.get(league)
+            if task is None:
+                task = asyncio.ensure_future(self._refresh_snapshot(league))
+                self._snapshot_tasks[league] = task
+            tasks.append(task)
+        failed = {}
+        for league, result in zip(leagues, await asyncio.gather(*tasks, return_exceptions=True)):
+            if isinstance(result, Exception):
+                logger.error("Unable to refresh the prediction snapshot of %s: %s", league, result)
+                failed[league] = result
+        return failed
+
+    async def _refresh_snapshot(self, league: str):
+        """
+        Fetches all sheet ranges of a league and replaces its snapshot.
+
+        :param league: league key
+        """
+        try:
+            settings = Storage.get(self)["predictions"][league]
+            c = sheetsclient.Client(self.bot, settings['sheet'])
+            names, points, data = await c.get_multiple_async([settings['name_range'],
+                                                              settings['points_range'],
+                                                              settings['prediction_range']])
+            self._snapshots[league] = PredictionSnapshot(league, settings, names, points, data,
+                                                         self.bot.liveticker.teamname_converter)
+            logger.debug("Refreshed prediction snapshot of %s", league)
+        finally:
+            del self._snapshot_tasks[league]
+
+    async def _get_snapshots(self, league: str = "", max_age: Optional[float] = None) -> List[PredictionSnapshot]:
+        """
+        Returns the prediction snapshots of the given league or all leagues. Missing, outdated or
+        stale snapshots are refreshed first; if that fails, the previous snapshot is used.
+
+        :param league: league key or name; all leagues if empty
+        :param max_age: Max snapshot age in seconds; defaults to the snapshot refresh interval
+        :return: List of PredictionSnapshots
+        :raises Exception: exception of the refresh if a league has no snapshot at all
+        """
+        if max_age is None:
+            max_age = (Config.get(self)["predgame"]["snapshot_interval"] + 1) * 60
+        leagues = []
+        for leg, settings in Storage.get(self)["predictions"].items():
+            if league and league not in (leg, settings["name"]):
+                continue
+            leagues.append(leg)
+
+        stale = []
+        for leg in leagues:
+            snapshot = self._snapshots.get(leg)
+            if snapshot is None or snapshot.age() > max_age \
+                    or snapshot.settings != Storage.get(self)["predictions"][leg]:
+                stale.append(leg)
+        if stale:
+            for leg, e in (await self.refresh_predictions(*stale)).items():
+                if leg not in self._snapshots:
+                    raise e
+        return [self._snapshots[leg] for leg in leagues]
 
     @cmd_predgame.command(name="points", aliases=["punkte", "gesamt", "platz", "total"])
     async def cmd_predgame_points(self, ctx, *args):
@@ -188,9 +358,9 @@ class _Predgame:
         league = " ".join(league_args)
 
         if matchday <= 0:
-            msgs = self._get_total_points(league)
+            msgs = await self._get_total_points(league)
         else:
-            msgs = self._get_matchday_points(matchday, league)
+            msgs = await self._get_matchday_points(matchday, league)
 
         if len(msgs) < 1 and not league:
             await ctx.send(Lang.lang(self, "pred_cant_find_league", league))
@@ -205,19 +375,16 @@ class _Predgame:
                 else:
                     await ctx.send(msg)
 
-    def _get_total_points(self, league: str = "") -> List[Tuple[str, str]]:
+    async def _get_total_points(self, league: str = "") -> List[Tuple[str, str]]:
         """Return the messages for total points for leagues
 
         :param league: league to return, if None all leagues will be returned
         :return: The point messages as tuple with title (incl. league name) and description text (points)
         """
         msgs = []
-        for leg in Storage.get(self)["predictions"]:
-            if league and league not in (leg, Storage.get(self)["predictions"][leg]["name"]):
-                continue
-            c = sheetsclient.Client(self.bot, Storage().get(self)["predictions"][leg]['sheet'])
-            people, points_str = c.get_multiple([Storage().get(self)["predictions"][leg]['name_range'],
-                                                 Storage().get(self)["predictions"][leg]['points_range']])
+        for snapshot in await self._get_snapshots(league):
+            leg = snapshot.league
+            people, points_str = snapshot.names, snapshot.points
             points = []
             pts_format = "d"
             for pts in points_str[0]:
@@ -254,7 +421,7 @@ class _Predgame:
                          desc))
         return msgs
 
-    def _get_matchday_points(self, matchday: int, league: str = "") -> List[str]:
+    async def _get_matchday_points(self, matchday: int, league: str = "") -> List[str]:
         """Return the messages for points at a specific matchday.
 
         :param matchday: matchday to return
@@ -262,12 +429,9 @@ class _Predgame:
         :return: The point messages
         """
         msgs = []
-        for leg in Storage.get(self)["predictions"]:
-            if league and league not in (leg, Storage.get(self)["predictions"][leg]["name"]):
-                continue
-            c = sheetsclient.Client(self.bot, Storage().get(self)["predictions"][leg]['sheet'])
-            people_raw, data = c.get_multiple([Storage().get(self)["predictions"][leg]['name_range'],
-                                               Storage.get(self)["predictions"][leg]["prediction_range"]])
+        for snapshot in await self._get_snapshots(league):
+            leg = snapshot.league
+            people_raw, data = snapshot.names, snapshot.data
             for row in data:
                 if not row[0].endswith(f" {matchday}"):
                     continue
@@ -296,6 +460,7 @@ class _Predgame:
             "prediction_range": prediction_range  # sheets range in which the prediction data are
         }
         Storage.save(self)
+        self._snapshots.pop(espn_code, None)
         logger.info("New prediction league added: %s as %s, using sheet ID %s", espn_code, name, sheet_id)
         await add_reaction(ctx.message, Lang.CMDSUCCESS)
 
@@ -304,6 +469,7 @@ class _Predgame:
         if name in Storage.get(self)["predictions"]:
             del Storage.get(self)["predictions"][name]
             Storage.save(self)
+            self._snapshots.pop(name, None)
             logger.info("Prediction league removed: %s", name)
             await add_reaction(ctx.message, Lang.CMDSUCCESS)
         else:
@@ -26,10 +26,15 @@ class Plugin(BasePlugin, _Liveticker, _Predgame, _Scores, name="Sport"):
         self._update_config()
 
         self.today_timer = self.bot.timers.schedule(coro=self._today_coro, td=timers.timedict(hour=1, minute=0))
+        self.snapshot_timer = None
+        interval = Config.get(self)["predgame"]["snapshot_interval"]
+        if interval > 0:
+            self.snapshot_timer = self.bot.timers.schedule(coro=self._snapshot_coro,
+                                                           td=timers.timedict(minute=list(range(0, 60, interval))))
 
     def default_config(self, container=None):
         return {
-            'cfg_version': 4,
+            'cfg_version': 5,
             'sport_chan': 0,
             'league_aliases': {"bl": ["ger.1", "espn"]},
             'liveticker': {
@@ -41,6 +46,7 @@ class Plugin(BasePlugin, _Liveticker, _Predgame, _Scores, name="Sport"):
             'predgame': {
                 'show_today_matches': True,
                 'pinglist': [],
+                'snapshot_interval': 10,
             },
             'predictions_overview_sheet': ''
         }
@@ -76,6 +82,8 @@ class Plugin(BasePlugin, _Liveticker, _Predgame, _Scores, name="Sport"):
 
     async def shutdown(self):
         self.today_timer.cancel()
+        if self.snapshot_timer is not None:
+            self.snapshot_timer.cancel()
 
     def _update_config(self):
         if Config().get(self).get('cfg_version', 0) < 1:
@@ -113,5 +121,10 @@ class Plugin(BasePlugin, _Liveticker, _Predgame, _Scores, name="Sport"):
             Config().get(self)['cfg_version'] = 4
             logger.info("Updated config to version 4")
 
+        if Config().get(self).get('cfg_version', 0) < 5:
+            Config.get(self)["predgame"]["snapshot_interval"] = 10
+            Config().get(self)['cfg_version'] = 5
+            logger.info("Updated config to version 5")
+
         Storage.save(self)
         Config().save(self)
@@ -0,0 +1,202 @@
+import asyncio
+import multiprocessing
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Callable, Awaitable, Dict
+
+from plugins.wordle.game import Game, Correctness
+from plugins.wordle.solvers import SOLVERS, PatternTable
+from plugins.wordle.utils import OutOfOptions
+from plugins.wordle.wordlist import WordList
+
+# Word list of the worker process, set by _init_worker()
+_wordlist: Optional[WordList] = None  # pylint: disable=invalid-name
+
+
+class GameRecord:
+    """
+    Result of a single benchmark game.
+
+    :param solution: solution word
+    :param guesses: guessed words
+    :param solved: True if the solver found the solution within the max tries
+    :param alg_failure: True if the solver gave up (e.g. ran out of options)
+    :param duration: time the game took in seconds
+    """
+    def __init__(self, solution: str, guesses: List[str], solved: bool, alg_failure: bool, duration: float):
+        self.solution = solution
+        self.guesses = guesses
+        self.solved = solved
+        self.alg_failure = alg_failure
+        self.duration = duration
+
+    def replay(self, wordlist: WordList) -> Game:
+        """
+        :param wordlist: word list the game was played on
+        :return: Game with all guesses of this record
+        """
+        game = Game(wordlist, self.solution)
+        for word in self.guesses:
+            game.guess(word)
+        return game
+
+
+def play_game(wordlist: WordList, solver_name: str, solution: str) -> GameRecord:
+    """
+    Lets a solver play a single game.
+
+    :param wordlist: word list
+    :param solver_name: key in SOLVERS
+    :param solution: solution word
+    :return: game record
+    """
+    game = Game(wordlist, solution)
+    alg_failure = False
+    start = time.perf_counter()
+    try:
+        SOLVERS[solver_name](game).solve()
+    except (RuntimeError, OutOfOptions):
+        alg_failure = True
+    duration = time.perf_counter() - start
+    return GameRecord(solution, [guess.word for guess in game.guesses], game.done == Correctness.CORRECT,
+                      alg_failure, duration)
+
+
+def _init_worker(wordlist: WordList, pattern_dir: Optional[str]):
+    """Stores the word list and the pattern table directory in the worker process"""
+    # pylint: disable=global-statement
+    global _wordlist
+    _wordlist = wordlist
+    if PatternTable is not None:
+        PatternTable.directory = pattern_dir
+
+
+def _play_games(solver_name: str, solutions: List[str]) -> List[GameRecord]:
+    """Plays a chunk of games in the worker process, see `play_game()`"""
+    return [play_game(_wordlist, solver_name, solution) for solution in solutions]
+
+
+class BenchmarkResult:
+    """
+    Results of a benchmark run.
+
+    :param solver_name: solver that was benchmarked
+    :param records: game records
+    :param elapsed: wall clock time of the run in seconds
+    """
+    def __init__(self, solver_name: str, records: List[GameRecord], elapsed: float):
+        self.solver_name = solver_name
+        self.records = records
+        self.elapsed = elapsed
+
+    @property
+    def games(self) -> int:
+        """Amount of games played"""
+        return len(self.records)
+
+    def distribution(self) -> Dict[int, int]:
+        """
+        :return: Dict guess count -> amount of solved games; failed games are counted as 0
+        """
+        r = {i: 0 for i in range(7)}
+        for record in self.records:
+            if record.alg_failure:
+                continue
+            r[len(record.guesses) if record.solved else 0] += 1
+        return r
+
+    def failures(self) -> List[GameRecord]:
+        """
+        :return: Records of the games that were not solved, including algorithm failures
+        """
+        return [record for record in self.records if not record.solved]
+
+    @property
+    def success_rate(self) -> float:
+        """Share of the solved games"""
+        if not self.records:
+            return 0
+        return sum(1 for record in self.records if record.solved) / self.games
+
+    @property
+    def score(self) -> float:
+        """
+        :return: Average score; 6 points for a game solved in one guess, 1 point for six guesses
+        """
+        if not self.records:
+            return 0
+        return sum(7 - len(record.guesses) for record in self.records if record.solved) / self.games
+
+    @property
+    def games_per_second(self) -> float:
+        """Throughput of the run"""
+        return self.games / self.elapsed if self.elapsed else 0
+
+    def latency(self, percentile: float) -> float:
+        """
+        :param percentile: percentile in `(0, 100]`
+        :return: Game duration at the percentile (nearest rank) in seconds
+        """
+        durations = sorted(record.duration for record in self.records)
+        if not durations:
+            return 0
+        rank = max(int(len(durations) * percentile / 100 + 0.5), 1)
+        return durations[min(rank, len(durations)) - 1]
+
+    def format(self) -> List[str]:
+        """
+        :return: Report lines
+        """
+        r = ["{}: {} games played; results:".format(self.solver_name, self.games)]
+        for key, amount in self.distribution().items():
+            r.append("{}/6: {}".format("X" if key == 0 else key, amount))
+        alg_failures = sum(1 for record in self.records if record.alg_failure)
+        if alg_failures > 0:
+            r.append("Alg failures: {}".format(alg_failures))
+        r.append("success rate: {:.1f}%".format(100 * self.success_rate))
+        r.append("total score: {:.2f}".format(self.score))
+        r.append("latency: p50 {:.1f}ms, p90 {:.1f}ms, p99 {:.1f}ms, max {:.1f}ms".format(
+            *[self.latency(p) * 1000 for p in (50, 90, 99, 100)]))
+        r.append("throughput: {:.1f} games/s ({:.1f}s)".format(self.games_per_second, self.elapsed))
+        return r
+
+
+async def run_benchmark(wordlist: WordList, solver_name: str, quantity: int,
+                        solutions: Optional[List[str]] = None, processes: Optional[int] = None,
+                        chunk_size: int = 10, progress: Optional[Callable[[int, int], Awaitable]] = None)\
+        -> BenchmarkResult:
+    """
+    Lets a solver play `quantity` games on random solutions in a process pool, so neither the event loop nor the
+    interpreter lock is blocked.
+
+    :param wordlist: word list
+    :param solver_name: key in SOLVERS
+    :param quantity: amount of games
+    :param solutions: solutions to play; random solutions if None
+    :param processes: amount of worker processes; defaults to the cpu count
+    :param chunk_size: amount of games that are sent to a worker at once
+    :param progress: coroutine function that is awaited with (games played, quantity) after every chunk
+    :return: benchmark result
+    :raises KeyError: If there is no solver `solver_name`
+    """
+    if solver_name not in SOLVERS:
+        raise KeyError(solver_name)
+    if solutions is None:
+        solutions = [random.choice(wordlist.solutions) for _ in range(quantity)]
+    chunks = [solutions[i:i + chunk_size] for i in range(0, len(solutions), chunk_size)]
+    pattern_dir = PatternTable.directory if PatternTable is not None else None
+
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, SOLVERS[solver_name].prepare, wordlist)
+    records = []
+    start = time.perf_counter()
+    # spawn instead of fork; the bot process has a running event loop and threads
+    with ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context("spawn"),
+                             initializer=_init_worker, initargs=(wordlist, pattern_dir)) as pool:
+        futures = [loop.run_in_executor(pool, _play_games, solver_name, chunk) for chunk in chunks]
+        for future in asyncio.as_completed(futures):
+            records += await future
+            if progress is not None:
+                await progress(len(records), len(solutions))
+    return BenchmarkResult(solver_name, records, time.perf_counter() - start)
@@ -0,0 +1,281 @@
+import hashlib
+import logging
+import os
+import threading
+import weakref
+from typing import List, Optional
+
+import numpy as np
+
+from plugins.wordle.game import HelpingSolver, Game, Guess, Correctness, WORDLENGTH
+from plugins.wordle.naiveengine import WordMatrix
+from plugins.wordle.utils import OutOfOptions
+from plugins.wordle.wordlist import WordList
+
+PATTERNS = 3 ** WORDLENGTH
+
+
+def encode_correctness(correctness: List[Correctness]) -> int:
+    """
+    Encodes a correctness list as a number in base 3 (the correctness of the first char is the least significant
+    digit).
+
+    :param correctness: correctness list of a Guess
+    :return: pattern in `range(PATTERNS)`; 0 for a correct guess
+    """
+    r = 0
+    for i, el in enumerate(correctness):
+        r += el.value * 3 ** i
+    return r
+
+
+def patterns(guesses: np.ndarray, solutions: np.ndarray) -> np.ndarray:
+    """
+    Calculates the feedback patterns (see `encode_correctness()`) of guesses against solutions the way
+    `Game.guess()` does.
+
+    :param guesses: (G x WORDLENGTH) matrix of encoded guesses
+    :param solutions: (K x WORDLENGTH) matrix of encoded solutions
+    :return: (G x K) uint8 matrix of patterns
+    """
+    # occurences of every char in every solution
+    counts = np.zeros((max(guesses.max(), solutions.max()) + 1, len(solutions)), dtype=np.uint8)
+    for i in range(WORDLENGTH):
+        np.add.at(counts, (solutions[:, i], np.arange(len(solutions))), 1)
+
+    correct = [guesses[:, i, None] == solutions[None, :, i] for i in range(WORDLENGTH)]
+    r = np.zeros((len(guesses), len(solutions)), dtype=np.uint8)
+    for i in range(WORDLENGTH):
+        char = guesses[:, i, None]
+
+        # a char is partially correct if the solution has more unmatched occurences than the guess has before it
+        available = counts[guesses[:, i]]
+        rank = np.zeros(r.shape, dtype=np.uint8)
+        for j in range(WORDLENGTH):
+            same = guesses[:, j, None] == char
+            available = available - (correct[j] & same)
+            if j < i:
+                rank += same & ~correct[j]
+        partially = ~correct[i] & (rank < available)
+
+        value = np.full(r.shape, Correctness.INCORRECT.value, dtype=np.uint8)
+        value[partially] = Correctness.PARTIALLY.value
+        value[correct[i]] = Correctness.CORRECT.value
+        r += value * np.uint8(3 ** i)
+    return r
+
+
+def entropies(table: np.ndarray) -> np.ndarray:
+    """
+    Calculates the entropy of the pattern distribution of every row.
+
+    :param table: (G x K) pattern matrix
+    :return: float vector of length G
+    """
+    count = table.shape[1]
+    offsets = np.arange(len(table), dtype=np.int64)[:, None] * PATTERNS
+    buckets = np.bincount((table + offsets).ravel(), minlength=len(table) * PATTERNS).reshape(-1, PATTERNS)
+
+    # n * log2(n) for every possible bucket size
+    sizes = np.arange(count + 1)
+    sizes[0] = 1
+    nlogn = sizes * np.log2(sizes)
+    return np.log2(count) - nlogn[buckets].sum(axis=1) / count
+
+
+class PatternTable:
+    """
+    Feedback patterns of every word of a word list (rows, in `WordList.words` order) against every solution
+    (columns, in `WordList.solutions` order). The table is built once per word list and cached as a memory-mapped
+    .npy file in `PatternTable.directory` if that is set.
+
+    :param wordlist: word list
+    """
+    directory: Optional[str] = None
+    """Cache directory for pattern table files; set by the plugin"""
+
+    BLOCK = 128
+    """Amount of rows that are calculated at once when building the table"""
+
+    _tables = weakref.WeakKeyDictionary()
+    _lock = threading.Lock()
+
+    def __init__(self, wordlist: WordList):
+        self.logger = logging.getLogger(__name__)
+        self.wordlist = wordlist
+        self.wm = WordMatrix.get(wordlist)
+        self.encoded = wordlist.encoded
+        self.offset = len(wordlist.complement)
+        self.solutions = self.wm.matrix[self.offset:]
+        self._opening = None
+
+        self.table = self._load()
+        if self.table is None:
+            self.table = self._build()
+
+    @classmethod
+    def get(cls, wordlist: WordList) -> "PatternTable":
+        """
+        Returns the pattern table of `wordlist`; builds or loads it if necessary. Thread-safe, so this can be
+        called in an executor to prepare a table.
+
+        :param wordlist: word list
+        :return: PatternTable of `wordlist`
+        """
+        with cls._lock:
+            r = cls._tables.get(wordlist)
+            if r is None or r.encoded is not wordlist.encoded:
+                r = cls(wordlist)
+                cls._tables[wordlist] = r
+            return r
+
+    @classmethod
+    def prepare(cls, wordlist: WordList) -> "PatternTable":
+        """
+        Builds or loads the pattern table of `wordlist` and its opening guess.
+
+        :param wordlist: word list
+        :return: PatternTable of `wordlist`
+        """
+        r = cls.get(wordlist)
+        r.opening()
+        return r
+
+    def filepath(self) -> Optional[str]:
+        """
+        :return: Path of the cache file, None if there is no cache directory
+        """
+        if self.directory is None:
+            return None
+        digest = hashlib.sha1(self.encoded.tobytes())
+        digest.update(str(self.offset).encode())
+        return os.path.join(self.directory, "patterns_{}.npy".format(digest.hexdigest()[:16]))
+
+    def _load(self) -> Optional[np.ndarray]:
+        path = self.filepath()
+        if path is None or not os.path.exists(path):
+            return None
+        try:
+            r = np.load(path, mmap_mode="r")
+        except (OSError, ValueError):
+            self.logger.error("Unable to read pattern table %s, rebuilding", path)
+            return None
+        if r.dtype != np.uint8 or r.shape != (len(self.wm.matrix), len(self.solutions)):
+            self.logger.error("Pattern table %s does not match its word list, rebuilding", path)
+            return None
+        return r
+
+    def _build(self) -> np.ndarray:
+        path = self.filepath()
+        shape = (len(self.wm.matrix), len(self.solutions))
+        self.logger.debug("Building pattern table of size %s", shape)
+        if path is None:
+            r = np.empty(shape, dtype=np.uint8)
+        else:
+            os.makedirs(self.directory, exist_ok=True)
+            tmppath = "{}.{}.{}.tmp".format(path, os.getpid(), threading.get_ident())
+            r = np.lib.format.open_memmap(tmppath, mode="w+", dtype=np.uint8, shape=shape)
+
+        for i in range(0, shape[0], self.BLOCK):
+            r[i:i + self.BLOCK] = patterns(self.wm.matrix[i:i + self.BLOCK], self.solutions)
+
+        if path is None:
+            return r
+        r.flush()
+        del r
+        os.replace(tmppath, path)
+        return np.load(path, mmap_mode="r")
+
+    def opening(self) -> int:
+        """
+        :return: Row of the best first guess; cached
+        """
+        if self._opening is None:
+            self._opening = best_row(self.table, np.arange(len(self.solutions)), self.offset)
+        return self._opening
+
+
+def best_row(table: np.ndarray, columns: np.ndarray, offset: int) -> int:
+    """
+    Finds the row that splits the candidate columns best. Candidates get a bonus of their chance to be the
+    solution.
+
+    :param table: pattern table
+    :param columns: candidate columns
+    :param offset: row of the first column
+    :return: row with the highest score
+    """
+    scores = np.empty(len(table))
+    block = max(1, (1 << 20) // len(columns))
+    for i in range(0, len(table), block):
+        scores[i:i + block] = entropies(table[i:i + block][:, columns])
+    scores[columns + offset] += 1 / len(columns)
+    return int(np.argmax(scores))
+
+
+class EntropySolver(HelpingSolver):
+    """
+    Solver that picks the guess whose feedback pattern distribution over the remaining candidates has the highest
+    entropy, based on a precomputed PatternTable.
+    """
+    def __init__(self, game: Game):
+        super().__init__(game)
+        self.logger = logging.getLogger(__name__)
+        self.patterns = PatternTable.get(game.wordlist)
+
+        # candidate columns of the pattern table; rows of the word matrix once the solutions are exhausted
+        self.candidates = np.arange(len(self.patterns.solutions))
+        self.extended = False
+        self.history = []
+
+        for guess in game.guesses:
+            self.digest_guess(guess)
+
+    @classmethod
+    def prepare(cls, wordlist: WordList):
+        PatternTable.prepare(wordlist)
+
+    def candidate_words(self) -> List[str]:
+        """
+        :return: List of words that could be the solution
+        """
+        if self.extended:
+            return self.patterns.wm.words[self.candidates].tolist()
+        return [self.game.wordlist.solutions[i] for i in self.candidates]
+
+    def get_guess(self) -> str:
+        if len(self.candidates) == 0:
+            raise OutOfOptions()
+        words = self.game.wordlist.words
+        if self.extended:
+            matrix = self.patterns.wm.matrix[self.candidates]
+            scores = entropies(patterns(matrix, matrix))
+            return words[self.candidates[int(np.argmax(scores))]]
+
+        if len(self.candidates) <= 2 or len(self.game.guesses) >= self.game.max_tries - 1:
+            return self.game.wordlist.solutions[self.candidates[0]]
+        if not self.history:
+            return words[self.patterns.opening()]
+        return words[best_row(self.patterns.table, self.candidates, self.patterns.offset)]
+
+    def digest_guess(self, guess: Guess):
+        pattern = encode_correctness(guess.correctness)
+        row = self.game.wordlist.index(guess.word)
+        self.history.append((row, pattern))
+
+        if not self.extended:
+            self.candidates = self.candidates[self.patterns.table[row, self.candidates] == pattern]
+            if len(self.candidates) > 0:
+                return
+
+            # solution is not in the solutions list; fall back to all words
+            self.logger.debug("Out of solutions, falling back to all words")
+            self.extended = True
+            self.candidates = np.arange(len(self.patterns.wm.matrix))
+            history = self.history
+        else:
+            history = self.history[-1:]
+
+        matrix = self.patterns.wm.matrix
+        for row, pattern in history:
+            self.candidates = self.candidates[patterns(matrix[[row]], matrix[self.candidates])[0] == pattern]
@@ -3,10 +3,7 @@ from string import ascii_lowercase
 from enum import Enum
 from typing import List, Optional, Tuple
 
-from plugins.wordle.wordlist import WordList
-
-
-WORDLENGTH = 5
+from plugins.wordle.wordlist import WordList, WORDLENGTH
 
 
 class Correctness(Enum):
@@ -162,6 +159,16 @@ class Solver(abc.ABC):
     def __init__(self, game: Game):
         self.game = game
 
+    @classmethod
+    def prepare(cls, wordlist: WordList):
+        """
+        Builds data that all instances of this solver share per word list (e.g. lookup tables), so the first game
+        does not have to. Does not touch the event loop and can be run in an executor.
+
+        :param wordlist: word list
+        """
+        pass
+
     @abc.abstractmethod
     def solve(self):
         raise NotImplementedError
@@ -0,0 +1,212 @@
+import weakref
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from plugins.wordle.wordlist import WordList, WORDLENGTH
+
+
+class WordMatrix:
+    """
+    NumPy view on a word list: the words as an (N x WORDLENGTH) matrix of alphabet indices and the per-word
+    character counts as an (N x alphabet length) matrix. Shared by all solvers on the same word list.
+
+    :param wordlist: word list
+    """
+    _cache = weakref.WeakKeyDictionary()
+
+    def __init__(self, wordlist: WordList):
+        self.alphabet = wordlist.alphabet
+        self.words = np.array(wordlist.words, dtype=object)
+        self.letters = {char: i for i, char in enumerate(self.alphabet)}
+        self.encoded = wordlist.encoded
+        self.matrix = np.frombuffer(self.encoded, dtype=np.uint8).reshape(-1, WORDLENGTH)
+
+        rows = np.arange(len(self.words))
+        self.counts = np.zeros((len(self.words), len(self.alphabet)), dtype=np.int64)
+        for i in range(WORDLENGTH):
+            self.counts[rows, self.matrix[:, i]] += 1
+
+    @classmethod
+    def get(cls, wordlist: WordList) -> "WordMatrix":
+        """
+        :param wordlist: word list
+        :return: Cached WordMatrix of `wordlist`; rebuilt after `WordList.invalidate_cache()`
+        """
+        r = cls._cache.get(wordlist)
+        if r is None or r.encoded is not wordlist.encoded:
+            r = cls(wordlist)
+            cls._cache[wordlist] = r
+        return r
+
+    def letter_mask(self, chars) -> np.ndarray:
+        """
+        :param chars: iterable of characters
+        :return: bool vector over the alphabet that is True for every char in `chars`
+        """
+        r = np.zeros(len(self.alphabet), dtype=bool)
+        for char in chars:
+            if char is not None:
+                r[self.letters[char]] = True
+        return r
+
+    def letter_vector(self, values: Dict[str, int]) -> np.ndarray:
+        """
+        :param values: char -> value
+        :return: int vector over the alphabet with the values of `values` and 0 everywhere else
+        """
+        r = np.zeros(len(self.alphabet), dtype=np.int64)
+        for char, value in values.items():
+            r[self.letters[char]] = value
+        return r
+
+
+class NaiveEngine:
+    """
+    Vectorized implementations of the NaiveSolver candidate filter and scores. The results (including their order)
+    are the same as the ones of the pure python implementations in `NaiveSolver`.
+
+    :param solver: NaiveSolver whose char lists are used
+    """
+    def __init__(self, solver):
+        self.solver = solver
+        self.wm = WordMatrix.get(solver.game.wordlist)
+        self.candidate_indexes = None
+
+    def _words(self, indexes) -> List[str]:
+        return self.wm.words[indexes].tolist()
+
+    def current_candidates(self) -> List[str]:
+        """
+        :return: List of words that match the solver's char lists; may be empty
+        """
+        solver = self.solver
+        wm = self.wm
+        m = wm.matrix
+        mask = np.ones(len(m), dtype=bool)
+
+        # guessed words
+        for guess in solver.game.guesses:
+            mask &= np.any(m != np.frombuffer(solver.game.wordlist.encode(guess.word), dtype=np.uint8), axis=1)
+
+        # simple constraints
+        allowed = wm.letter_mask(solver.possible) | wm.letter_mask(solver.found)
+        floaters = np.zeros(len(wm.alphabet), dtype=bool)
+        for i in range(WORDLENGTH):
+            elsewhere = wm.letter_mask(solver.elsewhere[i])
+            floaters |= elsewhere
+            column = m[:, i]
+            if solver.found[i] is not None:
+                mask &= column == wm.letters[solver.found[i]]
+            mask &= ~elsewhere[column] & allowed[column]
+
+        # amounts
+        for char, (amount, definite) in solver.amounts.items():
+            found = wm.counts[:, wm.letters[char]]
+            mask &= found == amount if definite else found >= amount
+
+        # floaters; all positions are unclear
+        for char in np.flatnonzero(floaters):
+            mask &= wm.counts[:, char] > 0
+
+        self.candidate_indexes = np.flatnonzero(mask)
+        return self._words(self.candidate_indexes)
+
+    def possible(self) -> List[str]:
+        """
+        :return: Sorted list of the chars that occur in a not found position of a candidate
+        """
+        not_found = list(self.solver.not_found_iter())
+        letters = np.bincount(self.wm.matrix[self.candidate_indexes][:, not_found].ravel(),
+                              minlength=len(self.wm.alphabet))
+        return [self.wm.alphabet[i] for i in np.flatnonzero(letters)]
+
+    def char_score(self) -> Dict[str, int]:
+        """
+        :return: kubb score of every char in possible, see `NaiveSolver.char_score()`
+        """
+        wm = self.wm
+        candidates = wm.matrix[self.candidate_indexes][:, list(self.solver.not_found_iter())]
+        present = np.zeros((len(candidates), len(wm.alphabet)), dtype=bool)
+        for i in range(candidates.shape[1]):
+            present[np.arange(len(candidates)), candidates[:, i]] = True
+        scores = np.minimum(present.sum(axis=0), len(candidates) // 2)
+        return {char: int(scores[wm.letters[char]]) for char in self.solver.possible}
+
+    def kubb_score(self) -> Dict[str, int]:
+        """
+        :return: kubb score of every candidate, see `NaiveSolver.kubb_score()`
+        """
+        wm = self.wm
+        indexes = self.candidate_indexes
+        half = len(indexes) // 2
+        candidates = wm.matrix[indexes]
+        rows = np.arange(len(indexes))
+
+        mins = np.full((len(indexes), len(wm.alphabet)), np.iinfo(np.int64).max, dtype=np.int64)
+        occurences = np.zeros((len(indexes), len(wm.alphabet)), dtype=np.int64)
+        for i in self.solver.not_found_iter():
+            column = candidates[:, i]
+            # letter score: counts up to half, then alternates between half - 1 and half
+            matches = np.bincount(column, minlength=len(wm.alphabet))[column]
+            scores = np.where(matches <= half, matches, half - (matches - half) % 2)
+            np.minimum.at(mins, (rows, column), scores)
+            np.add.at(occurences, (rows, column), 1)
+
+        amounts = wm.letter_vector({char: amount[0] for char, amount in self.solver.amounts.items()})
+        word_scores = np.where(occurences > amounts, mins, 0).sum(axis=1)
+        return dict(zip(self._words(indexes), word_scores.tolist()))
+
+    def info_scores(self) -> np.ndarray:
+        """
+        :return: info score of every word in the word list, see `NaiveSolver.info_score()`
+        """
+        solver = self.solver
+        wm = self.wm
+        m = wm.matrix
+        possible = wm.letter_mask(solver.possible)
+        r = np.zeros(len(m), dtype=np.int64)
+        counted = []
+        for i in range(WORDLENGTH):
+            column = m[:, i]
+            found = column == wm.letters[solver.found[i]] if solver.found[i] is not None \
+                else np.zeros(len(m), dtype=bool)
+            r -= found
+
+            # no points for elsewhere and found, no further points for double letters
+            passed = ~found & ~wm.letter_mask(solver.elsewhere[i])[column]
+            for j, counted_j in enumerate(counted):
+                passed &= ~(counted_j & (m[:, j] == column))
+            counted.append(passed)
+
+            r += passed * (2 * possible[column].astype(np.int64)
+                           - wm.letter_mask(solver.candidates[i])[column])
+        return r
+
+    def calc_scores(self) -> Dict[int, List[str]]:
+        """
+        :return: dict: info score -> list(words), see `NaiveSolver.calc_scores()`
+        """
+        scores = self.info_scores()
+        return {int(score): self._words(np.flatnonzero(scores == score)) for score in np.unique(scores)}
+
+    def kubb_char_scores(self, charkubb: Dict[str, int]) -> Tuple[List[str], int]:
+        """
+        :param charkubb: char kubb scores as returned by `char_score()`
+        :return: words with the best char kubb score, best score; see `NaiveSolver.get_kubb_char_guess()`
+        """
+        wm = self.wm
+        scores = np.zeros(len(wm.words), dtype=np.int64)
+        for char, score in charkubb.items():
+            if score <= 0:
+                continue
+            counts = wm.counts[:, wm.letters[char]]
+            amount = self.solver.amounts.get(char)
+
+            # chars with a known, non-definite amount are scored per occurence, all others once
+            if amount is None:
+                scores += (counts > 0) * score
+            elif not amount[1]:
+                scores += np.where(counts < amount[0], counts, 0) * score
+        best_score = scores.max()
+        return self._words(np.flatnonzero(scores == best_score)), int(best_score)
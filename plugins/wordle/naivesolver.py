@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import random
 from typing import Optional, Dict, List, Iterable, Tuple
@@ -7,15 +8,26 @@ from botutils.utils import execute_anything_sync, log_exception
 from plugins.wordle.game import HelpingSolver, Game, WORDLENGTH, Correctness, Guess
 from plugins.wordle.utils import OutOfOptions
 
+try:
+    from plugins.wordle.naiveengine import NaiveEngine
+except ImportError:
+    NaiveEngine = None
+
 
 class NaiveSolver(HelpingSolver):
     """
     Solver that tries to gather complete information about the final guess before committing.
+    Candidate filtering and scoring run on a NaiveEngine if NumPy is available.
     """
-    def __init__(self, game: Game):
+    def __init__(self, game: Game, vectorized: bool = True):
+        """
+        :param game: Game to solve
+        :param vectorized: Set to False to use the pure python implementation even if NumPy is available
+        """
         super().__init__(game)
         self.logger = logging.getLogger(__name__)
         self.current_candidate_cache = None
+        self.engine = NaiveEngine(self) if vectorized and NaiveEngine is not None else None
 
         # characters that are definitely found at this position
         self.found: list = [None] * WORDLENGTH
@@ -56,6 +68,41 @@ class NaiveSolver(HelpingSolver):
         if self.current_candidate_cache is not None:
             return self.current_candidate_cache
 
+        if self.engine is not None:
+            r = self.engine.current_candidates()
+        else:
+            r = self.filter_candidates()
+
+        if not r:
+            # candidate list is empty, everybody panic
+            e = OutOfOptions()
+            guesses = []
+            for el in self.game.guesses:
+                guesses.append(el.word)
+            fields = {
+                "Solution": "||{}||".format(self.game.solution),
+                "Guesses:": "\n".join(guesses)
+            }
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                # benchmark worker process or thread without the bot's event loop; the caller reports the failure
+                pass
+            else:
+                execute_anything_sync(log_exception(e, fields=fields, title=":x: Wordle: Naive solver error"))
+            self.log_charlists(error=True)
+            raise e
+
+        self.current_candidate_cache = r
+        self.digest_by_candidates()
+        return r
+
+    def filter_candidates(self) -> List[str]:
+        """
+        Pure python implementation of the candidate filter.
+
+        :return: List of words that could be the solution with the current char lists; may be empty
+        """
         # find amout of unclear positions and gather floaters
         unclear_indexes = []
         floaters = {}  # characters that were only found partially
@@ -117,23 +164,6 @@ class NaiveSolver(HelpingSolver):
                 continue
 
             r.append(word)
-
-        if not r:
-            # candidate list is empty, everybody panic
-            e = OutOfOptions()
-            guesses = []
-            for el in self.game.guesses:
-                guesses.append(el.word)
-            fields = {
-                "Solution": "||{}||".format(self.game.solution),
-                "Guesses:": "\n".join(guesses)
-            }
-            execute_anything_sync(log_exception(e, fields=fields, title=":x: Wordle: Naive solver error"))
-            self.log_charlists(error=True)
-            raise e
-
-        self.current_candidate_cache = r
-        self.digest_by_candidates()
         return r
 
     def found_count(self, char: str = None) -> int:
@@ -180,6 +210,8 @@ class NaiveSolver(HelpingSolver):
         """
         kubbscore = {}
         candidates = self.current_candidates()
+        if self.engine is not None:
+            return self.engine.char_score()
         for char in self.possible:
             kubbscore[char] = 0
             for word in candidates:
@@ -201,6 +233,8 @@ class NaiveSolver(HelpingSolver):
         :return: word scores
         """
         candidates = self.current_candidates()
+        if self.engine is not None:
+            return self.engine.kubb_score()
         word_scores = {}
         for word in candidates:
             letter_scores: Dict[str, List[int]] = {}
@@ -264,6 +298,8 @@ class NaiveSolver(HelpingSolver):
         Calculates the info score for every word in the word list.
         :return: dict: score -> list(words)
         """
+        if self.engine is not None:
+            return self.engine.calc_scores()
         r = {}
         for word in self.game.wordlist.words:
             score = self.info_score(word)
@@ -397,6 +433,9 @@ class NaiveSolver(HelpingSolver):
         """
         Updates the possible list by removing characters that are not in candidates.
         """
+        if self.engine is not None:
+            self.possible = self.engine.possible()
+            return
         self.possible = []
         for word in self.current_candidates():
             for i in range(WORDLENGTH):
@@ -428,6 +467,12 @@ class NaiveSolver(HelpingSolver):
         :return: guess, score
         """
         charkubb = self.char_score()
+        if self.engine is not None:
+            candidates, best_score = self.engine.kubb_char_scores(charkubb)
+            r = random.choice(candidates)
+            self.logger.debug("Kubb char guess: %s with a score of %s", r, best_score)
+            return r, best_score
+
         best_score = None
         candidates = None
         for word in self.game.wordlist.words:
@@ -515,5 +560,3 @@ class NaiveSolver(HelpingSolver):
             self.digest_guess(guess)
             if self.game.done != Correctness.PARTIALLY:
                 break
-
-        self.game.wordlist.invalidate_cache()
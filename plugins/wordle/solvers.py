@@ -0,0 +1,19 @@
+from typing import Dict, Type
+
+from plugins.wordle.game import HelpingSolver
+from plugins.wordle.naivesolver import NaiveSolver
+from plugins.wordle.dicesolver import DiceSolver
+try:
+    from plugins.wordle.entropysolver import EntropySolver, PatternTable
+except ImportError:
+    EntropySolver = None
+    PatternTable = None
+
+__all__ = ["SOLVERS", "NaiveSolver", "DiceSolver", "EntropySolver", "PatternTable"]
+
+SOLVERS: Dict[str, Type[HelpingSolver]] = {
+    "naive": NaiveSolver,
+    "dice": DiceSolver
+}
+if EntropySolver is not None:
+    SOLVERS["entropy"] = EntropySolver
@@ -1,6 +1,9 @@
+import asyncio
 import logging
+import os
+import time
 from datetime import date
-from typing import Optional, Dict, Type, List
+from typing import Optional, Dict, List
 
 from nextcord import DMChannel
 from nextcord.ext import commands
@@ -10,13 +13,13 @@ from base.data import Config, Lang, Storage
 from botutils.converters import get_best_username as gbu, serialize_channel, deserialize_channel
 from botutils.permchecks import check_admin_access
 from botutils.setter import ConfigSetter
-from botutils.stringutils import table, paginate, format_number
+from botutils.stringutils import table, paginate
 from botutils.utils import helpstring_helper, add_reaction, log_exception, execute_anything_sync
 from services.helpsys import DefaultCategories
 
-from plugins.wordle.game import Game, Correctness, WORDLENGTH, HelpingSolver
-from plugins.wordle.naivesolver import NaiveSolver
-from plugins.wordle.dicesolver import DiceSolver
+from plugins.wordle.benchmark import run_benchmark
+from plugins.wordle.game import Game, WORDLENGTH
+from plugins.wordle.solvers import SOLVERS, PatternTable
 from plugins.wordle.utils import format_guess, format_daily
 from plugins.wordle.wordlist import WordList, Parsers
 from plugins.wordle.gamehandler import Mothership
@@ -42,12 +45,6 @@ BASE_CONFIG = {
 }
 
 
-SOLVERS: Dict[str, Type[HelpingSolver]] = {
-    "naive": NaiveSolver,
-    "dice": DiceSolver
-}
-
-
 class WordlistNotFound(Exception):
     """
     Raised by commands that take a wordlist name as an argument.
@@ -104,7 +101,8 @@ class Summon:
             self.peek_reaction_listener.deregister()
             self.peek_reaction_listener = None
         self.last_game_epoch_index = epoch_index
-        self.peek_reaction_listener = Config().bot.reaction_listener.register(msg, self.peek_reaction_callback)
+        self.peek_reaction_listener = Config().bot.reaction_listener.register(
+            msg, self.peek_reaction_callback, emojis=[Lang.lang(self.plugin, "reaction_peek")])
         await add_reaction(msg, Lang.lang(self.plugin, "reaction_peek"))
 
     async def peek_reaction_callback(self, event):
@@ -142,6 +140,7 @@ class Summon:
 class Plugin(BasePlugin, name="Wordle"):
     WORDLIST_CONTAINER = "wordlists"
     WORDLIST_KEY = "lists"
+    SOLVETEST_PROGRESS_INTERVAL = 2
 
     def __init__(self):
         super().__init__()
@@ -154,6 +153,9 @@ class Plugin(BasePlugin, name="Wordle"):
 
         self.config_setter = ConfigSetter(self, BASE_CONFIG)
         self.deserialize_wordlists()
+        if PatternTable is not None:
+            PatternTable.directory = os.path.dirname(Storage.data(self).filepath(container=self.WORDLIST_CONTAINER))
+        execute_anything_sync(self.prepare_solver())
         execute_anything_sync(self.build_summons())
         self.mothership = Mothership(self)
 
@@ -241,6 +243,19 @@ class Plugin(BasePlugin, name="Wordle"):
         except KeyError:
             raise WordlistNotFound(self, wordlist)
 
+    async def prepare_solver(self, *wordlists: WordList):
+        """
+        Prepares the default solver for word lists in the executor (see `Solver.prepare()`).
+
+        :param wordlists: word lists to prepare; all if omitted
+        """
+        solver = SOLVERS[self.get_config("default_solver")]
+        if not wordlists:
+            wordlists = list(self.wordlists.values())
+        loop = asyncio.get_running_loop()
+        for wordlist in wordlists:
+            await loop.run_in_executor(None, solver.prepare, wordlist)
+
     async def summon_job_coro(self, _):
         for summon in self.summons:
             await summon.fire()
@@ -288,6 +303,8 @@ class Plugin(BasePlugin, name="Wordle"):
                 return
 
         await self.config_setter.set_cmd(ctx, key, value)
+        if key == "default_solver":
+            await self.prepare_solver()
 
     @cmd_wordle.command(name="wordlist")
     async def cmd_wordlist(self, ctx,
@@ -332,6 +349,7 @@ class Plugin(BasePlugin, name="Wordle"):
         self.wordlists[name] = wl
         self.save_wordlists()
         await ctx.send(wl)
+        await self.prepare_solver(wl)
 
     @cmd_wordle.group(name="play", invoke_without_command=True)
     async def cmd_wordle_play(self, ctx, wordlist: Optional[str] = None):
@@ -473,63 +491,46 @@ class Plugin(BasePlugin, name="Wordle"):
         await ctx.send(format_guess(self, game, game.guesses[-1], done=True, history=True))
 
     @cmd_wordle.command(name="solvetest", hidden=True)
-    async def cmd_wordle_solvetest(self, ctx, quantity: int = 100):
+    async def cmd_wordle_solvetest(self, ctx, quantity: int = 100, solver: Optional[str] = None):
         try:
             wordlist = self.get_wordlist(None)
         except WordlistNotFound as e:
             await e.default(ctx)
             return
+        if solver is None:
+            solver = self.get_config("default_solver")
+        if quantity < 1:
+            await add_reaction(ctx.message, Lang.CMDERROR)
+            await ctx.send("Invalid quantity: {}, has to be at least 1".format(quantity))
+            return
+        if solver not in SOLVERS:
+            await add_reaction(ctx.message, Lang.CMDERROR)
+            await ctx.send("Invalid solver: {}".format(solver))
+            return
         await add_reaction(ctx.message, Lang.CMDSUCCESS)
 
-        results = {}
-        alg_failures = []
-        failed_games = []
-        total_score = 0
-        for i in range(0, 7):
-            results[i] = 0
-
-        async with ctx.typing():
-            for i in range(quantity):
-                self.logger.debug("Solvetest: game #%s", i + 1)
-                game = Game(wordlist)
-                game.set_random_solution()
-                try:
-                    NaiveSolver(game).solve()
-                except RuntimeError:
-                    alg_failures.append(game)
-                    continue
-
-                result = game.done
-                assert result != Correctness.PARTIALLY
-                if result == Correctness.CORRECT:
-                    results[len(game.guesses)] += 1
-                    total_score += 7 - len(game.guesses)
-                else:
-                    failed_games.append(game)
-                    results[0] += 1
-
-            msgs = ["{} Games played; results:".format(quantity)]
-            for key, result in results.items():
-                key = "X" if key == 0 else key
-                msgs.append("{}/6: {}".format(key, result))
-            if len(alg_failures) > 0:
-                msgs.append("Alg failures: {}".format(len(alg_failures)))
-            sr = format_number(100 * (quantity - results[0]) / quantity, decplaces=1)
-            msgs.append("success rate: {}%".format(sr))
-            msgs.append("total score: {}".format(format_number(total_score / quantity)))
-
-            for msg in paginate(msgs, prefix="```", suffix="```"):
-                await ctx.send(msg)
+        msg = await ctx.send("{}: 0/{} games played".format(solver, quantity))
+        last_update = time.monotonic()
 
-            # dump if debug
-            if Config().bot.DEBUG_MODE:
-                if len(alg_failures) > 0:
-                    await ctx.send("Algorithm incomplete:")
-                    for game in alg_failures:
-                        await ctx.send(format_guess(self, game, game.guesses[-1], done=True, history=True))
-                if len(failed_games) > 0:
-                    await ctx.send("Algorithm failed (X/6):")
-                    for game in failed_games:
+        async def progress(played: int, total: int):
+            nonlocal last_update
+            if played < total and time.monotonic() - last_update < self.SOLVETEST_PROGRESS_INTERVAL:
+                return
+            last_update = time.monotonic()
+            await msg.edit(content="{}: {}/{} games played".format(solver, played, total))
+
+        result = await run_benchmark(wordlist, solver, quantity, progress=progress)
+        for page in paginate(result.format(), prefix="```", suffix="```"):
+            await ctx.send(page)
+
+        # dump if debug
+        if Config().bot.DEBUG_MODE:
+            for title, alg_failure in (("Algorithm incomplete:", True), ("Algorithm failed (X/6):", False)):
+                games = [record.replay(wordlist) for record in result.failures() if record.alg_failure == alg_failure]
+                if games:
+                    await ctx.send(title)
+                for game in games:
+                    if game.guesses:
                         await ctx.send(format_guess(self, game, game.guesses[-1], done=True, history=True))
 
     @cmd_wordle.group(name="summon", invoke_without_command=True)
@@ -2,16 +2,18 @@ import abc
 import json
 import random
 import re
+from array import array
 from datetime import date
 from enum import Enum
 from string import ascii_lowercase
 from typing import List, Tuple, Any
 
-import aiohttp
+from botutils import restclient
 
 TO_ADD = [
     "gecki"
 ]
+WORDLENGTH = 5
 
 
 class Parsers(Enum):
@@ -28,6 +30,9 @@ class WordList:
     """
     A word list consists of two lists: The solutions and the complement. They are disjunctive. Together,
     they form the entire word space.
+
+    Besides the word tuples, a word list holds a frozenset of all words for membership tests and an integer encoding
+    of all words (see `WordList.encoded`) that solvers can work on directly.
     """
     def __init__(self, url: str, parser: Parsers, solutions: tuple, complement: tuple):
         """
@@ -43,7 +48,11 @@ class WordList:
         self.complement = complement
         self.alphabet = ascii_lowercase
 
-        self._wordlist_cache = None
+        self._words = None
+        self._wordset = None
+        self._index = None
+        self._encoded = None
+        self.invalidate_cache()
 
     def __str__(self):
         s = len(self.solutions)
@@ -52,19 +61,73 @@ class WordList:
         return "<WordList: url: {}; parser: {}; solutions: {}; complement: {}>".format(self.url, p, s, c)
 
     def __contains__(self, item):
-        return item in self.solutions or item in self.complement
+        return item in self._wordset
+
+    def __len__(self):
+        return len(self._words)
+
+    @property
+    def words(self) -> Tuple[str, ...]:
+        """
+        :return: Tuple of all words, complement first; cached
+        """
+        return self._words
 
     @property
-    def words(self):
+    def encoded(self) -> array:
         """
-        :return: List of all words; cached
+        All words encoded as alphabet indices (`a` is 0) in a contiguous byte array; cached.
+        Word `i` of `WordList.words` occupies `encoded[i * WORDLENGTH:(i + 1) * WORDLENGTH]`.
+        Supports the buffer protocol, so it can be wrapped without copying.
+
+        :return: byte array of length `len(self) * WORDLENGTH`
         """
-        if self._wordlist_cache is None:
-            self._wordlist_cache = list(self.complement + self.solutions)
-        return self._wordlist_cache
+        if self._encoded is None:
+            self._encoded = array("B", self.encode("".join(self._words)))
+        return self._encoded
+
+    def encode(self, word: str) -> bytes:
+        """
+        Encodes a word as alphabet indices.
+
+        :param word: word to encode
+        :return: encoded word
+        :raises ValueError: If the word contains a character that is not in the alphabet
+        """
+        alphabet = self.alphabet.encode("ascii")
+        try:
+            raw = word.encode("ascii")
+        except UnicodeEncodeError:
+            raw = None
+        if raw is None or raw.translate(None, alphabet):
+            raise ValueError("Word {} contains characters outside of the alphabet".format(word))
+        return raw.translate(bytes.maketrans(alphabet, bytes(range(len(alphabet)))))
+
+    def decode(self, encoded) -> str:
+        """
+        Decodes an encoded word.
+
+        :param encoded: alphabet indices, e.g. a slice of `WordList.encoded`
+        :return: decoded word
+        """
+        return "".join(self.alphabet[i] for i in encoded)
+
+    def index(self, word: str) -> int:
+        """
+        :param word: word to find
+        :return: Position of `word` in `WordList.words` and `WordList.encoded`
+        :raises KeyError: If the word is not in the word list
+        """
+        return self._index[word]
 
     def invalidate_cache(self):
-        self._wordlist_cache = None
+        """
+        Rebuilds the word tuple, set and index from `solutions` and `complement`; to be called after changing either.
+        """
+        self._words = self.complement + self.solutions
+        self._wordset = frozenset(self._words)
+        self._index = {word: i for i, word in enumerate(self._words)}
+        self._encoded = None
 
     def serialize(self):
         """
@@ -120,7 +183,7 @@ class Nytimes(Parser):
         :return: solutions, complement
         """
 
-        session = aiohttp.ClientSession()
+        session = restclient.Transport.session()
 
         # find script file
         p = re.compile(r"<script.*?src=\"([^>]+wordle[^>]*\.js)\">")
@@ -188,7 +251,7 @@ class Nytimes(Parser):
 
     @classmethod
     async def fetch_daily(cls, url: str) -> Tuple[str, Any]:
-        session = aiohttp.ClientSession()
+        session = restclient.Transport.session()
 
         td = date.today()
         async with session.get(cls.DAILY_URL.format(td.year, td.month, td.day)) as response:
@@ -207,6 +270,6 @@ def normalize_wlist(wl: List[str]) -> tuple:
     :return: tuple of words
     """
     for el in sorted(wl):
-        assert len(el) == 5
+        assert len(el) == WORDLENGTH
     return tuple(wl)
 
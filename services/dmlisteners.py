@@ -3,7 +3,9 @@ This subsystem provides listeners for direct messages (DMs) to the bot.
 It is instantiated as `bot.dm_listener`.
 """
 
+import itertools
 import logging
+from typing import Dict
 
 from base.configurable import BaseSubsystem
 from base.data import Config
@@ -21,6 +23,7 @@ class Registration:
         self.data = data
         self.name = name
         self._blocking = blocking
+        self.id = None
 
         if self.kill_coro is None:
             logging.getLogger(__name__).warning("DM listener registered without kill_coro: %s. This is not advised.",
@@ -53,7 +56,11 @@ class DMListener(BaseSubsystem):
     def __init__(self):
         super().__init__()
         self.bot = Config().bot
-        self.registrations = {}
+        self.registrations: Dict[int, Registration] = {}
+
+        # user id -> registrations; the inner dict is used as an ordered set
+        self._by_user: Dict[int, Dict[Registration, None]] = {}
+        self._ids = itertools.count(1)
 
     def register(self, user, coro, name, kill_coro=None, data=None, blocking=False) -> Registration:
         """
@@ -72,22 +79,19 @@ class DMListener(BaseSubsystem):
         :raises RuntimeError: If there already is a blocking listener for `user`.
         :raises KeyError: If a blocking listener is to be registered but there already is a regular listener for `user`.
         """
-        # find blocking violations
-        for cb in self.registrations.values():
-            if cb.user == user:
-                if cb.blocking:
-                    raise RuntimeError("A blocking DM listener for user {} is already registered.".format(user))
-                if blocking:
-                    raise KeyError("There is already a listener registered for user {}, unable to register "
-                                   "blocking listener.".format(user))
+        # find blocking violations; a blocking listener is always the only one of its user
+        regs = self._by_user.get(user.id)
+        if regs:
+            if next(iter(regs)).blocking:
+                raise RuntimeError("A blocking DM listener for user {} is already registered.".format(user))
+            if blocking:
+                raise KeyError("There is already a listener registered for user {}, unable to register "
+                               "blocking listener.".format(user))
 
         reg = Registration(self, user, coro, kill_coro, name, data, blocking)
-        i = 1
-        while True:
-            if i not in self.registrations.keys():
-                self.registrations[i] = reg
-                break
-            i += 1
+        reg.id = next(self._ids)
+        self.registrations[reg.id] = reg
+        self._by_user.setdefault(user.id, {})[reg] = None
         return reg
 
     def deregister(self, registration: Registration):
@@ -96,12 +100,13 @@ class DMListener(BaseSubsystem):
 
         :param registration: Registration object that is to be unregistered
         """
-        # pylint: disable=unnecessary-dict-index-lookup
-        # (false positive)
-        for key, cb in self.registrations.items():
-            if registration == cb:
-                del self.registrations[key]
-                break
+        if self.registrations.get(registration.id) is not registration:
+            return
+        del self.registrations[registration.id]
+        regs = self._by_user[registration.user.id]
+        del regs[registration]
+        if not regs:
+            del self._by_user[registration.user.id]
 
     def is_registered(self, user) -> bool:
         """
@@ -110,10 +115,7 @@ class DMListener(BaseSubsystem):
         :param user: User to be checked
         :return: Returns whether there is a registered DM listener for `user`.
         """
-        for cb in self.registrations.values():
-            if cb.user == user:
-                return True
-        return False
+        return user.id in self._by_user
 
     def is_blocked(self, user) -> bool:
         """
@@ -122,20 +124,18 @@ class DMListener(BaseSubsystem):
         :param user: User to be checked
         :return: Returns True if there is a blocking listener for `user`, False otherwise.
         """
-        for cb in self.registrations.values():
-            if cb.blocking and user == cb.user:
-                return True
-        return False
+        regs = self._by_user.get(user.id)
+        return bool(regs) and next(iter(regs)).blocking
 
     async def handle_dm(self, message) -> bool:
         """
         :param message: Message object
         :return: True if this was a blocking listener, False if not.
         """
-        todo = []
-        for cb in self.registrations.values():
-            if cb.user == message.author:
-                todo.append(cb)
+        regs = self._by_user.get(message.author.id)
+        if not regs:
+            return False
+        todo = list(regs)
 
         blocking = False
         for cb in todo:
@@ -150,6 +150,17 @@ class IgnoreDataset:
             return self == other
         return self is None and other is None
 
+    def index_key(self) -> tuple:
+        """
+        Returns the key of the dataset in the ignore list index. Two datasets of the same type are equal
+        if their keys are equal.
+
+        :return: (user id, command name, channel id); ids are None if not set
+        """
+        user_id = self.user.id if self.user is not None else None
+        channel_id = self.channel.id if self.channel is not None else None
+        return user_id, str(self.command_name), channel_id
+
     def __str__(self):
         return "<ignoring.IgnoreDataset; {}, user: {}, command: {}, channel: {}, until: {}>".format(
             str(IgnoreType(self.ignore_type)), self.user, self.command_name, self.channel, self.until)
@@ -250,6 +261,14 @@ class Ignoring(BaseSubsystem):
         self.passive = []
         self.active = []
 
+        # index_key() -> dataset per ignore type, kept in sync with the lists above
+        self._index = {
+            IgnoreType.USER: {},
+            IgnoreType.COMMAND: {},
+            IgnoreType.PASSIVE_USAGE: {},
+            IgnoreType.ACTIVE_USAGE: {},
+        }
+
         # pylint: disable=unused-variable
         @self.bot.listen()
         async def on_ready():
@@ -325,7 +344,7 @@ class Ignoring(BaseSubsystem):
         :param disable_save_file: disables saving ignore list in json file, useful for system startup
         :return: Code based on IgnoreEditResult
         """
-        if dataset in self.get_ignore_list(dataset.ignore_type):
+        if dataset.index_key() in self._index[dataset.ignore_type]:
             return IgnoreEditResult.ALREADY_IN_LIST
         if dataset.until < datetime.now():
             return IgnoreEditResult.UNTIL_IN_PAST
@@ -340,6 +359,7 @@ class Ignoring(BaseSubsystem):
 
         ignore_list = self.get_ignore_list(dataset.ignore_type)
         ignore_list.append(dataset)
+        self._index[dataset.ignore_type][dataset.index_key()] = dataset
         if not disable_save_file:
             self.save()
         self.log.info("Added to ignore list: %s", dataset)
@@ -460,15 +480,20 @@ class Ignoring(BaseSubsystem):
         :param dataset: the dataset
         :return: Code based on IgnoreEditResult
         """
-        if dataset not in self.get_ignore_list(dataset.ignore_type):
+        if dataset.ignore_type not in self._index:
+            return IgnoreEditResult.NOT_IN_LIST
+        listed_dataset = self._index[dataset.ignore_type].pop(dataset.index_key(), None)
+        if listed_dataset is None:
             return IgnoreEditResult.NOT_IN_LIST
 
-        dataset_index = self.get_ignore_list(dataset.ignore_type).index(dataset)
-        listed_dataset = self.get_ignore_list(dataset.ignore_type)[dataset_index]
         if listed_dataset.job is not None:
             listed_dataset.job.cancel()
 
-        self.get_ignore_list(dataset.ignore_type).remove(listed_dataset)
+        ignore_list = self.get_ignore_list(dataset.ignore_type)
+        for i, el in enumerate(ignore_list):
+            if el is listed_dataset:
+                del ignore_list[i]
+                break
         self.save()
         self.log.info("Removed from ignore list: %s", listed_dataset)
         return IgnoreEditResult.SUCCESS
@@ -573,7 +598,7 @@ class Ignoring(BaseSubsystem):
         :return: Code based on IgnoreEditResult
         """
         user = self.bot.get_user(user_id)
-        return self.remove_passive(user, command_name)
+        return self.remove_active(user, command_name)
 
     #######
     # Checking
@@ -610,7 +635,7 @@ class Ignoring(BaseSubsystem):
         :param user_id: the user id
         :return: True if user interactions should be blocked, otherwise False
         """
-        return self._check_user(user_id, self._user_id_check_func)
+        return (user_id, "", None) in self._index[IgnoreType.USER]
 
     def check_user_name(self, user_name: str) -> bool:
         """
@@ -638,11 +663,8 @@ class Ignoring(BaseSubsystem):
         :param channel: The channel
         :return: True if command is blocked in channel otherwise False
         """
-        ignore_list = self.get_ignore_list(IgnoreType.COMMAND)
-        for el in ignore_list:
-            if el.command_name == command_name and el.channel == channel:
-                return True
-        return False
+        channel_id = channel.id if channel is not None else None
+        return (None, str(command_name), channel_id) in self._index[IgnoreType.COMMAND]
 
     def check_command(self, ctx: commands.Context) -> bool:
         """
@@ -680,8 +702,9 @@ class Ignoring(BaseSubsystem):
         :param command_name: The command name
         :return: True if user is blocked for command, otherwise False
         """
-
-        return self._check_passive_usage(user_id, self._user_id_check_func, command_name)
+        if self.check_user_id(user_id):
+            return True
+        return (user_id, str(command_name), None) in self._index[IgnoreType.PASSIVE_USAGE]
 
     def check_passive_usage_uname(self, user_name: str, command_name: str) -> bool:
         """
@@ -729,8 +752,9 @@ class Ignoring(BaseSubsystem):
         :param command_name: The command name
         :return: True if user is blocked for command, otherwise False
         """
-
-        return self._check_active_usage(user_id, self._user_id_check_func, command_name)
+        if self.check_user_id(user_id):
+            return True
+        return (user_id, str(command_name), None) in self._index[IgnoreType.ACTIVE_USAGE]
 
     def check_active_usage_uname(self, user_name: str, command_name: str) -> bool:
         """
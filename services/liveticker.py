@@ -2,15 +2,18 @@ import asyncio
 import datetime
 import logging
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
 from enum import Enum
-from typing import List, Generator, Tuple, Dict, Iterable, Coroutine, Any, Set, NamedTuple
+from typing import List, Generator, Tuple, Dict, Iterable, Coroutine, Any, Set, NamedTuple, Optional
 
 from base.configurable import BaseSubsystem, BasePlugin
-from base.data import Storage, Lang, Config
+from base.data import Storage, Config
 from botutils import restclient
 from botutils.converters import get_plugin_by_name
 from botutils.utils import execute_anything_sync
 from services import timers
+from services.teamnames import TeamnameDict, TeamnameConverter
 from services.timers import HasAlreadyRun
 
 
@@ -85,239 +88,6 @@ class MatchStatus(Enum):
         raise SourceNotSupported
 
 
-class TeamnameDict:
-    """
-    Set of name variants
-
-    :param converter:
-    :type converter: TeamnameConverter
-    :param long_name: longest version of the teams name
-    :param short_name: short distinct variant of the teams name
-    :param abbr: abbreviation for the team (3-5 letters)
-    :param emoji: logo of the team or other emoji that should be displayed
-    :param other: additional variants of the teams name
-    """
-
-    def __init__(self, converter, long_name: str = None, short_name: str = None, abbr: str = None, emoji: str = None,
-                 other: list = None):
-        if long_name is None:
-            self._converter = converter
-            self.long_name = None
-            self.short_name = None
-            self.abbr = None
-            self.emoji = None
-            self.other = []
-            return
-        if short_name is None:
-            short_name = long_name[:15]
-        if abbr is None:
-            abbr = short_name[:5].upper()
-        if emoji is None:
-            try:
-                emoji = Lang.EMOJI['lettermap'][ord(abbr[0].lower()) - 97]
-            except (IndexError, TypeError):
-                emoji = "🏳️"
-        if other is None:
-            other = []
-        self._converter = converter
-        self.long_name = long_name
-        self.short_name = short_name
-        self.abbr = abbr
-        self.emoji = emoji
-        self.other = other
-
-    def update(self, long_name: str = None, short_name: str = None, abbr: str = None, emoji: str = None):
-        """Updates name variants or emoji of the TeamnameDict"""
-        self._converter.update(self, long_name, short_name, abbr, emoji)
-
-    def remove(self, other_str: str = None):
-        """
-        Removes an alternative or the whole TeamnameDict
-
-        :param other_str: team name alternative
-        """
-        if other_str and other_str not in self:
-            return
-        if other_str and other_str in self.other:
-            self._converter.remove_other(self, other_str)
-        else:
-            self._converter.remove(self)
-
-    def add_other(self, other: str):
-        """Adds an alternative name for the team"""
-        if other not in self:
-            self.other.append(other)
-
-    def table_display(self) -> str:
-        """Returns string prepared for display in the table"""
-        if len(self.short_name) > 12:
-            return f"{self.emoji} `{self.short_name[:11]}\u2026`"
-        return f"{self.emoji} `{self.short_name}{' ' * (11 - len(self.short_name))}`"
-
-    def store(self, storage_path):
-        """Saves this to the storage"""
-        Storage().get(storage_path, container='teamname')[self.long_name] = self.to_dict()
-        Storage().save(storage_path, container='teamname')
-
-    def to_dict(self):
-        return {'short': self.short_name, 'abbr': self.abbr, 'emoji': self.emoji, 'other': self.other}
-
-    def __iter__(self):
-        yield self.long_name
-        yield self.short_name
-        yield self.abbr
-        for other in self.other:
-            yield other
-
-    def __bool__(self):
-        return bool(self.long_name and self.short_name and self.abbr)
-
-
-class TeamnameConverter:
-    """
-    Class for the conversion between team names
-
-    :param liveticker: liveticker class
-    """
-
-    def __init__(self, liveticker):
-        self.liveticker = liveticker
-        self._teamnames = {}
-        self._restore()
-
-    def get(self, team: str, add_if_nonexist: bool = False) -> TeamnameDict:
-        """
-        Returns the saved TeamnameDict for the given team name or adds a new entry if wanted
-
-        :param team: name of the team
-        :param add_if_nonexist: if the team name is unknown yet and this is true, a new entry will be added
-        :return: associated TeamnameDict
-        """
-        teamnamedict = self._teamnames.get(team.lower())
-        if teamnamedict is None:
-            if add_if_nonexist:
-                return self.add(team)
-            return TeamnameDict(self)
-        return teamnamedict
-
-    def add(self, long_name: str, short_name: str = None, abbr: str = None, emoji: str = None,
-            other: Iterable[str] = None) -> TeamnameDict:
-        """
-        Adds a new data set for a team to the converter.
-
-        :param long_name: longest version of the teams name
-        :param short_name: short distinct variant of the teams name
-        :param abbr: abbreviation for the team (3-5 letters)
-        :param emoji: logo of the team or other emoji that should be displayed
-        :param other: additional variants of the teams name
-        :return: Added TeamnameDict or existing TeamnameDict the name variants were added to
-        :raises ValueError: if long and short name already exists but to different teams
-        """
-        if short_name is None:
-            short_name = long_name[:15]
-        if abbr is None:
-            abbr = short_name[:5].upper()
-        if emoji is None:
-            try:
-                emoji = Lang.EMOJI['lettermap'][ord(abbr[0].lower()) - 97]
-            except (IndexError, TypeError):
-                emoji = "🏳️"
-        if other is None:
-            other = []
-        existing_long = self.get(long_name)
-        existing_short = self.get(short_name)
-        if existing_long and existing_short and existing_long != existing_short:
-            raise ValueError("Long and short names already known and connected to different teams.")
-        if existing_long:
-            if long_name in existing_long.other:
-                existing_long.other.remove(long_name)
-            else:
-                # Append to existing long
-                for name in (short_name, abbr, *other):
-                    if name.lower() not in self._teamnames:
-                        existing_long.add_other(name)
-                        self._teamnames[name.lower()] = existing_long
-                existing_long.store(self.liveticker)
-                return existing_long
-        if existing_short:
-            if short_name in existing_short.other:
-                existing_short.other.remove(short_name)
-            else:
-                # Append to existing short
-                for name in (long_name, abbr, *other):
-                    if name.lower() not in self._teamnames:
-                        existing_short.add_other(name)
-                        self._teamnames[name.lower()] = existing_short
-                existing_short.store(self.liveticker)
-                return existing_short
-        # Add new
-        teamnamedict = TeamnameDict(self, long_name, short_name, abbr, emoji, other)
-        self._teamnames[long_name.lower()] = teamnamedict
-        self._teamnames[short_name.lower()] = teamnamedict
-        for name in (abbr, *other):
-            self._teamnames.setdefault(name.lower(), teamnamedict)
-        teamnamedict.store(self.liveticker)
-        return teamnamedict
-
-    def remove(self, teamnamedict: TeamnameDict):
-        """Removes a team from the converter"""
-        for name in teamnamedict:
-            if self.get(name) == teamnamedict:
-                self._teamnames.pop(name.lower())
-        Storage().get(self.liveticker, container='teamname').pop(teamnamedict.long_name)
-        Storage().save(self.liveticker, container='teamname')
-
-    def remove_other(self, teamnamedict: TeamnameDict, name: str):
-        """Removes an alternative from the team"""
-        if name in teamnamedict.other:
-            teamnamedict.other.remove(name)
-            if name.lower() in self._teamnames:
-                self._teamnames.pop(name.lower())
-            teamnamedict.store(self.liveticker)
-
-    def update(self, teamnamedict: TeamnameDict, long_name: str = None, short_name: str = None, abbr: str = None,
-               emoji: str = None) -> bool:
-        """
-        Updates name variants or emoji of the TeamnameDict
-
-        :param teamnamedict: TeamnameDict to update
-        :param long_name: new long name
-        :param short_name: new short name
-        :param abbr: new abbreviation
-        :param emoji: new emoji
-        :return: succession
-        """
-        other = teamnamedict.other
-        teamnamedict.remove()
-        if long_name:
-            other.append(teamnamedict.long_name)
-        if short_name:
-            other.append(teamnamedict.short_name)
-        try:
-            self.add(long_name=long_name if long_name else teamnamedict.long_name,
-                     short_name=short_name if short_name else teamnamedict.short_name,
-                     abbr=abbr if abbr else teamnamedict.abbr,
-                     emoji=emoji if emoji else teamnamedict.emoji,
-                     other=other)
-        except ValueError:
-            # Update failed, reenter teamnamedict
-            for name in teamnamedict:
-                if not self.get(name):
-                    self._teamnames[name.lower()] = teamnamedict
-            teamnamedict.store(self.liveticker)
-            return False
-        return True
-
-    def _restore(self):
-        data = Storage().get(self.liveticker, container='teamname')
-        for long_name, entry in data.items():
-            try:
-                self.add(long_name=str(long_name), short_name=str(entry['short']), abbr=str(entry['abbr']),
-                         emoji=str(entry['emoji']), other=[str(x) for x in entry['other']])
-            except ValueError:
-                continue
-
-
 class TableEntryBase(ABC):
     """Base class for an entry of a standings table"""
 
@@ -754,9 +524,12 @@ class LivetickerMidgame(LivetickerEvent):
     :type league: League
     """
 
-    def __init__(self, league, events_per_match: Dict[MatchBase, List[PlayerEvent]]):
+    def __init__(self, league, events_per_match: Dict[MatchBase, List[PlayerEvent]],
+                 deltas: Dict[MatchBase, "MatchDelta"] = None):
         super().__init__(league, events_per_match.keys())
         self.event_dict = events_per_match
+        self.deltas = deltas if deltas is not None else {}
+        """Changes of every match since the last update of the registration, see `MatchDelta`"""
 
 
 class LivetickerFinish(LivetickerEvent):
@@ -764,6 +537,112 @@ class LivetickerFinish(LivetickerEvent):
     pass
 
 
+class MatchDelta:
+    """
+    Changes of a match between two polls
+
+    :param match_id: id of the match
+    :param score: new score, None if unchanged
+    :param status: new status, None if unchanged
+    :param minute: new minute, None if unchanged
+    :param events: new PlayerEvents in match order
+    """
+    __slots__ = ("match_id", "score", "status", "minute", "events")
+
+    def __init__(self, match_id: str, score: Dict[str, int] = None, status: MatchStatus = None, minute: str = None,
+                 events: List[PlayerEvent] = None):
+        self.match_id = match_id
+        self.score = score
+        self.status = status
+        self.minute = minute
+        self.events = events if events is not None else []
+
+    @property
+    def persist(self) -> bool:
+        """True if the change needs to be stored; the minute alone is recalculated on every poll anyway"""
+        return self.score is not None or self.status is not None or bool(self.events)
+
+    def merge(self, other: "MatchDelta"):
+        """
+        Adds the changes of a following poll to this delta.
+
+        :param other: delta of the following poll
+        """
+        for attr in ("score", "status", "minute"):
+            if getattr(other, attr) is not None:
+                setattr(self, attr, getattr(other, attr))
+        self.events.extend(other.events)
+
+    def __bool__(self):
+        return self.persist or self.minute is not None
+
+    def __repr__(self):
+        return f"<MatchDelta(match_id={self.match_id}, score={self.score}, status={self.status}, " \
+               f"minute={self.minute}, events={[e.event_id for e in self.events]})>"
+
+
+class MatchStateStore:
+    """
+    Last known state of the matches of a LeagueRegistration. Computes the changes of every poll and keeps the ids of
+    the events that are known already; the state of a match is dropped once it is finished.
+    """
+
+    def __init__(self):
+        self.states: Dict[str, Tuple[Dict[str, int], MatchStatus, str]] = {}
+        self.event_ids: Dict[str, Set[str]] = {}
+
+    def track(self, match: MatchBase, event_ids: Iterable[str] = ()):
+        """
+        Starts tracking a match without reporting its current state as change. Known matches are left untouched.
+
+        :param match: match
+        :param event_ids: ids of the events that were reported already
+        """
+        if match.match_id in self.states:
+            return
+        self.states[match.match_id] = (dict(match.score), match.status, match.minute)
+        self.event_ids[match.match_id] = set(event_ids)
+
+    def diff(self, match: MatchBase) -> MatchDelta:
+        """
+        Compares a polled match to its last known state and updates the state.
+
+        :param match: polled match
+        :return: changes since the last poll
+        """
+        known = self.event_ids.setdefault(match.match_id, set())
+        events = []
+        for event in match.transform_events():
+            if event.event_id not in known:
+                known.add(event.event_id)
+                events.append(event)
+
+        score = dict(match.score)
+        old_score, old_status, old_minute = self.states.get(match.match_id, (None, None, None))
+        self.states[match.match_id] = (score, match.status, match.minute)
+        return MatchDelta(match.match_id,
+                          score=score if score != old_score else None,
+                          status=match.status if match.status != old_status else None,
+                          minute=match.minute if match.minute != old_minute else None,
+                          events=events)
+
+    def known_events(self, match_id: str) -> List[str]:
+        """
+        :param match_id: id of the match
+        :return: ids of the known events of the match
+        """
+        return sorted(self.event_ids.get(match_id, ()), key=str)
+
+    def prune(self, match_id: str):
+        """
+        Drops the state of a match.
+
+        :param match_id: id of the match
+        """
+        self.states.pop(match_id, None)
+        self.event_ids.pop(match_id, None)
+
+
 class CoroRegistration:
     """
     Registration for a single Coroutine, which will be notified with corresponding updates.
@@ -785,7 +664,7 @@ class CoroRegistration:
         self.l_regs = l_regs
         self.__interval = interval
         self.updates: List[LivetickerEvent] = []
-        self.last_events: Dict[str, List[str]] = {}  # List of event id's per match id
+        self.pending: Dict[str, MatchDelta] = {}  # Changes per match id since the last midgame update
         self.logger = logging.getLogger(__name__)
 
         for l_reg in self.l_regs:
@@ -858,20 +737,36 @@ class CoroRegistration:
         """Appends a LivetickerEvent to the updates"""
         self.updates.append(update)
 
-    def filter_events(self, matches: Iterable[MatchBase]) -> Dict[MatchBase, List[PlayerEvent]]:
-        """Filters new events"""
-        event_dict = {}
-        for match in matches:
-            events = match.transform_events()
-            event_dict[match] = [e for e in events if e.event_id not in self.last_events.get(match.match_id, [])]
-        return event_dict
+    def add_deltas(self, deltas: Iterable[MatchDelta]):
+        """
+        Collects the changes of a poll until the next midgame update of this registration.
+
+        :param deltas: changes of the matches
+        """
+        for delta in deltas:
+            if delta.match_id in self.pending:
+                self.pending[delta.match_id].merge(delta)
+            else:
+                self.pending[delta.match_id] = MatchDelta(delta.match_id, delta.score, delta.status, delta.minute,
+                                                          list(delta.events))
 
-    def save_events(self, event_dict: Dict[MatchBase, List[PlayerEvent]]):
-        """Saves event_ids"""
-        for match, events in event_dict.items():
-            if match.match_id not in self.last_events:
-                self.last_events[match.match_id] = []
-            self.last_events[match.match_id].extend(e.event_id for e in events)
+    def pop_deltas(self, matches: Iterable[MatchBase]) -> Dict[MatchBase, MatchDelta]:
+        """
+        Returns and forgets the collected changes of the given matches.
+
+        :param matches: matches
+        :return: changes per match; empty deltas for unchanged matches
+        """
+        return {match: self.pending.pop(match.match_id, None) or MatchDelta(match.match_id) for match in matches}
+
+    def discard_deltas(self, match_ids: Iterable[str]):
+        """
+        Forgets the collected changes of the given matches, e.g. when they are finished.
+
+        :param match_ids: match ids
+        """
+        for match_id in match_ids:
+            self.pending.pop(match_id, None)
 
     async def update(self):
         """Notifies the coroutine with the new updates"""
@@ -880,9 +775,12 @@ class CoroRegistration:
             self.updates = []
 
     def store(self):
-        """Saves the CoroRegistration to the storage"""
+        """Saves the CoroRegistration to the storage with the next storage flush of the liveticker"""
+        self.liveticker.mark_dirty(self)
+
+    def write_storage(self):
+        """Writes the CoroRegistration to the storage; called by `Liveticker.flush_storage()`"""
         Storage().get(self.liveticker)['coro_regs'][self.id] = self.to_dict()
-        Storage().save(self.liveticker)
 
     def to_dict(self):
         """Returns a dict for storing"""
@@ -926,7 +824,11 @@ class LeagueRegistrationBase(ABC):
         self.c_regs: List[CoroRegistration] = []
         self.logger = logging.getLogger(__name__)
         self.kickoffs: Dict[datetime.datetime, Dict[str, MatchBase]] = {}
-        self.finished = []
+        self.finished: Set[str] = set()
+        self.state = MatchStateStore()
+        self.deltas: Dict[str, MatchDelta] = {}  # Changes of the polls since the last dispatch
+        self._store_all = False
+        self._store_matches: Dict[str, MatchBase] = {}
 
     @property
     def intervals(self):
@@ -958,12 +860,13 @@ class LeagueRegistrationBase(ABC):
             if datetime.datetime.now() - time_kickoff > datetime.timedelta(hours=3.5):
                 l_reg.logger.debug("Discard old kickoff %s. Timed out.", raw_kickoff)
                 Storage().get(liveticker)['league_regs'][str(l_reg.league)]['kickoffs'].pop(raw_kickoff)
-                Storage().save(liveticker)
+                liveticker.mark_dirty()
                 continue
             matches = {}
             for m in matches_:
                 match = cls.get_matchclass().from_storage(m, l_reg.league.key)
                 matches[match.match_id] = match
+                l_reg.state.track(match, m.get('event_ids', []))
             l_reg.kickoffs[time_kickoff] = matches
         return l_reg
 
@@ -988,28 +891,85 @@ class LeagueRegistrationBase(ABC):
             await self.deregister()
 
     def store(self):
-        """Updates the storage in terms of the matches saved"""
+        """Updates the storage in terms of the matches saved with the next storage flush of the liveticker"""
+        self._store_all = True
+        self._store_matches.clear()
+        self.liveticker.mark_dirty(self)
+
+    def store_matches(self, matches: Iterable[MatchBase]):
+        """
+        Updates the stored entries of the given matches only with the next storage flush of the liveticker
+
+        :param matches: changed matches
+        """
+        if self._store_all:
+            return
+        for match in matches:
+            self._store_matches[match.match_id] = match
+        if self._store_matches:
+            self.liveticker.mark_dirty(self)
+
+    def write_storage(self):
+        """Writes the pending changes to the storage; called by `Liveticker.flush_storage()`"""
+        matches, self._store_matches = self._store_matches, {}
+        if not self._store_all:
+            stored = Storage().get(self.liveticker)['league_regs'][str(self.league)]['kickoffs']
+            for match in matches.values():
+                entries = stored.get(match.kickoff.strftime("%Y-%m-%d %H:%M"), [])
+                for i, entry in enumerate(entries):
+                    if entry['match_id'] == match.match_id:
+                        entries[i] = self.match_to_storage(match)
+                        break
+                else:
+                    # Storage out of sync, rewrite it
+                    self._store_all = True
+                    break
+        if not self._store_all:
+            return
+
+        self._store_all = False
         Storage().get(self.liveticker)['league_regs'][str(self.league)] = {
             "source": self.league.source.value,
             "key": self.league.key,
             "kickoffs": {}
         }
-        for kickoff, matches in self.kickoffs.items():
+        for kickoff, matches_ in self.kickoffs.items():
             Storage().get(self.liveticker)['league_regs'][str(self.league)]['kickoffs'][
-                kickoff.strftime("%Y-%m-%d %H:%M")] = [m.to_storage() for m in matches.values()]
-        Storage().save(self.liveticker)
+                kickoff.strftime("%Y-%m-%d %H:%M")] = [self.match_to_storage(m) for m in matches_.values()]
+
+    def match_to_storage(self, match: MatchBase) -> dict:
+        """
+        :param match: match
+        :return: storage dict of the match including the ids of its known events
+        """
+        r = match.to_storage()
+        r['event_ids'] = self.state.known_events(match.match_id)
+        return r
 
     async def update_matches(self):
-        """Updates and returns the matches and current standings of the league. No new matches inserted!"""
+        """
+        Updates and returns the matches of the league. No new matches inserted! The changes are collected in
+        `deltas` and only changed matches are stored.
+        """
         matches = await self.get_matches_by_date(self.league.key)
 
+        changed = []
         for match in matches:
             if match.kickoff not in self.kickoffs:
                 continue
             if match.match_id not in self.kickoffs[match.kickoff]:
                 continue
             self.kickoffs[match.kickoff][match.match_id] = match
-        self.store()
+            delta = self.state.diff(match)
+            if not delta:
+                continue
+            if match.match_id in self.deltas:
+                self.deltas[match.match_id].merge(delta)
+            else:
+                self.deltas[match.match_id] = delta
+            if delta.persist:
+                changed.append(match)
+        self.store_matches(changed)
         return self.matches
 
     @staticmethod
@@ -1047,21 +1007,27 @@ class LeagueRegistrationBase(ABC):
         :param until: datetime of the day before the next semi-weekly execution
         :raises ValueError: if source does not provide support scheduling of kickoffs
         """
-        self.kickoffs: Dict[datetime.datetime, Dict[str, MatchBase]] = {}
         now = datetime.datetime.now()
-        Storage().get(self.liveticker)['league_regs'][str(self.league)]['kickoffs'] = {}
-
         matches: List[MatchBase] = await self.get_matches_by_date(league=self.league.key, from_day=now.date(),
                                                                   until_day=until.date())
 
-        # Group by kickoff
+        # Group by kickoff; old kickoffs are kept until the request succeeded
+        kickoffs: Dict[datetime.datetime, Dict[str, MatchBase]] = {}
         for match in matches:
             if match.status in [MatchStatus.COMPLETED, MatchStatus.POSTPONED, MatchStatus.ABANDONED] \
                     or match.kickoff > until:
                 continue
-            if match.kickoff not in self.kickoffs:
-                self.kickoffs[match.kickoff] = {}
-            self.kickoffs[match.kickoff][match.match_id] = match
+            if match.kickoff not in kickoffs:
+                kickoffs[match.kickoff] = {}
+            kickoffs[match.kickoff][match.match_id] = match
+            self.state.track(match)
+        self.kickoffs = kickoffs
+        scheduled = {match_id for matches_ in kickoffs.values() for match_id in matches_}
+        pruned = [match_id for match_id in self.state.states if match_id not in scheduled]
+        for match_id in pruned:
+            self.state.prune(match_id)
+        for c_reg in self.c_regs:
+            c_reg.discard_deltas(pruned)
 
         # Store matches
         self.store()
@@ -1082,7 +1048,27 @@ class LeagueRegistrationBase(ABC):
         if not self.alive:
             return
         self.logger.debug("update_periodic_coro for kickoffs %s", kickoffs)
-        await self.update_matches()
+        with self.liveticker.storage_batch():
+            await self.update_matches()
+            do_request = self.dispatch_updates(kickoffs)
+        # Trigger update
+        for c_reg in self.c_regs:
+            await c_reg.update()
+        # Other
+        if do_request:
+            await self.liveticker.request_match_timer_update()
+
+    def dispatch_updates(self, kickoffs: Set[datetime.datetime]) -> bool:
+        """
+        Checks the current matches of the kickoffs and appends the resulting LivetickerEvents to the updates of the
+        CoroRegistrations. Does not request any data and does not notify the coroutines.
+
+        :param kickoffs: Set of kickoff datetimes; kickoffs that are done are removed
+        :return: True if a kickoff is done completely and the match timer needs to be updated
+        """
+        deltas, self.deltas = self.deltas, {}
+        for c_reg in self.c_regs:
+            c_reg.add_deltas(deltas.values())
         # Sort matches
         matches = []
         new_finished = []
@@ -1114,14 +1100,17 @@ class LeagueRegistrationBase(ABC):
                 if ((now - match.kickoff) // datetime.timedelta(minutes=1)) % c_reg.interval == 0:
                     c_reg_matches.append(match)
             if c_reg_matches:
-                event_dict = c_reg.filter_events(c_reg_matches)
-                c_reg.save_events(event_dict)
-                c_reg.append_update(LivetickerMidgame(self.league, event_dict))
+                match_deltas = c_reg.pop_deltas(c_reg_matches)
+                event_dict = {match: delta.events for match, delta in match_deltas.items()}
+                c_reg.append_update(LivetickerMidgame(self.league, event_dict, match_deltas))
         # Clear finished matches
         do_request: bool = False
         new_finished = [e for e in new_finished if e.match_id not in self.finished]  # Just to be safe
-        self.finished.extend([m.match_id for m in new_finished])
+        self.finished.update(m.match_id for m in new_finished)
+        for c_reg in self.c_regs:
+            c_reg.discard_deltas(m.match_id for m in new_finished)
         for match in new_finished:
+            self.state.prune(match.match_id)
             self.kickoffs[match.kickoff].pop(match.match_id)
             if len(self.kickoffs[match.kickoff]) == 0:
                 do_request = True
@@ -1131,12 +1120,7 @@ class LeagueRegistrationBase(ABC):
             finish_event = LivetickerFinish(self.league, new_finished)
             for c_reg in self.c_regs:
                 c_reg.append_update(finish_event)
-        # Trigger update
-        for c_reg in self.c_regs:
-            await c_reg.update()
-        # Other
-        if do_request:
-            await self.liveticker.request_match_timer_update()
+        return do_request
 
     def __str__(self):
         return f"<liveticker.LeagueRegistration; league={self.league}; " \
@@ -1150,6 +1134,7 @@ class LeagueRegistrationESPN(LeagueRegistrationBase):
     """LeagueRegistration for ESPN sources"""
 
     _source: LTSource = LTSource.ESPN
+    _cache = restclient.ResponseCache(ttl=30, ttls={"soccer/*/standings": 300}, ignore_params=("geckirandom",))
 
     @staticmethod
     async def get_matches_by_date(league: str, from_day: datetime.date = None, until_day: datetime.date = None,
@@ -1160,7 +1145,8 @@ class LeagueRegistrationESPN(LeagueRegistrationBase):
             until_day = from_day
 
         dates = f"{from_day:%Y%m%d}-{until_day:%Y%m%d}"
-        data = await restclient.Client("http://site.api.espn.com/apis/site/v2/sports") \
+        data = await restclient.Client("http://site.api.espn.com/apis/site/v2/sports",
+                                       cache=LeagueRegistrationESPN._cache) \
             .request(f"/soccer/{league}/scoreboard", params={'dates': dates,
                                                              'geckirandom': datetime.datetime.now().microsecond})
         matches = [MatchESPN(x, league) for x in data['events']]
@@ -1169,7 +1155,8 @@ class LeagueRegistrationESPN(LeagueRegistrationBase):
     @staticmethod
     async def get_standings(league: str):
         tables = {}
-        data = await restclient.Client("https://site.api.espn.com/apis/v2/sports").request(
+        data = await restclient.Client("https://site.api.espn.com/apis/v2/sports",
+                                       cache=LeagueRegistrationESPN._cache).request(
             f"/soccer/{league}/standings", params={'geckirandom': datetime.datetime.now().microsecond})
         if 'children' not in data:
             raise LeagueNotExist(f"Unable to retrieve any standings information for {league}")
@@ -1189,6 +1176,8 @@ class LeagueRegistrationOLDB(LeagueRegistrationBase):
     """LeagueRegistration for OpenLigaDB sources"""
 
     _source: LTSource = LTSource.OPENLIGADB
+    _client = restclient.Client("https://api.openligadb.de",
+                                cache=restclient.ResponseCache(ttl=30, ttls={"getbltable/*": 300}))
 
     @staticmethod
     async def get_matches_by_date(league: str, from_day: datetime.date = None, until_day: datetime.date = None,
@@ -1208,7 +1197,7 @@ class LeagueRegistrationOLDB(LeagueRegistrationBase):
         if until_day is None:
             until_day = from_day
 
-        data = await restclient.Client("https://api.openligadb.de").request(f"/getmatchdata/{league}")
+        data = await LeagueRegistrationOLDB._client.request(f"/getmatchdata/{league}")
         matches = []
         if not data:
             return []
@@ -1242,7 +1231,7 @@ class LeagueRegistrationOLDB(LeagueRegistrationBase):
         if season is None:
             date = datetime.date.today()
             season = date.year if date.month > 6 else date.year - 1
-        data = await restclient.Client("https://api.openligadb.de").request(
+        data = await LeagueRegistrationOLDB._client.request(
             f"/getmatchdata/{league}/{season}/{matchday}")
         return [MatchOLDB(m, league) for m in data]
 
@@ -1250,7 +1239,7 @@ class LeagueRegistrationOLDB(LeagueRegistrationBase):
     async def get_standings(league: str):
         tables = {}
         year = (datetime.datetime.today() - datetime.timedelta(days=180)).year
-        data = await restclient.Client("https://api.openligadb.de").request(f"/getbltable/{league}/{year}")
+        data = await LeagueRegistrationOLDB._client.request(f"/getbltable/{league}/{year}")
         table = []
         if not data:
             raise LeagueNotExist(f"Unable to retrieve any standings information for {league}")
@@ -1273,21 +1262,41 @@ class LeagueRegistrationOLDB(LeagueRegistrationBase):
         return MatchOLDB
 
 
+class _StorageBatch:
+    """Open `Liveticker.storage_batch()`; shared with the tasks that are started while it is open"""
+
+    def __init__(self):
+        self.depth = 0
+
+
+_storage_batch: ContextVar[Optional[_StorageBatch]] = ContextVar("liveticker_storage_batch", default=None)
+"""Storage batch of the current task"""
+
+
 class Liveticker(BaseSubsystem):
     """Subsystem for the registration and operation of sports livetickers"""
 
+    FETCH_CONCURRENCY = {LTSource.ESPN: 4, LTSource.OPENLIGADB: 2}
+    """Max number of leagues per source that are requested at the same time"""
+
+    FETCH_TIMEOUT = 20
+    """Seconds after which a league request is given up for the current update"""
+
     def __init__(self):
         super().__init__()
         self.bot = Config().bot
         self.logger = logging.getLogger(__name__)
         self.league_regs: Dict[League, LeagueRegistrationBase] = {}
         self.coro_regs: Dict[int, CoroRegistration] = {}
+        self._dirty = {}  # objects with pending storage changes; used as an ordered set
+        self._dirty_containers = set()
         self.teamname_converter = TeamnameConverter(self)
         self.restored = False
         self.match_timer = None
         self.__last_match_timer_update = datetime.datetime.min
         self.hourly_timer = None
         self.semiweekly_timer = None
+        self._fetch_semaphores: Dict[LTSource, asyncio.Semaphore] = {}
 
         self.update_storage()
 
@@ -1368,10 +1377,75 @@ class Liveticker(BaseSubsystem):
             Storage().get(self)['storage_version'] = 3
         Storage().save(self)
 
+    def mark_dirty(self, obj=None, container=None):
+        """
+        Buffers a change of the liveticker storage. Inside of `storage_batch()` the change is written to the storage
+        once the outermost batch of the current task ends, otherwise immediately.
+
+        :param obj: object with a `write_storage()` method that writes its state to the storage and returns the
+            changed container; None if the storage was changed directly
+        :param container: container that was changed directly, None for the main storage
+        """
+        if obj is not None:
+            self._dirty[obj] = None
+        else:
+            self._dirty_containers.add(container)
+        batch = _storage_batch.get()
+        if batch is None or not batch.depth:
+            self.flush_storage()
+
+    def discard_dirty(self, obj):
+        """
+        Drops the pending storage changes of an object, e.g. if it was removed from the storage.
+
+        :param obj: object that was passed to `mark_dirty()`
+        """
+        self._dirty.pop(obj, None)
+
+    @contextmanager
+    def storage_batch(self):
+        """
+        Context manager that buffers all storage changes and writes them at once at its end, e.g. for an update
+        cycle. Can be nested. The batch only covers the current task and the tasks it starts, so changes of unrelated
+        coroutines are still saved immediately while the batch awaits requests. Tasks that outlive the batch save
+        their changes immediately again once it is closed.
+        """
+        batch = _storage_batch.get()
+        token = None
+        if batch is None or not batch.depth:
+            batch = _StorageBatch()
+            token = _storage_batch.set(batch)
+        batch.depth += 1
+        try:
+            yield
+        finally:
+            batch.depth -= 1
+            if token is not None:
+                _storage_batch.reset(token)
+            if not batch.depth:
+                self.flush_storage()
+
+    def flush_storage(self):
+        """
+        Writes all buffered changes to the storage and saves every changed container once.
+        """
+        containers, self._dirty_containers = self._dirty_containers, set()
+        while self._dirty:
+            dirty = list(self._dirty)
+            self._dirty.clear()
+            for obj in dirty:
+                containers.add(obj.write_storage())
+        for container in containers:
+            Storage().save(self, container=container)
+
     async def restore(self):
         """
         Restores saved registrations from the storage
         """
+        with self.storage_batch():
+            await self._restore()
+
+    async def _restore(self):
         failed = 0
         # League Registrations
         for l_store in Storage().get(self)['league_regs'].values():
@@ -1407,14 +1481,15 @@ class Liveticker(BaseSubsystem):
         :type coro: function
         :return: CoroRegistration
         """
-        for league in leagues:
-            if league not in self.league_regs:
-                await self.register_league(league)
-        reg_id = max(self.coro_regs) + 1 if self.coro_regs else 1
-        c_reg = CoroRegistration(self, reg_id=reg_id, plugin=plugin, coro=coro, interval=interval,
-                                 l_regs=[self.league_regs[league] for league in leagues])
-        self.coro_regs[reg_id] = c_reg
-        c_reg.store()
+        with self.storage_batch():
+            for league in leagues:
+                if league not in self.league_regs:
+                    await self.register_league(league)
+            reg_id = max(self.coro_regs) + 1 if self.coro_regs else 1
+            c_reg = CoroRegistration(self, reg_id=reg_id, plugin=plugin, coro=coro, interval=interval,
+                                     l_regs=[self.league_regs[league] for league in leagues])
+            self.coro_regs[reg_id] = c_reg
+            c_reg.store()
         return c_reg
 
     async def register_league(self, league: League) -> LeagueRegistrationBase:
@@ -1427,14 +1502,15 @@ class Liveticker(BaseSubsystem):
         """
         if league in self.league_regs:
             return self.league_regs[league]
-        if league.source == LTSource.ESPN:
-            l_reg = await LeagueRegistrationESPN.create(self, league.key)
-        elif league.source == LTSource.OPENLIGADB:
-            l_reg = await LeagueRegistrationOLDB.create(self, league.key)
-        else:
-            raise SourceNotSupported
-        self.league_regs[league] = l_reg
-        l_reg.store()
+        with self.storage_batch():
+            if league.source == LTSource.ESPN:
+                l_reg = await LeagueRegistrationESPN.create(self, league.key)
+            elif league.source == LTSource.OPENLIGADB:
+                l_reg = await LeagueRegistrationOLDB.create(self, league.key)
+            else:
+                raise SourceNotSupported
+            self.league_regs[league] = l_reg
+            l_reg.store()
         return l_reg
 
     async def deregister_league(self, l_reg: LeagueRegistrationBase):
@@ -1515,10 +1591,11 @@ class Liveticker(BaseSubsystem):
         for l_reg in list(self.league_regs.values()):
             if not l_reg.alive:
                 self.league_regs.pop(l_reg.league)
-            else:
-                await l_reg.schedule_kickoffs(until)
-        Storage().get(self)['next_semiweekly'] = until.strftime("%Y-%m-%d %H:%M")
-        Storage().save(self)
+        with self.storage_batch():
+            await asyncio.gather(*[self._fetch(l_reg, l_reg.schedule_kickoffs(until))
+                                   for l_reg in self.league_regs.values()])
+            Storage().get(self)['next_semiweekly'] = until.strftime("%Y-%m-%d %H:%M")
+            self.mark_dirty()
 
     async def _hourly_timer_coro(self, _job):
         """
@@ -1605,16 +1682,57 @@ class Liveticker(BaseSubsystem):
                                                     data=update_minutes,
                                                     ignore_now=not from_hourly_timer)
 
+    async def _fetch(self, l_reg: LeagueRegistrationBase, coro) -> bool:
+        """
+        Awaits a request coroutine of a LeagueRegistration, limited by the source's concurrency cap and the fetch
+        timeout. Errors are logged, the LeagueRegistration keeps its previous data in that case.
+
+        :param l_reg: LeagueRegistration the request belongs to
+        :param coro: request coroutine, e.g. `l_reg.update_matches()`
+        :return: True if the request succeeded
+        """
+        # pylint: disable=broad-except
+        source = l_reg.league.source
+        if source not in self._fetch_semaphores:
+            self._fetch_semaphores[source] = asyncio.Semaphore(self.FETCH_CONCURRENCY.get(source, 1))
+        async with self._fetch_semaphores[source]:
+            try:
+                await asyncio.wait_for(coro, timeout=self.FETCH_TIMEOUT)
+            except asyncio.TimeoutError:
+                self.logger.warning("Request for %s timed out after %ds", l_reg.league, self.FETCH_TIMEOUT)
+                return False
+            except Exception as e:
+                self.logger.error("Request for %s failed: %s", l_reg.league, e, exc_info=e)
+                return False
+        return True
+
     async def _update_league_registrations(self, job):
         try:
             l_regs = job.data[(datetime.datetime.now() + datetime.timedelta(seconds=2)).minute]
         except KeyError:
             self.logger.debug("INVALID UPDATE MINUTE")
             return
-        for l_reg, kickoffs in l_regs.items():
-            if not l_reg.alive:
-                continue
-            await l_reg.update_periodic_coros(kickoffs.copy())
+        l_regs = {l_reg: kickoffs.copy() for l_reg, kickoffs in l_regs.items() if l_reg.alive}
+
+        with self.storage_batch():
+            # Fetch all leagues at once, so no league update is delayed by the requests of the others
+            await asyncio.gather(*[self._fetch(l_reg, l_reg.update_matches()) for l_reg in l_regs])
+
+            do_request = False
+            c_regs = {}
+            for l_reg, kickoffs in l_regs.items():
+                self.logger.debug("Dispatch updates of %s for kickoffs %s", l_reg.league, kickoffs)
+                if l_reg.dispatch_updates(kickoffs):
+                    do_request = True
+                c_regs.update((c_reg, None) for c_reg in l_reg.c_regs)
+
+        # Notify every coroutine once with the updates of all of its leagues
+        results = await asyncio.gather(*[c_reg.update() for c_reg in c_regs], return_exceptions=True)
+        for c_reg, result in zip(c_regs, results):
+            if isinstance(result, Exception):
+                self.logger.error("Liveticker coro %s failed", c_reg, exc_info=result)
+        if do_request:
+            await self.request_match_timer_update()
 
     @staticmethod
     async def get_standings(league: str, source: LTSource) \
@@ -3,9 +3,9 @@ This subsystem provides listeners for reactions on messages.
 """
 
 from enum import Enum
-from typing import Union, Coroutine, Callable
+from typing import Union, Coroutine, Callable, Optional, Iterable, List, Dict
 
-from nextcord import Message
+from nextcord import Message, PartialEmoji, Emoji
 
 from base.configurable import BaseSubsystem
 from base.data import Config
@@ -64,13 +64,34 @@ async def _build_reaction_event(bot, callback, payload, data, action, message=No
     return eventclass(callback, data, user, member, channel, message, payload.emoji)
 
 
+def emoji_key(emoji: Union[str, Emoji, PartialEmoji]) -> Union[int, str]:
+    """
+    :param emoji: unicode emoji, custom emoji string (`<:name:id>`) or emoji object
+    :return: The id of a custom emoji, the emoji itself for unicode emojis
+    """
+    if isinstance(emoji, str):
+        emoji = PartialEmoji.from_str(emoji)
+    if emoji.id is not None:
+        return emoji.id
+    return emoji.name
+
+
 class Registration:
     """The callback which represents a reaction listener registration"""
-    def __init__(self, listener, msg, coro, data):
+    def __init__(self, listener, msg, coro, data, emojis=None):
         self.listener = listener
         self.message = msg
         self.coro = coro
         self.data = data
+        self.emojis = None if emojis is None else frozenset(emoji_key(el) for el in emojis)
+        self.active = True
+
+    def matches(self, emoji: PartialEmoji) -> bool:
+        """
+        :param emoji: reaction emoji
+        :return: True if this registration listens for reactions with `emoji`
+        """
+        return self.emojis is None or emoji_key(emoji) in self.emojis
 
     def deregister(self):
         """Deregisters the reaction listener"""
@@ -92,10 +113,10 @@ class ReactionListener(BaseSubsystem):
     """Reaction listener service"""
     def __init__(self):
         super().__init__()
-        self.registrations = []
         self.bot = Config().bot
-        self.to_del = []
-        self._checking = False
+
+        # message id -> registrations; the inner dict is used as an ordered set
+        self._registrations: Dict[int, Dict[Registration, None]] = {}
 
         # pylint: disable=unused-variable
         @self.bot.listen()
@@ -106,36 +127,41 @@ class ReactionListener(BaseSubsystem):
         async def on_raw_reaction_remove(payload):
             await self._check(payload, ReactionAction.REMOVE)
 
-    async def _check(self, payload, action: ReactionAction):
-        for el in self.to_del:
-            if el in self.registrations:
-                self.registrations.remove(el)
-        self.to_del = []
-
-        self._checking = True
-        found = []
-        for el in self.registrations:
-            if el.message.id == payload.message_id:
-                found.append(el)
-
-        if found:
-            for el in found:
-                event = await _build_reaction_event(self.bot, el, payload, el.data, action)
-                await el.execute(event)
-
-        self._checking = False
+    @property
+    def registrations(self) -> List[Registration]:
+        """
+        :return: List of all registrations
+        """
+        return [reg for regs in self._registrations.values() for reg in regs]
 
-    def register(self, message: Message, coro: Union[Coroutine, Callable], data=None) -> Registration:
+    async def _check(self, payload, action: ReactionAction):
+        regs = self._registrations.get(payload.message_id)
+        if not regs:
+            return
+
+        found = [el for el in regs if el.matches(payload.emoji)]
+        message = None
+        for el in found:
+            # deregistered by a previous callback
+            if not el.active:
+                continue
+            event = await _build_reaction_event(self.bot, el, payload, el.data, action, message=message)
+            message = event.message
+            await el.execute(event)
+
+    def register(self, message: Message, coro: Union[Coroutine, Callable], data=None,
+                 emojis: Optional[Iterable[Union[str, Emoji, PartialEmoji]]] = None) -> Registration:
         """
         Registers a reaction event listener.
 
         :param message: Message that is observed
         :param coro: Callback coroutine that is called as await coro(event).
         :param data: Obaque object that will be part of the event object as event.data.
+        :param emojis: If set, only reactions with one of these emojis are passed to `coro`.
         :return: Callback object that can be used to unregister the listener.
         """
-        reg = Registration(self, message, coro, data)
-        self.registrations.append(reg)
+        reg = Registration(self, message, coro, data, emojis=emojis)
+        self._registrations.setdefault(message.id, {})[reg] = None
         return reg
 
     def deregister(self, registration):
@@ -144,8 +170,10 @@ class ReactionListener(BaseSubsystem):
 
         :param registration: The registration object that was returned by register()
         """
-        if self._checking:
-            self.to_del.append(registration)
-        else:
-            if registration in self.registrations:
-                self.registrations.remove(registration)
+        registration.active = False
+        regs = self._registrations.get(registration.message.id)
+        if regs is None or registration not in regs:
+            return
+        del regs[registration]
+        if not regs:
+            del self._registrations[registration.message.id]
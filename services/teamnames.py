@@ -0,0 +1,434 @@
+import heapq
+import re
+import unicodedata
+from difflib import SequenceMatcher
+from typing import Dict, List, Optional, Set, Iterable
+
+from base.data import Storage, Lang
+
+
+class TeamnameDict:
+    """
+    Set of name variants
+
+    :param converter:
+    :type converter: TeamnameConverter
+    :param long_name: longest version of the teams name
+    :param short_name: short distinct variant of the teams name
+    :param abbr: abbreviation for the team (3-5 letters)
+    :param emoji: logo of the team or other emoji that should be displayed
+    :param other: additional variants of the teams name
+    """
+
+    def __init__(self, converter, long_name: str = None, short_name: str = None, abbr: str = None, emoji: str = None,
+                 other: list = None):
+        if long_name is None:
+            self._converter = converter
+            self.long_name = None
+            self.short_name = None
+            self.abbr = None
+            self.emoji = None
+            self.other = []
+            return
+        if short_name is None:
+            short_name = long_name[:15]
+        if abbr is None:
+            abbr = short_name[:5].upper()
+        if emoji is None:
+            try:
+                emoji = Lang.EMOJI['lettermap'][ord(abbr[0].lower()) - 97]
+            except (IndexError, TypeError):
+                emoji = "🏳️"
+        if other is None:
+            other = []
+        self._converter = converter
+        self.long_name = long_name
+        self.short_name = short_name
+        self.abbr = abbr
+        self.emoji = emoji
+        self.other = other
+
+    def update(self, long_name: str = None, short_name: str = None, abbr: str = None, emoji: str = None):
+        """Updates name variants or emoji of the TeamnameDict"""
+        self._converter.update(self, long_name, short_name, abbr, emoji)
+
+    def remove(self, other_str: str = None):
+        """
+        Removes an alternative or the whole TeamnameDict
+
+        :param other_str: team name alternative
+        """
+        if other_str and other_str not in self:
+            return
+        if other_str and other_str in self.other:
+            self._converter.remove_other(self, other_str)
+        else:
+            self._converter.remove(self)
+
+    def add_other(self, other: str):
+        """Adds an alternative name for the team"""
+        if other not in self:
+            self.other.append(other)
+
+    def table_display(self) -> str:
+        """Returns string prepared for display in the table"""
+        if len(self.short_name) > 12:
+            return f"{self.emoji} `{self.short_name[:11]}\u2026`"
+        return f"{self.emoji} `{self.short_name}{' ' * (11 - len(self.short_name))}`"
+
+    def store(self, storage_path):
+        """Saves this to the storage with the next storage flush of the liveticker"""
+        storage_path.mark_dirty(self)
+
+    def write_storage(self) -> str:
+        """
+        Writes this to the liveticker storage; called by `Liveticker.flush_storage()`
+
+        :return: storage container
+        """
+        Storage().get(self._converter.liveticker, container='teamname')[self.long_name] = self.to_dict()
+        return 'teamname'
+
+    def to_dict(self):
+        return {'short': self.short_name, 'abbr': self.abbr, 'emoji': self.emoji, 'other': self.other}
+
+    def __iter__(self):
+        yield self.long_name
+        yield self.short_name
+        yield self.abbr
+        for other in self.other:
+            yield other
+
+    def __bool__(self):
+        return bool(self.long_name and self.short_name and self.abbr)
+
+
+TEAMNAME_STOPWORDS = {"fc", "cf", "sc", "sv", "ssv", "fsv", "tsv", "vfb", "vfl", "tsg", "bv", "bsc", "ac", "afc", "as",
+                      "ss", "cd", "sd", "ud", "rc", "rcd", "club", "de", "the"}
+"""Tokens that are ignored when comparing team names, e.g. club type prefixes"""
+
+TEAMNAME_ABBREVIATIONS = {"utd": "united", "bor": "borussia", "ein": "eintracht", "st": "sankt", "man": "manchester",
+                          "rb": "rasenballsport", "mgladbach": "monchengladbach"}
+"""Abbreviated tokens of team names and their expansion"""
+
+_teamname_chars = str.maketrans({"ß": "ss", "ø": "o", "æ": "ae", "œ": "oe", "ł": "l", "đ": "d", "'": None,
+                                 "\u2019": None, "`": None})
+_teamname_umlauts = re.compile(r"(?<=[aou])e")
+_teamname_separators = re.compile(r"[^a-z0-9]+")
+_teamname_qualifier = re.compile(r"^(?:i{2,3}|.*\d.*)$")
+
+
+def normalize_teamname(name: str) -> str:
+    """
+    Normalizes a team name for comparisons: diacritics and punctuation are removed, transcribed umlauts are merged,
+    abbreviations are expanded and club type prefixes and numbers (e.g. "1. FC", "04") are dropped. Reserve team
+    qualifiers like "II" or "U19" are kept.
+
+    :param name: team name
+    :return: normalized name, empty if `name` is empty
+    """
+    name = unicodedata.normalize("NFKD", name.lower().translate(_teamname_chars))
+    name = "".join(c for c in name if not unicodedata.combining(c))
+    name = _teamname_umlauts.sub("", name)
+    tokens = [TEAMNAME_ABBREVIATIONS.get(t, t) for t in _teamname_separators.split(name) if t]
+    key = [t for t in tokens if t not in TEAMNAME_STOPWORDS and not t.isdigit()]
+    # name consists of prefixes only
+    return " ".join(key if key else tokens)
+
+
+def _trigrams(key: str) -> Set[str]:
+    key = f"  {key} "
+    return {key[i:i + 3] for i in range(len(key) - 2)}
+
+
+class TeamnameIndex:
+    """
+    Lookup index over the names of a TeamnameConverter. Names are compared by their normalized form (see
+    `normalize_teamname()`); for fuzzy lookups of names typed by users, the closest normalized name is searched via
+    a trigram index and confirmed by edit distance if that is unknown. Fuzzy results are cached.
+
+    :param teamnames: dict name -> TeamnameDict as held by the TeamnameConverter
+    """
+
+    MIN_SIMILARITY = 0.85
+    """Min edit distance ratio of a fuzzy match"""
+
+    MIN_MARGIN = 0.05
+    """Min distance in similarity between the best and the second best team of a fuzzy match"""
+
+    CANDIDATES = 8
+    """Number of trigram candidates whose edit distance is compared"""
+
+    CACHE_SIZE = 4096
+
+    def __init__(self, teamnames: Dict[str, TeamnameDict]):
+        self.keys: Dict[str, Optional[TeamnameDict]] = {}  # None if the key is ambiguous
+        self.trigrams: Dict[str, List[str]] = {}
+        self.grams: Dict[str, Set[str]] = {}
+        self._cache: Dict[str, Optional[TeamnameDict]] = {}
+
+        for name, teamnamedict in teamnames.items():
+            self.add(name, teamnamedict)
+
+    def add(self, name: str, teamnamedict: TeamnameDict):
+        """
+        Adds a name to the index.
+
+        :param name: team name
+        :param teamnamedict: TeamnameDict the name belongs to
+        """
+        key = normalize_teamname(name)
+        if not key:
+            return
+        self._cache.clear()
+        if key in self.keys:
+            if self.keys[key] is not teamnamedict:
+                self.keys[key] = None
+            return
+        self.keys[key] = teamnamedict
+        self.grams[key] = _trigrams(key)
+        for trigram in self.grams[key]:
+            self.trigrams.setdefault(trigram, []).append(key)
+
+    def find(self, name: str, fuzzy: bool = False) -> Optional[TeamnameDict]:
+        """
+        :param name: team name
+        :param fuzzy: if the normalized name is unknown, search for the closest one
+        :return: TeamnameDict with the same normalized name or, if `fuzzy` is set, the closest one; None if there is
+            none or the name is ambiguous
+        """
+        key = normalize_teamname(name)
+        if key in self.keys:
+            return self.keys[key]
+        if not fuzzy:
+            return None
+        if key in self._cache:
+            return self._cache[key]
+        r = self._find_similar(key)
+        if len(self._cache) >= self.CACHE_SIZE:
+            self._cache.clear()
+        self._cache[key] = r
+        return r
+
+    def _find_similar(self, key: str) -> Optional[TeamnameDict]:
+        if not key:
+            return None
+        trigrams = _trigrams(key)
+
+        # a similar name shares most trigrams, so it shares one of the rarer half as well
+        rare = sorted(trigrams, key=lambda trigram: len(self.trigrams.get(trigram, ())))[:len(trigrams) // 2 + 1]
+        candidates = {other for trigram in rare for other in self.trigrams.get(trigram, ())}
+        # dice coefficient of the trigram sets
+        candidates = heapq.nlargest(self.CANDIDATES, candidates,
+                                    key=lambda other: len(trigrams & self.grams[other]) / (len(trigrams) +
+                                                                                          len(self.grams[other])))
+
+        # reserve team qualifiers and tokens with numbers have to be equal, e.g. "Hertha II" is not "Hertha"
+        qualifiers = {t for t in key.split() if _teamname_qualifier.match(t)}
+        matcher = SequenceMatcher(None, b=key)
+        scores = []
+        for other in candidates:
+            if self.keys[other] is None or qualifiers != {t for t in other.split() if _teamname_qualifier.match(t)}:
+                continue
+            matcher.set_seq1(other)
+            if matcher.real_quick_ratio() >= self.MIN_SIMILARITY and matcher.quick_ratio() >= self.MIN_SIMILARITY:
+                scores.append((matcher.ratio(), other))
+        scores.sort(reverse=True)
+
+        if not scores or scores[0][0] < self.MIN_SIMILARITY:
+            return None
+        best = self.keys[scores[0][1]]
+        for score, other in scores[1:]:
+            if scores[0][0] - score >= self.MIN_MARGIN:
+                break
+            if self.keys[other] is not best:
+                return None
+        return best
+
+
+class TeamnameConverter:
+    """
+    Class for the conversion between team names
+
+    :param liveticker: liveticker class
+    """
+
+    def __init__(self, liveticker):
+        self.liveticker = liveticker
+        self._teamnames = {}
+        self._index: Optional[TeamnameIndex] = None
+        self._restore()
+
+    @property
+    def index(self) -> TeamnameIndex:
+        """Lookup index of the known names; rebuilt after changes"""
+        if self._index is None:
+            self._index = TeamnameIndex(self._teamnames)
+        return self._index
+
+    def get(self, team: str, add_if_nonexist: bool = False, fuzzy: bool = False) -> TeamnameDict:
+        """
+        Returns the saved TeamnameDict for the given team name or adds a new entry if wanted
+
+        :param team: name of the team
+        :param add_if_nonexist: if the team name is unknown yet and this is true, a new entry will be added
+        :param fuzzy: if the team name is unknown, search for a team with the same normalized or a similar name (see
+            `TeamnameIndex`). Only meant for names typed by users, as unknown teams are resolved to similar ones;
+            names from the data sources are matched exactly.
+        :return: associated TeamnameDict
+        """
+        teamnamedict = self._teamnames.get(team.lower())
+        if teamnamedict is None and fuzzy:
+            teamnamedict = self.index.find(team, fuzzy=True)
+        if teamnamedict is None:
+            if add_if_nonexist:
+                return self.add(team)
+            return TeamnameDict(self)
+        return teamnamedict
+
+    def get_many(self, teams: Iterable[str], add_if_nonexist: bool = False,
+                 fuzzy: bool = False) -> Dict[str, TeamnameDict]:
+        """
+        Resolves a batch of team names, e.g. of a match list or a sheet column. Every distinct name is looked up
+        once; added teams are stored together.
+
+        :param teams: team names; empty names are skipped
+        :param add_if_nonexist: if a team name is unknown yet and this is true, a new entry will be added
+        :param fuzzy: search for similar names if a name is unknown, see `get()`
+        :return: dict team name -> associated TeamnameDict
+        """
+        r = {}
+        with self.liveticker.storage_batch():
+            for team in teams:
+                if team and team not in r:
+                    r[team] = self.get(team, add_if_nonexist=add_if_nonexist, fuzzy=fuzzy)
+        return r
+
+    def add(self, long_name: str, short_name: str = None, abbr: str = None, emoji: str = None,
+            other: Iterable[str] = None) -> TeamnameDict:
+        """
+        Adds a new data set for a team to the converter.
+
+        :param long_name: longest version of the teams name
+        :param short_name: short distinct variant of the teams name
+        :param abbr: abbreviation for the team (3-5 letters)
+        :param emoji: logo of the team or other emoji that should be displayed
+        :param other: additional variants of the teams name
+        :return: Added TeamnameDict or existing TeamnameDict the name variants were added to
+        :raises ValueError: if long and short name already exists but to different teams
+        """
+        if short_name is None:
+            short_name = long_name[:15]
+        if abbr is None:
+            abbr = short_name[:5].upper()
+        if emoji is None:
+            try:
+                emoji = Lang.EMOJI['lettermap'][ord(abbr[0].lower()) - 97]
+            except (IndexError, TypeError):
+                emoji = "🏳️"
+        if other is None:
+            other = []
+        existing_long = self._teamnames.get(long_name.lower())
+        existing_short = self._teamnames.get(short_name.lower())
+        if existing_long and existing_short and existing_long != existing_short:
+            raise ValueError("Long and short names already known and connected to different teams.")
+        if existing_long:
+            if long_name in existing_long.other:
+                existing_long.other.remove(long_name)
+            else:
+                # Append to existing long
+                for name in (short_name, abbr, *other):
+                    if name.lower() not in self._teamnames:
+                        existing_long.add_other(name)
+                        self._teamnames[name.lower()] = existing_long
+                existing_long.store(self.liveticker)
+                return self._indexed(existing_long)
+        if existing_short:
+            if short_name in existing_short.other:
+                existing_short.other.remove(short_name)
+            else:
+                # Append to existing short
+                for name in (long_name, abbr, *other):
+                    if name.lower() not in self._teamnames:
+                        existing_short.add_other(name)
+                        self._teamnames[name.lower()] = existing_short
+                existing_short.store(self.liveticker)
+                return self._indexed(existing_short)
+        # Add new
+        teamnamedict = TeamnameDict(self, long_name, short_name, abbr, emoji, other)
+        self._teamnames[long_name.lower()] = teamnamedict
+        self._teamnames[short_name.lower()] = teamnamedict
+        for name in (abbr, *other):
+            self._teamnames.setdefault(name.lower(), teamnamedict)
+        teamnamedict.store(self.liveticker)
+        return self._indexed(teamnamedict)
+
+    def _indexed(self, teamnamedict: TeamnameDict) -> TeamnameDict:
+        """Adds the names of an added or extended TeamnameDict to the index if it is built already"""
+        if self._index is not None:
+            for name in teamnamedict:
+                self._index.add(name, teamnamedict)
+        return teamnamedict
+
+    def remove(self, teamnamedict: TeamnameDict):
+        """Removes a team from the converter"""
+        self._index = None
+        for name in teamnamedict:
+            if self._teamnames.get(name.lower()) == teamnamedict:
+                self._teamnames.pop(name.lower())
+        self.liveticker.discard_dirty(teamnamedict)
+        Storage().get(self.liveticker, container='teamname').pop(teamnamedict.long_name, None)
+        self.liveticker.mark_dirty(container='teamname')
+
+    def remove_other(self, teamnamedict: TeamnameDict, name: str):
+        """Removes an alternative from the team"""
+        if name in teamnamedict.other:
+            self._index = None
+            teamnamedict.other.remove(name)
+            if name.lower() in self._teamnames:
+                self._teamnames.pop(name.lower())
+            teamnamedict.store(self.liveticker)
+
+    def update(self, teamnamedict: TeamnameDict, long_name: str = None, short_name: str = None, abbr: str = None,
+               emoji: str = None) -> bool:
+        """
+        Updates name variants or emoji of the TeamnameDict
+
+        :param teamnamedict: TeamnameDict to update
+        :param long_name: new long name
+        :param short_name: new short name
+        :param abbr: new abbreviation
+        :param emoji: new emoji
+        :return: succession
+        """
+        other = teamnamedict.other
+        teamnamedict.remove()
+        if long_name:
+            other.append(teamnamedict.long_name)
+        if short_name:
+            other.append(teamnamedict.short_name)
+        try:
+            self.add(long_name=long_name if long_name else teamnamedict.long_name,
+                     short_name=short_name if short_name else teamnamedict.short_name,
+                     abbr=abbr if abbr else teamnamedict.abbr,
+                     emoji=emoji if emoji else teamnamedict.emoji,
+                     other=other)
+        except ValueError:
+            # Update failed, reenter teamnamedict
+            self._index = None
+            for name in teamnamedict:
+                if not self._teamnames.get(name.lower()):
+                    self._teamnames[name.lower()] = teamnamedict
+            teamnamedict.store(self.liveticker)
+            return False
+        return True
+
+    def _restore(self):
+        data = Storage().get(self.liveticker, container='teamname')
+        with self.liveticker.storage_batch():
+            for long_name, entry in list(data.items()):
+                try:
+                    self.add(long_name=str(long_name), short_name=str(entry['short']), abbr=str(entry['abbr']),
+                             emoji=str(entry['emoji']), other=[str(x) for x in entry['other']])
+                except ValueError:
+                    continue
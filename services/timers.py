@@ -4,16 +4,18 @@ periodically or only once.
 """
 
 from copy import deepcopy
+from bisect import bisect_left
 from calendar import monthrange
 import asyncio
+import heapq
+import itertools
 import logging
-import struct
 import datetime
-from typing import Optional, Union, List, Any, Awaitable, Callable, Coroutine
+from typing import Optional, Union, List, Tuple, Any, Awaitable, Callable, Coroutine
 
 from base.configurable import BaseSubsystem
 from base.data import Config
-from botutils.utils import write_debug_channel, execute_anything_sync, execute_anything, log_exception
+from botutils.utils import execute_anything_sync, execute_anything, log_exception
 
 timedictformat = ["year", "month", "monthday", "weekday", "hour", "minute"]
 
@@ -37,15 +39,27 @@ class Mothership(BaseSubsystem):
     The timer subsystem allows for a periodic or singular coroutine to be scheduled based
      on a time distance or a calendar-oriented schedule.
 
+    All jobs share a single scheduler task that sleeps until the earliest due job. Jobs that are due at the same
+    time are woken up together.
+
     Timers do not survive bot restarts.
     """
 
+    MAX_SLEEP = 3600
+
     def __init__(self):
         BaseSubsystem.__init__(self)
         self.bot = Config().bot
         self.jobs = []
         self.logger = logging.getLogger(__name__)
 
+        # heap entries are [next_exec, seq, job]; cancelled entries get their job set to None and are skipped
+        self._heap = []
+        self._seq = itertools.count()
+        self._dead = 0
+        self._wakeup = asyncio.Event()
+        self._task = None
+
     def schedule(self, coro: Union[Coroutine, Callable], td: dict,
                  data: Any = None, repeat: bool = True, ignore_now: bool = False):
         """
@@ -63,15 +77,89 @@ class Mothership(BaseSubsystem):
         td = normalize_td(td)
         if next_occurence(td) is None:
             raise NoFutureExec("td {} is in the past".format(td))
-        job = Job(td, coro, data=data, repeat=repeat, ignore_now=ignore_now)
+        job = Job(td, coro, data=data, repeat=repeat, ignore_now=ignore_now, run=False)
         self.logger.info("Scheduling %s", job)
         self.jobs.append(job)
+        job.start()
         return job
 
     def remove(self, job):
         self.logger.debug("Removing job %s", job)
         self.jobs.remove(job)
 
+    def push(self, job, next_exec: datetime.datetime):
+        """
+        Inserts a job into the scheduler heap. Replaces a previous heap entry of the job.
+
+        :param job: Job to be scheduled
+        :param next_exec: Time of the job's next execution
+        """
+        self.drop(job)
+        entry = [next_exec, next(self._seq), job]
+        job.heap_entry = entry
+        heapq.heappush(self._heap, entry)
+        if self._heap[0] is entry:
+            self._wakeup.set()
+        if self._task is None or self._task.done():
+            self._task = execute_anything_sync(self._run())
+
+    def drop(self, job):
+        """
+        Removes a job from the scheduler heap. The heap entry is only marked as dead and skipped later on.
+
+        :param job: Job to be removed
+        """
+        entry = job.heap_entry
+        if entry is None:
+            return
+        entry[2] = None
+        job.heap_entry = None
+        self._dead += 1
+
+        # compact when the heap consists mostly of dead entries
+        if self._dead > 64 and self._dead > len(self._heap) // 2:
+            self._heap = [el for el in self._heap if el[2] is not None]
+            heapq.heapify(self._heap)
+            self._dead = 0
+
+    def _pop_due(self, now: datetime.datetime) -> list:
+        """
+        :param now: current time
+        :return: List of all jobs that are due at `now`
+        """
+        r = []
+        while self._heap and self._heap[0][0] <= now:
+            _, _, job = heapq.heappop(self._heap)
+            if job is None:
+                self._dead -= 1
+                continue
+            job.heap_entry = None
+            r.append(job)
+        return r
+
+    async def _run(self):
+        """
+        Scheduler task; sleeps until the next job is due, executes all due jobs and repeats.
+        """
+        while True:
+            self._wakeup.clear()
+            now = datetime.datetime.now()
+            due = self._pop_due(now)
+            if due:
+                self.logger.debug("Waking up %d jobs", len(due))
+            for job in due:
+                execute_anything_sync(job.fire())
+
+            if not self._heap:
+                await self._wakeup.wait()
+                continue
+
+            tts = min((self._heap[0][0] - now).total_seconds(), self.MAX_SLEEP)
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=max(tts, 0))
+            except asyncio.TimeoutError:
+                pass
+
 
 class Job:
     """The scheduled Job representation"""
@@ -84,22 +172,19 @@ class Job:
         :param td: Timedict that specifies the execution schedule
         :param data: Opaque object that is set as job.data
         :param repeat: If set to False, the job runs only once.
-        :param run: Set to False to not automatically start this job
+        :param run: Set to False to not automatically start this job; start it with `start()`.
         :param ignore_now: If set to True, the timer is not executed in the current minute.
         :raises RuntimeError: raised if td is in the past
         """
         self.logger = logging.getLogger(__name__)
         self.bot = Config().bot
         self._timedict = normalize_td(td)
+        self._compiled = CompiledTimedict(self._timedict)
         self._cancelled = False
         self._coro = f
         self._repeat = repeat
-        self._passthrough = False
         self._ignore_now = ignore_now
-
-        self._timer = None
-        self._lock = asyncio.Lock()
-        self._task = None
+        self._finished = False
 
         """
         Opaque value guaranteed to never be overwritten.
@@ -110,11 +195,14 @@ class Job:
         self._is_scheduled = False
         self._last_tts = 0
 
-        self._cached_next_exec = next_occurence(self._timedict, ignore_now=ignore_now)
+        self._cached_next_exec = next_occurence(self._compiled, ignore_now=ignore_now)
         self._last_exec = None
 
+        # Scheduler heap entry; managed by Mothership
+        self.heap_entry = None
+
         if run:
-            self._task = execute_anything_sync(self._loop())
+            self.start()
 
     @property
     def timedict(self):
@@ -130,6 +218,12 @@ class Job:
     def is_scheduled(self):
         return self._is_scheduled
 
+    def start(self):
+        """
+        Inserts this job into the scheduler.
+        """
+        self._schedule(ignore_now=self._ignore_now)
+
     def cancel(self):
         """
         Cancels the job
@@ -139,59 +233,58 @@ class Job:
             raise RuntimeError("Already cancelled")
         self.logger.info("Cancelling %s", self)
         self._cancelled = True
-        self._timer.cancel()
-        self._lock.release()
+        self._finish()
 
-    def loop_cb(self):
-        self._lock.release()
+    def _schedule(self, ignore_now: bool = True):
+        """
+        Calculates the next execution and inserts this job into the scheduler heap. Finishes the job if there is no
+        next execution.
 
-    async def _loop(self):
-        await self._lock.acquire()
-        first = True
-        while True:
-            # pylint: disable=broad-except
-            ignore_now = True
-            if first:
-                ignore_now = self._ignore_now
-                first = False
-            next_exec = self.next_execution(ignore_now=ignore_now)
-            if next_exec is None:
-                break
-
-            tts = (next_exec - datetime.datetime.now()).total_seconds()
-            self._last_tts = int(tts)
-            self.logger.debug("Scheduling job for %s", next_exec)
-
-            # check if tts is too big
-            bitness = struct.calcsize("P") * 8
-            if 2 ** (bitness - 3) < (365 * 24 * (60/2) * (60/2)):
-                await write_debug_channel("Unable to sleep for {} years; job: {}"
-                                          .format(next_exec.year, self))
-                break
-
-            # Schedule
-            self._is_scheduled = True
-            self._timer = Timer(self.bot, tts, self.loop_cb)
-            self.logger.debug("Sleeping %d seconds, that's roughly %d days", tts, self._last_tts // (60*60*24))
-            if not self._passthrough:
-                await self._lock.acquire()
-            self._passthrough = False
-            if self._cancelled:
-                self.logger.debug("Job was cancelled, cancelling loop")
-                break
-            self.logger.debug("Executing job %s", self)
-            try:
-                await execute_anything(self._coro, self)
-            except Exception as e:
-                fields = {
-                    "timedict": self._timedict
-                }
-                await log_exception(e, title=":x: Timer error (scheduled)", fields=fields)
-            if not self._repeat:
-                break
+        :param ignore_now: Ignores the current minute
+        """
+        next_exec = self.next_execution(ignore_now=ignore_now)
+        if next_exec is None:
+            self._finish()
+            return
 
+        self._last_tts = int((next_exec - datetime.datetime.now()).total_seconds())
+        self.logger.debug("Scheduling job for %s, that's roughly %d days", next_exec, self._last_tts // (60*60*24))
+        self._is_scheduled = True
+        self.bot.timers.push(self, next_exec)
+
+    def _finish(self):
+        """
+        Removes this job from the scheduler and the mothership's job list.
+        """
+        self.bot.timers.drop(self)
         self._is_scheduled = False
-        self.bot.timers.remove(self)
+        if not self._finished:
+            self._finished = True
+            self.bot.timers.remove(self)
+
+    async def fire(self):
+        """
+        Is called by the scheduler when this job is due. Executes the job coroutine and reschedules the job.
+        """
+        # pylint: disable=broad-except
+        if self._cancelled:
+            return
+        self.logger.debug("Executing job %s", self)
+        self._last_exec = datetime.datetime.now()
+        try:
+            await execute_anything(self._coro, self)
+        except Exception as e:
+            fields = {
+                "timedict": self._timedict
+            }
+            await log_exception(e, title=":x: Timer error (scheduled)", fields=fields)
+
+        if self._cancelled or self._finished:
+            return
+        if not self._repeat:
+            self._finish()
+            return
+        self._schedule()
 
     def execute(self):
         """
@@ -199,8 +292,8 @@ class Job:
         """
         self.logger.debug("Executing job %s ahead of schedule", self)
         execute_anything_sync(self._coro, self)
-        if not self._repeat and self._timer:
-            self._timer.cancel()
+        if not self._repeat:
+            self._finish()
 
     def next_execution(self, ignore_now: bool = True) -> Optional[datetime.datetime]:
         """
@@ -214,7 +307,7 @@ class Job:
         delta = datetime.timedelta(seconds=10)
         if self._cached_next_exec is None or self._cached_next_exec - now < delta:
             self.logger.debug("Next occurence cache invalid")
-            self._cached_next_exec = next_occurence(self._timedict, now=now + delta, ignore_now=ignore_now)
+            self._cached_next_exec = next_occurence(self._compiled, now=now + delta, ignore_now=ignore_now)
         self.logger.debug("Next execution: %s", self._cached_next_exec)
         return self._cached_next_exec
 
@@ -364,112 +457,144 @@ def ring_iterator(haystack: list, startel: int, ringstart: int, ringend: int, st
         i += 1
 
 
-def next_occurence(ntd: dict,
+class CompiledTimedict:
+    """
+    Normalized timedict that is precompiled into sorted value tuples and day bitmasks for fast calculation of
+    the next occurence.
+    """
+
+    # The gregorian calendar repeats itself every 400 years
+    CYCLE = 400
+
+    def __init__(self, ntd: dict):
+        """
+        :param ntd: normalized timedict
+        """
+        self.ntd = ntd
+        self.years = None if ntd["year"] is None else tuple(sorted(set(ntd["year"])))
+        self.months = self._sorted(ntd["month"], 1, 12)
+        self.hours = self._sorted(ntd["hour"], 0, 23)
+        self.minutes = self._sorted(ntd["minute"], 0, 59)
+
+        # bit d is set for every matching day of month d
+        days = range(1, 32) if ntd["monthday"] is None else ntd["monthday"]
+        monthday_mask = 0
+        for day in days:
+            if 1 <= day <= 31:
+                monthday_mask |= 1 << day
+
+        # one day mask per weekday of the first of the month (0 = monday)
+        weekdays = range(1, 8) if not ntd["weekday"] else ntd["weekday"]
+        self.day_masks = []
+        for first in range(7):
+            mask = 0
+            for day in range(1, 32):
+                if (first + day - 1) % 7 + 1 in weekdays:
+                    mask |= 1 << day
+            self.day_masks.append(mask & monthday_mask)
+
+    @staticmethod
+    def _sorted(values, start, end) -> tuple:
+        if values is None:
+            return tuple(range(start, end + 1))
+        return tuple(sorted(el for el in set(values) if start <= el <= end))
+
+    def day_mask(self, year: int, month: int) -> int:
+        """
+        :param year: year
+        :param month: month
+        :return: Bitmask of all matching days in the given month; bit d represents day d.
+        """
+        first, length = monthrange(year, month)
+        return self.day_masks[first] & ((1 << (length + 1)) - 1)
+
+    def time_on_day(self, hour: int, minute: int) -> Optional[Tuple[int, int]]:
+        """
+        :param hour: earliest hour
+        :param minute: earliest minute in `hour`
+        :return: First matching `(hour, minute)` at or after `hour:minute`; None if there is none on this day
+        """
+        i = bisect_left(self.hours, hour)
+        if i < len(self.hours) and self.hours[i] == hour:
+            j = bisect_left(self.minutes, minute)
+            if j < len(self.minutes):
+                return hour, self.minutes[j]
+            i += 1
+        if i < len(self.hours) and self.minutes:
+            return self.hours[i], self.minutes[0]
+        return None
+
+    def years_from(self, year: int):
+        """
+        :param year: first year
+        :return: Iterable over all candidate years starting from `year`
+        """
+        if self.years is not None:
+            return self.years[bisect_left(self.years, year):]
+        return range(year, year + self.CYCLE + 1)
+
+
+def compile_td(td: Union[dict, CompiledTimedict]) -> CompiledTimedict:
+    """
+    Compiles a normalized timedict. Compiled timedicts are passed through.
+
+    :param td: normalized timedict or CompiledTimedict
+    :return: CompiledTimedict that corresponds to td
+    """
+    if isinstance(td, CompiledTimedict):
+        return td
+    return CompiledTimedict(td)
+
+
+def lowest_bit(mask: int, start: int) -> int:
+    """
+    :param mask: bitmask
+    :param start: lowest bit index to consider
+    :return: Index of the lowest set bit >= `start` in `mask`; 0 if there is none.
+    """
+    mask = mask >> start << start
+    return (mask & -mask).bit_length() - 1 if mask else 0
+
+
+def next_occurence(ntd: Union[dict, CompiledTimedict],
                    now: Optional[datetime.datetime] = None, ignore_now: bool = False) -> Optional[datetime.datetime]:
     """
     Takes a normalized timedict and returns a datetime object that represents the next occurence of said timedict,
     taking now as starting point.
 
-    :param ntd: normalized timedict
+    :param ntd: normalized timedict or CompiledTimedict
     :param now: datetime.datetime object from which to calculate; omit for current time
     :param ignore_now: If `True`: If the next occurence would be right now, returns the next occurence instead.
     :return: datetime.datetime object that marks the next occurence; `None` if there is none
     """
-    logger = logging.getLogger(__name__)
-    logger.debug("Called next_occurence with ntd %s; now: %s; ignore_now: %s", ntd, now, ignore_now)
+    ctd = compile_td(ntd)
     if now is None:
         now = datetime.datetime.now()
-
     if ignore_now:
         now += datetime.timedelta(minutes=1)
 
-    weekdays = ntd["weekday"]
-    if not weekdays:
-        weekdays = list(range(1, 8))
-
-    # Find date
-    startmonth = nearest_element(now.month, ntd["month"], 1, 12)
-    startday = 1
-    if startmonth == now.month:
-        startday = now.day
-    for month, year in ring_iterator(ntd["month"], startmonth, 1, 12, now.year):
-        logger.debug("Checking %d-%d", year, month)
-
-        # Check if we're in the past
-        if year < now.year or (year == now.year and month < now.month):
-            logger.debug("We're in the past")
-            continue
-
-        # Check if this year is in the years list and if there even is a year in the future to be had
-        if ntd["year"] is not None and year not in ntd["year"]:
-            logger.debug("year: %d; ntd[year]: %s", year, ntd["year"])
-            startmonth = 1
-            startday = 1
-            for el in ntd["year"]:
-                if el > year:
-                    break  # Wait for better years
-            else:
-                logger.debug("No future occurence found")
-                return None  # No future occurence found
-            continue
-
-        # Find day in month
-        for day in range(startday, monthrange(year, month)[1] + 1):
-            logger.debug("Checking day %d", day)
-            # Not our day of week
-            if not datetime.date(year, month, day).weekday() + 1 in weekdays:
+    for year in ctd.years_from(now.year):
+        for month in ctd.months:
+            if year == now.year and month < now.month:
                 continue
-
-            # Not our day of month
-            if ntd["monthday"] is not None and day not in ntd["monthday"]:
+            mask = ctd.day_mask(year, month)
+            if not mask:
                 continue
 
-            # Find hour and minute
-            starthour = 0
-            startminute = 0
-            onthisday = True
-
-            # Today
-            if year == now.year and month == now.month and day == now.day:
-                starthour = now.hour
-
-            # find hour
-            hour = None
-            minute = None
-            next_hour = nearest_element(starthour, ntd["hour"], 0, 23)
-            if next_hour < starthour:
-                logger.debug("next_hour %d < starthour %d", next_hour, starthour)
-                continue
-            for hour, day_d in ring_iterator(ntd["hour"], next_hour, 0, 23, 0):
-                logger.debug("Checking hour %d", hour)
-                # day wraparound
-                if day_d > 0:
-                    logger.debug("Next day (wraparound)")
-                    onthisday = False
-                    break
-
-                # find minute
-                if year == now.year and month == now.month and day == now.day and hour == now.hour:
-                    startminute = now.minute
-
-                minute = nearest_element(startminute, ntd["minute"], 0, 59)
-                logger.debug("Checking minute %d", minute)
-                if minute < startminute:
-                    logger.debug("minute %d < startminute %d", minute, startminute)
-                    startminute = 0
-                    continue
-                logger.debug("Correct minute found: %d", minute)
-                break  # correct minute found
-
-            if onthisday:
-                return datetime.datetime(year, month, day, hour, minute)
-            # Nothing found on this day of the month
-            continue
-
-        # Month is over
-        startday = 1
+            # today
+            startday = 1
+            if year == now.year and month == now.month:
+                if mask >> now.day & 1:
+                    time = ctd.time_on_day(now.hour, now.minute)
+                    if time is not None:
+                        return datetime.datetime(year, month, now.day, *time)
+                startday = now.day + 1
+
+            # any later day
+            day = lowest_bit(mask, startday)
+            if day and ctd.hours and ctd.minutes:
+                return datetime.datetime(year, month, day, ctd.hours[0], ctd.minutes[0])
 
-    logger.warning("Yes, this line happens and can be removed. If it doesn't, we should raise a RuntimeError here.")
     return None
 
 
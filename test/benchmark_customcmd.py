@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Benchmarks rendering throughput of custom cmd texts.
+
+Usage: python3 test/benchmark_customcmd.py [iterations]
+"""
+
+# pylint: disable=import-error,wrong-import-position
+
+import sys
+import timeit
+
+sys.path.append(".")
+sys.path.append("..")
+from plugins.customcmd import TextTemplate, cmd_re
+
+TEXTS = [
+    "%u hugs %1",
+    "%um slaps %1 around a bit with a large trout",
+    "%1 and %2 are sitting in a tree, %a",
+    "%1 says: %2*",
+    "https://example.com/some/meme/image.gif",
+]
+ARGS = cmd_re.findall("Gecki \"some quoted arg\" and more args")
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    templates = [TextTemplate(t) for t in TEXTS]
+
+    def compile_and_render():
+        for t in TEXTS:
+            TextTemplate(t).render("<@1>", "user", ARGS)
+
+    def render_compiled():
+        for t in templates:
+            t.render("<@1>", "user", ARGS)
+
+    for name, f in (("compile + render", compile_and_render), ("render precompiled", render_compiled)):
+        duration = timeit.timeit(f, number=iterations)
+        renders = iterations * len(TEXTS)
+        print("{:<20} {:>10.0f} renders/s ({:.2f} us/render)".format(
+            name, renders / duration, duration / renders * 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Benchmarks DM listener operations with many concurrent registrations.
+
+Usage: python3 test/benchmark_dmlisteners.py [registrations] [iterations]
+"""
+
+# pylint: disable=import-error,wrong-import-position
+
+import asyncio
+import sys
+import timeit
+from types import SimpleNamespace
+
+sys.path.append(".")
+sys.path.append("..")
+from services.dmlisteners import DMListener
+
+
+async def callback(_registration, _message):
+    """DM listener coro that does nothing"""
+
+
+async def kill():
+    """Kill coro that does nothing"""
+
+
+def main():
+    """Registers the listeners and measures the operations"""
+    registrations = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+    listener = DMListener()
+    users = [SimpleNamespace(id=i) for i in range(registrations + 1)]
+    for user in users[:-1]:
+        listener.register(user, callback, "benchmark", kill_coro=kill, blocking=user.id % 2 == 0)
+
+    registered = SimpleNamespace(author=users[registrations // 2])
+    unregistered = SimpleNamespace(author=users[-1])
+    loop = asyncio.new_event_loop()
+
+    def register_deregister():
+        listener.register(users[-1], callback, "benchmark", kill_coro=kill).deregister()
+
+    def lookups():
+        listener.is_registered(users[-1])
+        listener.is_blocked(users[registrations // 2])
+
+    def handle_registered():
+        loop.run_until_complete(listener.handle_dm(registered))
+
+    def handle_unregistered():
+        loop.run_until_complete(listener.handle_dm(unregistered))
+
+    print("{} registrations".format(registrations))
+    for name, f in (("register + deregister", register_deregister), ("is_registered + is_blocked", lookups),
+                    ("handle_dm (registered)", handle_registered),
+                    ("handle_dm (unregistered)", handle_unregistered)):
+        duration = timeit.timeit(f, number=iterations)
+        print("{:<28} {:>10.0f} ops/s ({:.2f} us/op)".format(name, iterations / duration,
+                                                             duration / iterations * 1e6))
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Simulates a liveticker matchday and counts the storage writes it causes, with the storage changes of every update
+cycle batched (default behavior) and with every change saved immediately.
+Match data is generated locally, no requests are made.
+
+Usage: python3 test/benchmark_liveticker.py [leagues] [matches per league] [minutes]
+"""
+
+# pylint: disable=import-error,wrong-import-position,protected-access
+
+import asyncio
+import contextlib
+import datetime
+import json
+import os
+import random
+import sys
+import tempfile
+from types import SimpleNamespace
+
+sys.path.append(".")
+sys.path.append("..")
+from base.data import Config, Storage, WriteBehind, ConfigurableData
+from botutils import jsonutils
+from services import liveticker
+from services.liveticker import Liveticker, League, LTSource, LeagueRegistrationOLDB
+
+
+class Counter:
+    """Counts storage saves and written bytes"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Sets all counts back to 0"""
+        self.saves = 0
+        self.save_bytes = 0
+        self.disk_writes = 0
+        self.disk_bytes = 0
+
+    @contextlib.contextmanager
+    def patch(self):
+        """Context manager that counts the saves and writes of all ConfigurableData objects"""
+        save = ConfigurableData.save
+        write_file = ConfigurableData._write_file
+        counter = self
+
+        def counting_save(data, container=None):
+            counter.saves += 1
+            counter.save_bytes += len(json.dumps(data.get(container=container), cls=jsonutils.Encoder, indent=4))
+            return save(data, container=container)
+
+        def counting_write_file(data, text, container=None):
+            write_file(data, text, container=container)
+            counter.disk_writes += 1
+            counter.disk_bytes += os.path.getsize(data.filepath(container=container))
+
+        ConfigurableData.save = counting_save
+        ConfigurableData._write_file = counting_write_file
+        try:
+            yield
+        finally:
+            ConfigurableData.save = save
+            ConfigurableData._write_file = write_file
+
+
+class Matchday:
+    """
+    Generates OpenLigaDB match data for simultaneous matches with random goals.
+
+    :param leagues: number of leagues
+    :param matches: matches per league
+    :param minutes: duration of the matches
+    """
+
+    def __init__(self, leagues: int, matches: int, minutes: int):
+        self.minutes = minutes
+        self.minute = 0
+        self.kickoff = datetime.datetime.now().replace(second=0, microsecond=0) - datetime.timedelta(hours=1)
+        rnd = random.Random(42)
+        self.matches = {}
+        for league in range(leagues):
+            self.matches[f"l{league}"] = []
+            for match in range(matches):
+                goals = sorted(rnd.randrange(1, minutes) for _ in range(rnd.randrange(6)))
+                self.matches[f"l{league}"].append((league * 100 + match, [(m, rnd.random() < 0.5) for m in goals]))
+
+    def raw(self, league: str) -> list:
+        """
+        :param league: league key
+        :return: raw match data of the league at the current minute
+        """
+        r = []
+        for match_id, goals in self.matches[league]:
+            raw_goals = []
+            score = [0, 0]
+            for minute, home in goals:
+                if minute > self.minute:
+                    break
+                score[0 if home else 1] += 1
+                raw_goals.append({'goalID': f"{match_id}/{minute}", 'goalGetterName': "Player", 'matchMinute': minute,
+                                  'scoreTeam1': score[0], 'scoreTeam2': score[1]})
+            r.append({
+                'matchID': match_id,
+                'matchDateTimeUTC': self.kickoff.astimezone(datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                'team1': {'teamName': f"Team {match_id}a", 'teamId': f"{match_id}a"},
+                'team2': {'teamName': f"Team {match_id}b", 'teamId': f"{match_id}b"},
+                'goals': raw_goals,
+                'location': None,
+                'group': {'groupOrderID': 1},
+                'MatchIsFinished': self.minute >= self.minutes,
+            })
+        return r
+
+
+async def run(leagues: int, matches: int, minutes: int, batched: bool) -> Counter:
+    """
+    Registers the leagues and runs one update cycle per minute until all matches are finished.
+
+    :return: Counter
+    """
+    matchday = Matchday(leagues, matches, minutes)
+    counter = Counter()
+
+    async def get_matches_by_date(league, from_day=None, until_day=None, limit_pages=5):
+        # pylint: disable=unused-argument
+        return [liveticker.MatchOLDB(m, league) for m in matchday.raw(league)]
+
+    async def coro(*_args, **_kwargs):
+        pass
+
+    LeagueRegistrationOLDB.get_matches_by_date = staticmethod(get_matches_by_date)
+    if not batched:
+        Liveticker.storage_batch = lambda self: contextlib.nullcontext()
+
+    with tempfile.TemporaryDirectory() as directory, counter.patch():
+        bot = SimpleNamespace(STORAGE_DIR=directory, CONFIG_DIR=directory, listen=lambda: lambda f: f)
+        Storage().bot = bot
+        Config().bot = bot
+        Storage()._configurabledata = {}
+        lt = Liveticker()
+        bot.liveticker = lt
+        lt.semiweekly_timer = SimpleNamespace(next_execution=lambda: datetime.datetime.now() + datetime.timedelta(3))
+        lt.request_match_timer_update = coro
+        await WriteBehind().flush()
+        counter.reset()
+
+        plugin = SimpleNamespace(get_name=lambda: "benchmark")
+        await lt.register_coro(plugin, coro, [League(LTSource.OPENLIGADB, key) for key in matchday.matches],
+                               interval=5)
+        await WriteBehind().flush()
+
+        for minute in range(1, minutes + 1):
+            matchday.minute = minute
+            l_regs = {l_reg: {matchday.kickoff} for l_reg in lt.league_regs.values() if l_reg.kickoffs}
+            job = SimpleNamespace(data={(datetime.datetime.now() + datetime.timedelta(seconds=2)).minute: l_regs})
+            await lt._update_league_registrations(job)
+            # write-behind writes once per cycle at most, as the cycles are more than WriteBehind.DELAY apart
+            await WriteBehind().flush()
+    return counter
+
+
+def main():
+    """Runs the matchday batched and unbatched and prints the storage writes"""
+    leagues = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    matches = int(sys.argv[2]) if len(sys.argv) > 2 else 9
+    minutes = int(sys.argv[3]) if len(sys.argv) > 3 else 100
+
+    print(f"{leagues} leagues with {matches} matches each, {minutes} minutes")
+    print("{:<12} {:>8} {:>14} {:>12} {:>14}".format("mode", "saves", "save bytes", "disk writes", "disk bytes"))
+    # unbatched last, it patches Liveticker
+    for name, batched in (("batched", True), ("unbatched", False)):
+        c = asyncio.run(run(leagues, matches, minutes, batched))
+        print("{:<12} {:>8} {:>14} {:>12} {:>14}".format(name, c.saves, c.save_bytes, c.disk_writes, c.disk_bytes))
+
+
+if __name__ == "__main__":
+    main()
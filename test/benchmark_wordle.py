@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmarks wordle solvers: guess distribution, success rate, game latency and throughput.
+Games are played in a process pool, see plugins/wordle/benchmark.py.
+
+Usage: python3 test/benchmark_wordle.py [-n games] [-p processes] [-w wordlists.json] [-l list] [solver ...]
+
+Without -w, a random word list is generated.
+"""
+
+# pylint: disable=import-error,wrong-import-position
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import tempfile
+from string import ascii_lowercase
+
+sys.path.append(".")
+sys.path.append("..")
+from plugins.wordle.benchmark import run_benchmark
+from plugins.wordle.solvers import SOLVERS, PatternTable
+from plugins.wordle.wordlist import WordList, Parsers
+
+
+def random_wordlist(size: int, seed: int) -> WordList:
+    """:return: word list of `size` random words over 20 letters, a sixth of them solutions"""
+    rnd = random.Random(seed)
+    words = set()
+    while len(words) < size:
+        words.add("".join(rnd.choice(ascii_lowercase[:20]) for _ in range(5)))
+    words = sorted(words)
+    rnd.shuffle(words)
+    return WordList("random", Parsers.NYTIMES, tuple(words[:size // 6]), tuple(words[size // 6:]))
+
+
+async def main():
+    """Parses the arguments and runs the benchmark of every solver"""
+    parser = argparse.ArgumentParser(description="Benchmarks wordle solvers")
+    parser.add_argument("solvers", nargs="*", default=list(SOLVERS.keys()), help="solvers to benchmark")
+    parser.add_argument("-n", "--games", type=int, default=200, help="games per solver")
+    parser.add_argument("-p", "--processes", type=int, default=None, help="worker processes (default: cpu count)")
+    parser.add_argument("-w", "--wordlists", help="wordlists.json from the wordle plugin storage")
+    parser.add_argument("-l", "--list", default="en", help="word list name in the wordlists file")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="seed for the word list and solutions")
+    args = parser.parse_args()
+
+    if args.wordlists:
+        with open(args.wordlists, "r", encoding="utf-8") as f:
+            wordlist = WordList.deserialize(json.load(f)[args.list])
+    else:
+        wordlist = random_wordlist(12000, args.seed)
+    rnd = random.Random(args.seed)
+    solutions = [rnd.choice(wordlist.solutions) for _ in range(args.games)]
+    print(wordlist)
+
+    async def progress(played: int, total: int):
+        print("\r{}/{} games".format(played, total), end="", file=sys.stderr)
+
+    with tempfile.TemporaryDirectory() as directory:
+        if PatternTable is not None:
+            PatternTable.directory = directory
+        for solver in args.solvers:
+            result = await run_benchmark(wordlist, solver, args.games, solutions=solutions,
+                                         processes=args.processes, progress=progress)
+            print("\r", end="", file=sys.stderr)
+            print("\n".join(result.format()))
+            print()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
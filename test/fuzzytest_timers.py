@@ -5,19 +5,47 @@
 import sys
 import signal
 from threading import Thread, Lock
-from datetime import datetime
+from datetime import datetime, timedelta
 from calendar import monthrange
 import random
 import logging
+import time
 
-from typing import Tuple
+from typing import Tuple, Optional
 
 sys.path.append(".")
 sys.path.append("..")
 import test_timers
+from services import timers
 
 
 LEVEL = logging.INFO
+BENCHMARK_CASES = 2000
+
+
+def reference_next_occurence(ntd: dict, now: datetime) -> Optional[datetime]:
+    """
+    Naive next_occurence implementation that checks every single day. Serves as a reference for sparse timedicts.
+
+    :param ntd: normalized timedict
+    :param now: datetime.datetime object from which to calculate
+    :return: datetime.datetime object that marks the next occurence; `None` if there is none
+    """
+    now = now.replace(second=0, microsecond=0)
+    last_year = max(ntd["year"]) if ntd["year"] else now.year + timers.CompiledTimedict.CYCLE
+    day = datetime(now.year, now.month, now.day)
+    while day.year <= last_year:
+        if (ntd["year"] is None or day.year in ntd["year"]) \
+                and (ntd["month"] is None or day.month in ntd["month"]) \
+                and (ntd["monthday"] is None or day.day in ntd["monthday"]) \
+                and (not ntd["weekday"] or day.weekday() + 1 in ntd["weekday"]):
+            for hour in range(24) if ntd["hour"] is None else sorted(ntd["hour"]):
+                for minute in range(60) if ntd["minute"] is None else sorted(ntd["minute"]):
+                    candidate = day.replace(hour=hour, minute=minute)
+                    if candidate >= now:
+                        return candidate
+        day += timedelta(days=1)
+    return None
 
 
 class TestThread(Thread):
@@ -91,6 +119,33 @@ class TestThread(Thread):
         expected = None if tc < now else tc
         return now, td, expected
 
+    def random_field(self, start: int, end: int, max_len: int) -> Optional[list]:
+        """
+        :return: None or a random sorted list of values between start and end
+        """
+        if self.random.random() < 0.4:
+            return None
+        return sorted(self.random.sample(range(start, end + 1), self.random.randint(1, max_len)))
+
+    def generate_sparse_testcase(self) -> Tuple[datetime, dict, datetime]:
+        """
+        Generates a random sparse timedict (e.g. monthday and weekday combinations) whose expected next occurence is
+        calculated by reference_next_occurence().
+
+        :return: now, td, expected as to be used by test_timers.tcase_cron_alg()
+        """
+        now = self.generate_random_date()
+        td = {
+            "year": self.random_field(now.year - 1, now.year + 10, 2),
+            "month": self.random_field(1, 12, 3),
+            "monthday": self.random_field(1, 31, 3),
+            "weekday": self.random_field(1, 7, 2),
+            "hour": self.random_field(0, 23, 3),
+            "minute": self.random_field(0, 59, 3),
+        }
+        expected = reference_next_occurence(timers.normalize_td(td), now)
+        return now, td, expected
+
     def append_failed_test(self, msg: str):
         """
         Appends a failed test message to the main thread's buffer.
@@ -109,7 +164,10 @@ class TestThread(Thread):
                     self.main_thread_obligations()
 
             # Execute test
-            now, td, expected = self.generate_testcase()
+            if self.test_counter % 2:
+                now, td, expected = self.generate_sparse_testcase()
+            else:
+                now, td, expected = self.generate_testcase()
             try:
                 test_timers.tcase_cron_alg(now, td, expected)
             except AssertionError as e:
@@ -146,6 +204,24 @@ class Main:
 
         print("Done.")
 
+    @staticmethod
+    def benchmark():
+        """
+        Times next_occurence() on random sparse timedicts, both with plain and with precompiled timedicts.
+        """
+        thread = TestThread(get_seed())
+        cases = [thread.generate_sparse_testcase() for _ in range(BENCHMARK_CASES)]
+        cases = [(now, timers.normalize_td(td)) for now, td, _ in cases]
+        compiled = [(now, timers.CompiledTimedict(td)) for now, td in cases]
+
+        for name, tcases in (("normalized", cases), ("precompiled", compiled)):
+            start = time.perf_counter()
+            for now, td in tcases:
+                timers.next_occurence(td, now=now)
+            elapsed = time.perf_counter() - start
+            print("{}: {} cases in {:.3f}s; {:.1f} us per call".format(
+                name, len(tcases), elapsed, elapsed / len(tcases) * 1000000))
+
     def main(self):
         """
         Main method; parses args and does testing thread setup
@@ -162,8 +238,13 @@ class Main:
                 found_q = True
                 threadcount = int(arg[2:])
 
+            if arg in ("-b", "--benchmark"):
+                self.benchmark()
+                return
+
             if arg in ("help", "--help", "-h"):
-                print("Usage: {} [-qX] [help]\n  -qX: Amount of threads\n  help: Prints this help".format(sys.argv[0]))
+                print("Usage: {} [-qX] [-b] [help]\n  -qX: Amount of threads\n  -b: Benchmarks next_occurence\n"
+                      "  help: Prints this help".format(sys.argv[0]))
                 return
 
         # Thread setup
@@ -0,0 +1,121 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from plugins import customcmd
+from plugins.customcmd import Plugin, TextCmd, TextTemplate, cmd_re
+
+# pylint: disable=missing-function-docstring,protected-access,no-member
+
+MENTION = "<@123>"
+NAME = "Gecki"
+
+
+def render(text, args=""):
+    return TextTemplate(text).render(MENTION, NAME, cmd_re.findall(args))
+
+
+def test_template_user_wildcards():
+    assert render("hi %u") == "hi Gecki"
+    assert render("hi %um!") == "hi <@123>!"
+    assert render("%u%um%u") == "Gecki<@123>Gecki"
+    assert render("no wildcards") == "no wildcards"
+
+
+def test_template_args():
+    assert render("%1 hugs %2", "foo bar") == "foo hugs bar"
+    assert render("%1 hugs %2", "\"foo bar\" baz") == "foo bar hugs baz"
+    assert render("%1 says %2*", "foo bar baz") == "foo says bar baz"
+    assert render("all: %a", "foo bar baz") == "all: foo bar baz"
+    assert render("%1 and %1", "foo") == "foo and foo"
+
+
+def test_template_missing_args():
+    # single wildcard without args mentions the author
+    assert render("hugs %1") == "hugs <@123>"
+    assert render("%1 hugs %2", "foo") == "foo hugs %2"
+
+
+def test_template_arg_hook():
+    seen = []
+    TextTemplate("%1 %2 %1").render(MENTION, NAME, cmd_re.findall("a b"), seen.append)
+    assert seen == ["a", "b"]
+
+
+@pytest.fixture(name="plugin")
+def fixture_plugin(monkeypatch):
+    storage = {
+        "Hug": TextCmd(None, "hug", 1, ["%1 hugs %2"], aliases=["cuddle"]).serialize(),
+        "pat": TextCmd(None, "pat", 1, ["pats %1"], aliases=["pet", "hug2"]).serialize(),
+        "pet": TextCmd(None, "pet", 1, ["pets %1"]).serialize(),
+    }
+    monkeypatch.setattr(customcmd, "Storage", SimpleNamespace(get=lambda plugin: storage,
+                                                              save=lambda plugin: None))
+    monkeypatch.setattr(customcmd, "Config", SimpleNamespace(get=lambda plugin: {"cfgversion": 3}))
+
+    async def add_reaction(*args):
+        pass
+    monkeypatch.setattr(customcmd.utils, "add_reaction", add_reaction)
+
+    r = object.__new__(Plugin)
+    r.bot = SimpleNamespace(ignoring=SimpleNamespace(add_additional_command=lambda name: None))
+    r.cmd_type_map = {"text": TextCmd}
+    r.commands = {}
+    r._index = {}
+    r._load()
+    return r
+
+
+def assert_index_consistent(plugin):
+    index = {key: id(cmd) for key, cmd in plugin._index.items()}
+    plugin._rebuild_index()
+    assert index == {key: id(cmd) for key, cmd in plugin._index.items()}
+    assert set(customcmd.Storage.get(plugin)) == set(plugin.commands)
+    for name, cmd in plugin.commands.items():
+        assert cmd.name == name
+        assert plugin._find_cmd(name) is cmd
+
+
+def test_index_lookup(plugin):
+    # storage keys are renamed to the lowered cmd name
+    assert "Hug" not in customcmd.Storage.get(plugin)
+    assert plugin._find_cmd("hug") is plugin.commands["hug"]
+    assert plugin._find_cmd("cuddle") is plugin.commands["hug"]
+    assert plugin._find_cmd("hug2") is plugin.commands["pat"]
+    # names take precedence over aliases of other cmds
+    assert plugin._find_cmd("pet") is plugin.commands["pet"]
+    assert plugin._find_cmd("unknown") is None
+    assert_index_consistent(plugin)
+
+
+def test_index_aliases(plugin):
+    ctx = SimpleNamespace(message=None)
+    asyncio.run(Plugin.cmd_alias.callback(plugin, ctx, "hug", "squeeze"))
+    assert plugin._find_cmd("squeeze") is plugin.commands["hug"]
+    assert customcmd.Storage.get(plugin)["hug"]["aliases"] == ["cuddle", "squeeze"]
+    assert_index_consistent(plugin)
+
+    asyncio.run(Plugin.cmd_clear_alias.callback(plugin, ctx, "pat"))
+    assert plugin._find_cmd("hug2") is None
+    assert plugin._find_cmd("pet") is plugin.commands["pet"]
+    assert "aliases" not in customcmd.Storage.get(plugin)["pat"]
+    assert_index_consistent(plugin)
+
+
+def test_index_delete(plugin):
+    plugin._unregister_cmd(plugin.commands["pet"])
+    # the alias of another cmd is not shadowed anymore
+    assert plugin._find_cmd("pet") is plugin.commands["pat"]
+    assert "pet" not in customcmd.Storage.get(plugin)
+    assert_index_consistent(plugin)
+
+    plugin._unregister_cmd(plugin.commands["hug"])
+    assert plugin._find_cmd("hug") is None
+    assert plugin._find_cmd("cuddle") is None
+    assert_index_consistent(plugin)
+
+    plugin._register_cmd(TextCmd(plugin, "cuddle", 1, ["cuddles %1"]))
+    assert plugin._find_cmd("cuddle") is plugin.commands["cuddle"]
+    assert customcmd.Storage.get(plugin)["cuddle"]["texts"] == ["cuddles %1"]
+    assert_index_consistent(plugin)
@@ -0,0 +1,160 @@
+import asyncio
+import json
+import os
+from types import SimpleNamespace
+
+from base.configurable import Configurable
+from base.data import ConfigurableData, IODirectory, WriteBehind, Lang, LangString, lang_placeholder_mismatches
+
+# pylint: disable=missing-function-docstring,missing-class-docstring
+
+
+class DummyDirectory(IODirectory):
+    path = None
+
+    @property
+    def directory(self):
+        return self.path
+
+    @classmethod
+    def get_default(cls, plugin, container=None):
+        return {}
+
+
+class DummyConfigurable:
+    @staticmethod
+    def get_name():
+        return "dummy"
+
+
+def read(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_save_without_loop(tmp_path):
+    DummyDirectory.path = str(tmp_path)
+    data = ConfigurableData(DummyDirectory, DummyConfigurable())
+    data.set({"a": 1})
+    data.save()
+    assert read(data.filepath()) == {"a": 1}
+    assert os.listdir(tmp_path) == ["dummy.json"]
+
+
+def test_save_write_behind(tmp_path):
+    DummyDirectory.path = str(tmp_path)
+    data = ConfigurableData(DummyDirectory, DummyConfigurable())
+
+    async def run():
+        data.set({"a": 1})
+        data.save()
+        data.get()["a"] = 2
+        data.save()
+        data.set({"b": 1}, container="container")
+        data.save(container="container")
+        assert not os.path.exists(data.filepath())
+
+        await WriteBehind().flush()
+
+    asyncio.run(run())
+    assert read(data.filepath()) == {"a": 2}
+    assert read(data.filepath(container="container")) == {"b": 1}
+    assert sorted(os.listdir(tmp_path)) == ["dummy", "dummy.json"]
+
+
+def test_write_pending_snapshot(tmp_path):
+    DummyDirectory.path = str(tmp_path)
+    data = ConfigurableData(DummyDirectory, DummyConfigurable())
+    data.set({"a": 1})
+
+    # changes after serializing are not written
+    data.encode()
+    data.get()["a"] = 2
+    data.write_pending()
+    assert read(data.filepath()) == {"a": 1}
+
+    # an outdated write that runs after a newer one does not overwrite it
+    data.encode()
+    data.get()["a"] = 3
+    data.save()
+    data.write_pending()
+    assert read(data.filepath()) == {"a": 3}
+    assert os.listdir(tmp_path) == ["dummy.json"]
+
+
+class DummyLangConfigurable(Configurable):  # pylint: disable=abstract-method
+    def __init__(self, lang):
+        super().__init__()
+        self.lang = lang
+
+    def get_name(self):
+        return "dummy"
+
+    def get_lang(self):
+        return self.lang
+
+
+def test_langstring_signature():
+    assert LangString("abc {{}}").literal == "abc {}"
+    assert LangString("{} {}").signature == (2, frozenset())
+    assert LangString("{1} {name.attr}").signature == (2, frozenset({"name"}))
+    assert LangString("{}").literal is None
+
+
+def formatted(func, *args):
+    """:return: result of `func(*args)` or the type of the exception it raised"""
+    try:
+        return func(*args)
+    except Exception as e:  # pylint: disable=broad-except
+        return type(e)
+
+
+def test_langstring_render():
+    point = SimpleNamespace(x=1.5, y=[3, 4])
+    args = ("abc", 12, point, 0.25)
+    templates = ["{} {}", "{1} {0} {1}", "{0:>6}|{1:04d}", "{!r} {!s:^7}", "{2.x:.2f} {2.y[1]}", "{{{}}}", "{3:.1%}",
+                 "\\'\"{}\n", "{0[1]}", "{0:{1}}", "{name}", "{} {0}", "{2.y[a]}", "{4}", "{1:x}"]
+    for template in templates:
+        assert formatted(LangString(template).render, *args) == formatted(template.format, *args), template
+    assert LangString("{name}").render == "{name}".format  # pylint: disable=comparison-with-callable
+
+    # every lang string of the repo
+    directory = os.path.join(os.path.dirname(__file__), "..", "lang")
+    for filename in os.listdir(directory):
+        with open(os.path.join(directory, filename), encoding="utf-8") as f:
+            lang = json.load(f)
+        for strings in lang.values():
+            for text in strings.values():
+                langstr = LangString(text)
+                if isinstance(text, str) and langstr.literal is None and not langstr.named:
+                    for args in (["x{}".format(i) for i in range(langstr.positional)], range(langstr.positional)):
+                        assert formatted(langstr.render, *args) == formatted(text.format, *args), text
+
+
+def test_langstring_malformed():
+    for template in ["{0!x}", "{", "{!}", "}", "{0:{}"]:
+        langstr = LangString(template)
+        assert langstr.literal is None
+        assert formatted(langstr.render, "a") is ValueError, template
+    assert lang_placeholder_mismatches({"en_US": {"a": "{0!x}"}, "de_DE": {"a": "{"}}) == \
+        {"a": {"en_US": (1, frozenset()), "de_DE": (0, frozenset())}}
+
+
+def test_lang_placeholder_mismatches():
+    lang = {"en_US": {"a": "{} {}", "b": "{}", "c": "x"}, "de_DE": {"a": "{1} {0}", "b": "{} {}"}}
+    assert lang_placeholder_mismatches(lang) == {"b": {"en_US": (1, frozenset()), "de_DE": (2, frozenset())}}
+
+
+def test_lang_lookup(monkeypatch):
+    monkeypatch.setattr(Lang(), "_bot", SimpleNamespace(DEFAULT_LANG="en_US", LANGUAGE_CODE="de_DE"))
+    monkeypatch.setattr(Lang(), "_cache", {})
+    monkeypatch.setattr(Lang(), "_tables", {})
+    configurable = DummyLangConfigurable({"en_US": {"a": "A {}", "b": "B {{}}"}, "de_DE": {"a": "Ä {}"}})
+    assert Lang.lang_no_failsafe(configurable, "a", 1) == "Ä 1"
+    assert Lang.lang_no_failsafe(configurable, "b") == "B {}"
+    assert Lang.lang_no_failsafe(configurable, "c") is None
+    assert Lang.lang(configurable, "c") == "c"
+
+    # instance level lang code override
+    configurable.get_lang_code = lambda: "en_US"
+    assert Lang.lang_no_failsafe(configurable, "a", 1) == "A 1"
@@ -0,0 +1,47 @@
+# pylint: disable=missing-function-docstring
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from services.dmlisteners import DMListener
+
+
+async def kill():
+    pass
+
+
+def test_dmlistener_registrations():
+    listener = DMListener()
+    alice = SimpleNamespace(id=1)
+    bob = SimpleNamespace(id=2)
+    calls = []
+
+    async def callback(registration, message):
+        calls.append((registration.name, message.content))
+
+    reg1 = listener.register(alice, callback, "first", kill_coro=kill)
+    reg2 = listener.register(alice, callback, "second", kill_coro=kill)
+    blocking = listener.register(bob, callback, "blocking", kill_coro=kill, blocking=True)
+    assert [reg1.id, reg2.id, blocking.id] == [1, 2, 3]
+    assert listener.is_registered(alice) and not listener.is_blocked(alice)
+    assert listener.is_blocked(bob)
+    with pytest.raises(RuntimeError):
+        listener.register(bob, callback, "other", kill_coro=kill)
+    with pytest.raises(KeyError):
+        listener.register(alice, callback, "other", kill_coro=kill, blocking=True)
+
+    assert not asyncio.run(listener.handle_dm(SimpleNamespace(author=alice, content="hi")))
+    assert asyncio.run(listener.handle_dm(SimpleNamespace(author=bob, content="ho")))
+    assert calls == [("first", "hi"), ("second", "hi"), ("blocking", "ho")]
+
+    # ids are not reused
+    reg1.deregister()
+    reg1.deregister()
+    blocking.deregister()
+    assert not listener.is_registered(bob)
+    assert listener.register(bob, callback, "again", kill_coro=kill).id == 4
+    assert list(listener.registrations) == [2, 4]
+    reg2.deregister()
+    assert not listener.is_registered(alice)
+    assert not asyncio.run(listener.handle_dm(SimpleNamespace(author=alice, content="hi")))
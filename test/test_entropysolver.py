@@ -0,0 +1,55 @@
+# pylint: disable=missing-function-docstring
+import random
+
+import pytest
+
+from plugins.wordle.game import Game, Correctness
+from plugins.wordle.wordlist import WordList, Parsers
+
+np = pytest.importorskip("numpy")
+
+# pylint: disable=wrong-import-position
+from plugins.wordle.entropysolver import EntropySolver, PatternTable, encode_correctness, patterns
+from .wordlehelpers import build_wordlist
+
+
+def test_patterns_match_game():
+    wordlist = build_wordlist(300)
+    matrix = np.frombuffer(wordlist.encoded, dtype=np.uint8).reshape(-1, 5)
+    table = patterns(matrix, matrix)
+    for i, word in enumerate(wordlist.words):
+        for j, solution in enumerate(wordlist.words):
+            guess = Game(wordlist, solution).guess(word)
+            assert table[i, j] == encode_correctness(guess.correctness)
+
+    # double letters
+    wordlist = WordList("https://example.org", Parsers.NYTIMES, ("abbey", "kebab"), ("babes", "ebbed"))
+    matrix = np.frombuffer(wordlist.encoded, dtype=np.uint8).reshape(-1, 5)
+    table = patterns(matrix, matrix)
+    for i, word in enumerate(wordlist.words):
+        for j, solution in enumerate(wordlist.words):
+            assert table[i, j] == encode_correctness(Game(wordlist, solution).guess(word).correctness)
+
+
+def test_pattern_table_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(PatternTable, "directory", str(tmp_path))
+    wordlist = build_wordlist(400)
+    table = PatternTable(wordlist)
+    assert table.table.shape == (400, 100)
+    assert len(list(tmp_path.iterdir())) == 1
+    loaded = PatternTable(wordlist)
+    assert np.array_equal(loaded.table, table.table)
+
+
+def test_entropysolver():
+    wordlist = build_wordlist(2000)
+    rnd = random.Random(1)
+    for _ in range(50):
+        game = Game(wordlist, rnd.choice(wordlist.solutions))
+        EntropySolver(game).solve()
+        assert game.done == Correctness.CORRECT
+
+    # solution outside of the solutions list
+    game = Game(wordlist, wordlist.complement[0])
+    EntropySolver(game).solve()
+    assert game.done != Correctness.PARTIALLY
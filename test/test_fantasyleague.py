@@ -0,0 +1,133 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+from plugins.fantasy.fantasy import Plugin
+from plugins.fantasy.league import EspnLeague
+from plugins.fantasy.utils import Platform, Team, TeamStanding
+
+# pylint: disable=missing-function-docstring,protected-access
+
+
+def espn_team(team_id):
+    return SimpleNamespace(team_name="Team {}".format(team_id), team_abbrev="T{}".format(team_id), team_id=team_id,
+                           wins=team_id, losses=1, points_for=100 + team_id, division_name="East")
+
+
+def player(name):
+    return SimpleNamespace(slot_position="RB/WR/TE", name=name, proTeam="NE", projected_points=10, points=12)
+
+
+class DummyLeague:
+    """espn_api League that counts the calls and checks that they are not run concurrently"""
+
+    def __init__(self, matches=3):
+        self.matches = matches
+        self.current_week = 4
+        self.calls = []
+        self.running = 0
+
+    def _call(self, name):
+        self.running += 1
+        try:
+            assert self.running == 1, "concurrent espn_api calls"
+            self.calls.append(name)
+            time.sleep(0.01)
+        finally:
+            self.running -= 1
+
+    def box_scores(self, week):
+        self._call(("box_scores", week))
+        return [SimpleNamespace(home_team=espn_team(2 * i), home_score=i, home_lineup=[player("Home {}".format(i))],
+                                away_team=espn_team(2 * i + 1) if i > 0 else 0, away_score=0,
+                                away_lineup=[]) for i in range(self.matches)]
+
+    def standings(self):
+        self._call("standings")
+        return [espn_team(1), espn_team(2)]
+
+    def refresh(self):
+        self._call("refresh")
+
+
+def league() -> EspnLeague:
+    # must be created in the running loop, as the league's lock binds to it
+    espn = EspnLeague()
+    espn._espn = DummyLeague()
+    return espn
+
+
+def test_boxscore_snapshot(monkeypatch):
+    async def run():
+        espn = league()
+        matches = await espn.get_boxscores(1)
+        assert len(matches) == 3
+        assert matches[0].home_team == Team("Team 0", "T0", 0, 0)
+        assert matches[0].away_team is None
+        assert matches[0].home_lineup[0].slot_position == "FLEX"
+        assert matches[1].away_team == Team("Team 3", "T3", 3, 0)
+
+        # cached within the TTL
+        assert await espn.get_boxscores(1) == matches
+        assert espn._espn.calls == [("box_scores", 1)]
+
+        # other weeks and outdated snapshots are fetched
+        await espn.get_boxscores(2)
+        monkeypatch.setattr(EspnLeague, "SNAPSHOT_TTL", -1)
+        await espn.get_boxscores(1)
+        assert espn._espn.calls == [("box_scores", 1), ("box_scores", 2), ("box_scores", 1)]
+
+    asyncio.run(run())
+
+
+def test_boxscore_match_id():
+    async def run():
+        espn = league()
+        matches = await espn.get_boxscores(1)
+        assert await espn.get_boxscores(1, match_id=1) == [matches[1]]
+        assert await espn.get_boxscores(1, match_id=0) == [matches[0]]
+        assert not await espn.get_boxscores(1, match_id=3)
+
+    asyncio.run(run())
+
+
+def test_concurrent_fetch_once():
+    async def run():
+        espn = league()
+        results = await asyncio.gather(*[espn.get_boxscores(1) for _ in range(5)],
+                                       espn.get_divisional_standings(), espn.get_overall_standings())
+        assert espn._espn.calls.count(("box_scores", 1)) == 1
+        assert espn._espn.calls.count("standings") == 1
+        assert all(r == results[0] for r in results[:5])
+        assert results[5] == {"East": results[6]}
+        assert results[6] == [TeamStanding("Team 1", 1, 1, 0.5, 101.0), TeamStanding("Team 2", 2, 1, 2 / 3, 102.0)]
+
+    asyncio.run(run())
+
+
+def test_reload_drops_snapshots():
+    async def run():
+        espn = league()
+        await espn.get_boxscores(1)
+        await espn.get_overall_standings()
+        await espn.get_overall_standings()
+        await espn.reload()
+        assert not espn._boxscores
+        assert espn._standings is None
+        await espn.get_boxscores(1)
+        await espn.get_overall_standings()
+        assert espn._espn.calls == [("box_scores", 1), "standings", "refresh", ("box_scores", 1), "standings"]
+
+    asyncio.run(run())
+
+
+def test_prefetch_boxscores():
+    async def run():
+        plugin = object.__new__(Plugin)
+        espn = league()
+        plugin.leagues = {1: espn, 2: SimpleNamespace(platform=Platform.SLEEPER)}
+        await plugin._prefetch_boxscores()
+        await plugin._prefetch_boxscores(previous_week=True)
+        assert espn._espn.calls == [("box_scores", 4), ("box_scores", 3)]
+
+    asyncio.run(run())
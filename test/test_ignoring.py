@@ -0,0 +1,87 @@
+from types import SimpleNamespace
+
+from base.data import Config
+from services import ignoring
+from services.ignoring import Ignoring, IgnoreDataset, IgnoreEditResult, IgnoreType
+
+# pylint: disable=missing-function-docstring,missing-class-docstring,protected-access
+
+
+class CommandName:
+    """Command name that is not a str, e.g. a command object"""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __str__(self):
+        return self.name
+
+
+def create_ignoring(monkeypatch) -> Ignoring:
+    users = {i: SimpleNamespace(id=i) for i in range(1, 4)}
+    channels = {i: SimpleNamespace(id=i) for i in range(10, 12)}
+    bot = SimpleNamespace(plugins=[], listen=lambda: lambda f: f, get_user=users.get, get_channel=channels.get)
+    monkeypatch.setattr(Config(), "_bot", bot)
+    monkeypatch.setattr(ignoring, "Storage", SimpleNamespace(set=lambda *_args: None, save=lambda *_args: None))
+    return Ignoring()
+
+
+def reference(ig: Ignoring, ignore_type: IgnoreType, user=None, command_name="", channel=None) -> bool:
+    """Checks the ignore lists without the index"""
+    if user is not None and IgnoreDataset(IgnoreType.USER, user=user) in ig.users:
+        return True
+    dataset = IgnoreDataset(ignore_type, user=user, command_name=command_name, channel=channel)
+    return dataset in ig.get_ignore_list(ignore_type)
+
+
+def assert_checks_agree(ig: Ignoring):
+    for uid in range(1, 4):
+        user = ig.bot.get_user(uid)
+        assert ig.check_user_id(uid) == reference(ig, IgnoreType.USER, user=user)
+        for name in ("dsc", "dsc set", CommandName("dsc set")):
+            assert ig.check_passive_usage_uid(uid, name) == \
+                reference(ig, IgnoreType.PASSIVE_USAGE, user=user, command_name=name)
+            assert ig.check_active_usage_uid(uid, name) == \
+                reference(ig, IgnoreType.ACTIVE_USAGE, user=user, command_name=name)
+    for cid in range(10, 12):
+        channel = ig.bot.get_channel(cid)
+        for name in ("dsc", "dsc set", CommandName("dsc set")):
+            assert ig.check_command_name(name, channel) == \
+                reference(ig, IgnoreType.COMMAND, command_name=name, channel=channel)
+
+
+def test_ignore_index(monkeypatch):
+    ig = create_ignoring(monkeypatch)
+    assert_checks_agree(ig)
+
+    assert ig.add_user_id(1) == IgnoreEditResult.SUCCESS
+    assert ig.add_command_id(CommandName("dsc set"), 10) == IgnoreEditResult.SUCCESS
+    assert ig.add_passive_uid(2, "dsc") == IgnoreEditResult.SUCCESS
+    assert ig.add_active_uid(3, CommandName("dsc set")) == IgnoreEditResult.SUCCESS
+    assert ig.get_full_ignore_len() == 4
+    assert_checks_agree(ig)
+
+    # str and non-str command names are the same entry
+    assert ig.check_command_name("dsc set", ig.bot.get_channel(10))
+    assert ig.check_active_usage_uid(3, "dsc set")
+    assert ig.add_command_id("dsc set", 10) == IgnoreEditResult.ALREADY_IN_LIST
+    assert ig.add_active_uid(3, "dsc set") == IgnoreEditResult.ALREADY_IN_LIST
+    assert ig.add_user_id(1) == IgnoreEditResult.ALREADY_IN_LIST
+    assert ig.get_full_ignore_len() == 4
+
+    # a blocked user is blocked for every command
+    assert ig.check_passive_usage_uid(1, "dsc") and ig.check_active_usage_uid(1, "dsc")
+    assert not ig.check_passive_usage_uid(2, "dsc set")
+
+    assert ig.remove_command_id("dsc set", 10) == IgnoreEditResult.SUCCESS
+    assert ig.remove_active_uid(3, CommandName("dsc set")) == IgnoreEditResult.SUCCESS
+    assert ig.remove_user_id(1) == IgnoreEditResult.SUCCESS
+    assert ig.remove_user_id(1) == IgnoreEditResult.NOT_IN_LIST
+    assert ig.remove_passive_uid(2, "dsc set") == IgnoreEditResult.NOT_IN_LIST
+    assert ig.get_full_ignore_list() == ig.passive
+    assert_checks_agree(ig)
+
+    assert ig.remove_passive_uid(2, "dsc") == IgnoreEditResult.SUCCESS
+    assert ig.get_full_ignore_len() == 0
+    assert all(not index for index in ig._index.values())
+    assert_checks_agree(ig)
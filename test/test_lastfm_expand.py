@@ -0,0 +1,123 @@
+import asyncio
+import logging
+
+import pytest
+
+from plugins.lastfm.lastfm import Plugin, Layer
+
+# pylint: disable=missing-function-docstring,unused-argument
+
+
+class DummyApi:
+    """
+    Serves `pages` as recent tracks pages. Requests for pages in `blocked` never finish.
+
+    :param pages: page index -> list of songs
+    :param blocked: indices of the pages that are never served
+    """
+
+    def __init__(self, pages: dict, blocked=()):
+        self.pages = pages
+        self.blocked = set(blocked)
+        self.requested = []
+        self.cancelled = []
+
+    async def get_recent_tracks(self, lfmuser, page=1, pagelen=10, first=True, cache_ttl=None):
+        self.requested.append(page)
+        if page in self.blocked:
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                self.cancelled.append(page)
+                raise
+        return self.pages[page]
+
+
+def plugin(api: DummyApi, limit: int, prefetch: int) -> Plugin:
+    p = object.__new__(Plugin)
+    p.logger = logging.getLogger(__name__)
+    p.api = api
+    config = {"limit": limit, "expand_prefetch": prefetch, "expand_page_ttl": 60, "mi_enable_downgrade": False}
+    p.get_config = config.get
+    return p
+
+
+def song(artist):
+    return {"artist": artist, "album": artist + " album", "title": artist + " song"}
+
+
+def test_prefetch_within_limit():
+    api = DummyApi({i: [song(str(i))] for i in range(1, 5)})
+    p = plugin(api, limit=4, prefetch=10)
+
+    async def run():
+        return [page async for page in p.recent_pages("user", 10, api.pages[1])]
+
+    assert asyncio.run(run()) == [api.pages[i] for i in range(1, 5)]
+    assert sorted(api.requested) == [2, 3, 4]
+
+    api = DummyApi({i: [song(str(i))] for i in range(1, 6)})
+    p = plugin(api, limit=5, prefetch=1)
+    prefetched = {}
+
+    async def prefetch():
+        p.prefetch_pages("user", 10, 2, prefetched)
+        p.prefetch_pages("user", 10, 3, prefetched)
+        await asyncio.gather(*prefetched.values())
+
+    asyncio.run(prefetch())
+    assert sorted(prefetched) == [2, 3, 4]
+    assert sorted(api.requested) == [2, 3, 4]
+
+
+def test_close_cancels_prefetches():
+    api = DummyApi({1: [song("a")], 2: [song("b")]}, blocked=(3, 4))
+    p = plugin(api, limit=5, prefetch=2)
+
+    async def run():
+        pages = p.recent_pages("user", 10, api.pages[1])
+        async for page in pages:
+            if page == api.pages[2]:
+                break
+        await pages.aclose()
+        await asyncio.sleep(0)
+
+    asyncio.run(run())
+    assert sorted(api.requested) == [2, 3, 4]
+    assert sorted(api.cancelled) == [3, 4]
+
+
+def test_expand_stops_early():
+    example = song("a")
+    api = DummyApi({1: [example] * 3, 2: [song("b")] * 3}, blocked=(3, 4))
+    p = plugin(api, limit=5, prefetch=2)
+
+    async def run():
+        r = await p.expand("user", 3, api.pages[1], Layer.ARTIST, example)
+        await asyncio.sleep(0)
+        return r
+
+    assert asyncio.run(run()) == (3, 3, Layer.ARTIST, example)
+    assert sorted(api.requested) == [2, 3, 4]
+    assert sorted(api.cancelled) == [3, 4]
+
+
+def test_expand_error_cancels_prefetches():
+    example = song("a")
+    api = DummyApi({1: [example], 2: [song("b")]}, blocked=(3, 4))
+    p = plugin(api, limit=5, prefetch=2)
+
+    def interest_match(s, criterion, ex):
+        if s["artist"] == "b":
+            raise ValueError
+        return True
+
+    p.interest_match = interest_match
+
+    async def run():
+        with pytest.raises(ValueError):
+            await p.expand("user", 1, api.pages[1], Layer.ARTIST, example)
+        await asyncio.sleep(0)
+
+    asyncio.run(run())
+    assert sorted(api.cancelled) == [3, 4]
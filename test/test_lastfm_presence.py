@@ -0,0 +1,55 @@
+import asyncio
+import logging
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from plugins.lastfm import presence
+from plugins.lastfm.api import UnexpectedResponse
+from plugins.lastfm.presence import LfmPresenceMessage
+
+# pylint: disable=missing-function-docstring,protected-access
+
+
+def probe(monkeypatch, scrobbles: dict, batch: int):
+    """
+    Runs get_random_lastfm_listener() with the users of `scrobbles` in dict order.
+
+    :param scrobbles: lastfm user -> song or exception of get_current_scrobble()
+    :param batch: presence_probe_batch
+    :return: result of get_random_lastfm_listener()
+    """
+    async def get_current_scrobble(lfmuser):
+        r = scrobbles[lfmuser]
+        if isinstance(r, Exception):
+            raise r
+        return r
+
+    users = {i: {"lfmuser": lfmuser} for i, lfmuser in enumerate(scrobbles)}
+    config = {"presence_optout": True, "presence_probe_batch": batch}
+    monkeypatch.setattr(presence, "Storage", SimpleNamespace(get=lambda _plugin: {"users": users}))
+    monkeypatch.setattr(presence, "get_best_user", lambda userid: userid)
+    monkeypatch.setattr(random, "shuffle", lambda _list: None)
+
+    msg = object.__new__(LfmPresenceMessage)
+    msg.logger = logging.getLogger(__name__)
+    msg.plugin = SimpleNamespace(get_config=config.get, api=SimpleNamespace(get_current_scrobble=get_current_scrobble))
+    return asyncio.run(msg.get_random_lastfm_listener())
+
+
+def test_probe_single_batches(monkeypatch):
+    scrobbles = {"a": UnexpectedResponse("a", "error"), "b": None, "c": "song"}
+    assert probe(monkeypatch, scrobbles, 1) == (2, "c", "song")
+    assert probe(monkeypatch, {"a": UnexpectedResponse("a", "error")}, 1) == (None, None, None)
+    with pytest.raises(RuntimeError):
+        probe(monkeypatch, {"a": UnexpectedResponse("a", "error"), "b": RuntimeError(), "c": "song"}, 1)
+
+
+def test_probe_mixed_batch(monkeypatch):
+    scrobbles = {"a": RuntimeError(), "b": UnexpectedResponse("b", "error"), "c": "song"}
+    assert probe(monkeypatch, scrobbles, 3) == (2, "c", "song")
+    scrobbles = {"a": UnexpectedResponse("a", "error"), "b": UnexpectedResponse("b", "error"), "c": None}
+    assert probe(monkeypatch, scrobbles, 3) == (None, None, None)
+    with pytest.raises(RuntimeError):
+        probe(monkeypatch, {"a": RuntimeError(), "b": UnexpectedResponse("b", "error")}, 2)
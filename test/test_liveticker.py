@@ -0,0 +1,277 @@
+import asyncio
+import datetime
+import logging
+from types import SimpleNamespace
+
+from services import liveticker as liveticker_module, teamnames as teamnames_module
+from services.liveticker import Liveticker, League, LTSource, MatchOLDB, MatchStatus, MatchStateStore, \
+    CoroRegistration, LeagueRegistrationOLDB
+from services.teamnames import TeamnameDict, TeamnameConverter, TeamnameIndex, normalize_teamname
+
+# pylint: disable=missing-function-docstring,missing-class-docstring,protected-access
+
+
+class DummyCoroReg:
+    def __init__(self):
+        self.updates = []
+        self.calls = []
+
+    async def update(self):
+        self.calls.append(self.updates)
+        self.updates = []
+
+
+class DummyLeagueReg:
+    running = 0
+    max_running = 0
+
+    def __init__(self, key, c_regs, delay=0.05):
+        self.league = League(LTSource.OPENLIGADB, key)
+        self.c_regs = c_regs
+        self.delay = delay
+        self.alive = True
+        self.updated = False
+
+    async def update_matches(self):
+        DummyLeagueReg.running += 1
+        DummyLeagueReg.max_running = max(DummyLeagueReg.max_running, DummyLeagueReg.running)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            DummyLeagueReg.running -= 1
+        self.updated = True
+
+    def dispatch_updates(self, kickoffs):
+        for c_reg in self.c_regs:
+            c_reg.updates.append(self.league.key)
+        return False
+
+
+def liveticker():
+    r = object.__new__(Liveticker)
+    r.logger = logging.getLogger(__name__)
+    r._fetch_semaphores = {}
+    r._dirty = {}
+    r._dirty_containers = set()
+    return r
+
+
+def run_update(lt, l_regs):
+    minute = (datetime.datetime.now() + datetime.timedelta(seconds=2)).minute
+    job = SimpleNamespace(data={minute: {l_reg: {datetime.datetime.now()} for l_reg in l_regs}})
+    asyncio.run(lt._update_league_registrations(job))
+
+
+def test_update_concurrent(monkeypatch):
+    monkeypatch.setattr(Liveticker, "FETCH_TIMEOUT", 0.5)
+    c_reg = DummyCoroReg()
+    l_regs = [DummyLeagueReg(f"l{i}", [c_reg]) for i in range(5)]
+    l_regs.append(DummyLeagueReg("slow", [c_reg], delay=5))
+    DummyLeagueReg.max_running = 0
+
+    run_update(liveticker(), l_regs)
+    assert DummyLeagueReg.max_running == Liveticker.FETCH_CONCURRENCY[LTSource.OPENLIGADB]
+    assert [l_reg.updated for l_reg in l_regs] == [True] * 5 + [False]
+    # timed out league is dispatched with its previous data; one notification per coro
+    assert c_reg.calls == [[f"l{i}" for i in range(5)] + ["slow"]]
+
+
+def test_storage_batch_per_task(monkeypatch):
+    saved = []
+    monkeypatch.setattr(liveticker_module, "Storage", lambda: SimpleNamespace(
+        save=lambda _lt, container=None: saved.append(container)))
+    lt = liveticker()
+
+    async def batch(event: asyncio.Event):
+        with lt.storage_batch():
+            lt.mark_dirty(container="batch")
+            with lt.storage_batch():
+                lt.mark_dirty(container="batch")
+            await event.wait()
+            lt.mark_dirty(container="batch")
+            assert not saved
+
+    async def run():
+        event = asyncio.Event()
+        task = asyncio.ensure_future(batch(event))
+        await asyncio.sleep(0)
+        assert not saved
+
+        # changes outside of the batch are saved right away, although a batch of another task is open
+        lt.mark_dirty(container="other")
+        assert "other" in saved
+        saved.clear()
+        lt.mark_dirty(container="other")
+        assert saved == ["other"]
+        saved.clear()
+        event.set()
+        await task
+        assert saved == ["batch"]
+
+    asyncio.run(run())
+
+
+def test_storage_batch_outlived(monkeypatch):
+    saved = []
+    monkeypatch.setattr(liveticker_module, "Storage", lambda: SimpleNamespace(
+        save=lambda _lt, container=None: saved.append(container)))
+    lt = liveticker()
+
+    async def long_lived(closed: asyncio.Event):
+        # e.g. the timer scheduler task, which is started lazily on the first scheduled job
+        lt.mark_dirty(container="in batch")
+        await closed.wait()
+        lt.mark_dirty(container="after batch")
+        assert saved == ["in batch", "after batch"]
+        with lt.storage_batch():
+            lt.mark_dirty(container="own batch")
+            assert saved == ["in batch", "after batch"]
+        assert saved == ["in batch", "after batch", "own batch"]
+
+    async def run():
+        closed = asyncio.Event()
+        with lt.storage_batch():
+            task = asyncio.ensure_future(long_lived(closed))
+            await asyncio.sleep(0)
+            assert not saved
+        assert saved == ["in batch"]
+        closed.set()
+        await task
+
+    asyncio.run(run())
+
+
+def match(goals, status=MatchStatus.RUNNING, minute="10"):
+    r = object.__new__(MatchOLDB)
+    r.match_id = 1
+    r.home_team_id, r.away_team_id = 10, 20
+    r.raw_events = [{"goalID": i, "scoreTeam1": home, "scoreTeam2": away} for i, (home, away) in enumerate(goals)]
+    r.score = {10: goals[-1][0] if goals else 0, 20: goals[-1][1] if goals else 0}
+    r.status = status
+    r.minute = minute
+    r.kickoff = datetime.datetime.now().replace(second=0, microsecond=0) + datetime.timedelta(hours=1)
+    return r
+
+
+def test_match_state_diff():
+    state = MatchStateStore()
+    state.track(match([]))
+    assert not state.diff(match([]))
+
+    delta = state.diff(match([(1, 0)], minute="11"))
+    assert delta.persist
+    assert delta.score == {10: 1, 20: 0}
+    assert delta.status is None
+    assert [e.event_id for e in delta.events] == [0]
+
+    delta = state.diff(match([(1, 0)], minute="12"))
+    assert delta and not delta.persist
+
+    delta = state.diff(match([(1, 0), (1, 1)], status=MatchStatus.COMPLETED, minute="12"))
+    assert delta.status == MatchStatus.COMPLETED and delta.minute is None
+    assert [e.event_id for e in delta.events] == [1]
+    assert state.known_events(1) == [0, 1]
+
+    state.prune(1)
+    assert not state.states and not state.event_ids
+
+
+def test_coro_reg_deltas():
+    state = MatchStateStore()
+    state.track(match([]))
+    c_reg = object.__new__(CoroRegistration)
+    c_reg.pending = {}
+
+    c_reg.add_deltas([state.diff(match([(1, 0)], minute="11"))])
+    c_reg.add_deltas([state.diff(match([(1, 0), (2, 0)], minute="12"))])
+    current = match([(1, 0), (2, 0)], minute="12")
+    delta = c_reg.pop_deltas([current])[current]
+    assert delta.score == {10: 2, 20: 0} and delta.minute == "12"
+    assert [e.event_id for e in delta.events] == [0, 1]
+    assert not c_reg.pop_deltas([current])[current]
+    assert not c_reg.pending
+
+
+def test_schedule_kickoffs_prune():
+    postponed = match([])
+    postponed.match_id = 2
+    c_reg = object.__new__(CoroRegistration)
+    c_reg.pending = {}
+
+    l_reg = object.__new__(LeagueRegistrationOLDB)
+    l_reg.league = League(LTSource.OPENLIGADB, "l")
+    l_reg.state = MatchStateStore()
+    l_reg.c_regs = [c_reg]
+    l_reg.store = lambda: None
+    for m in (match([]), postponed):
+        l_reg.state.track(m)
+    c_reg.add_deltas([l_reg.state.diff(match([(1, 0)])), l_reg.state.diff(postponed)])
+    postponed.status = MatchStatus.POSTPONED
+    c_reg.add_deltas([l_reg.state.diff(postponed)])
+    assert set(c_reg.pending) == {1, 2}
+
+    async def get_matches_by_date(**_kwargs):
+        return [match([(1, 0)]), postponed]
+    l_reg.get_matches_by_date = get_matches_by_date
+    until = datetime.datetime.now() + datetime.timedelta(days=1)
+    asyncio.run(l_reg.schedule_kickoffs(until))
+
+    assert set(l_reg.state.states) == {1}
+    assert set(c_reg.pending) == {1}
+
+
+def test_normalize_teamname():
+    assert normalize_teamname("1. FC Köln") == normalize_teamname("Koeln") == "koln"
+    assert normalize_teamname("Borussia M'gladbach") == "borussia monchengladbach"
+    assert normalize_teamname("Hertha BSC II") == "hertha ii"
+    assert normalize_teamname("FC") == "fc"
+
+
+def test_teamname_index():
+    names = ["FC Bayern München", "Bayern München II", "Borussia Dortmund", "Borussia Mönchengladbach",
+             "Manchester United", "Manchester City", "FC St. Pauli", "Team 101a"]
+    teams = {name: TeamnameDict(None, name, emoji="x") for name in names}
+    index = TeamnameIndex(teams)
+
+    def find(name, fuzzy=True):
+        r = index.find(name, fuzzy=fuzzy)
+        return r.long_name if r is not None else None
+
+    # normalized names only
+    assert find("Bayern Muenchen", fuzzy=False) == "FC Bayern München"
+    assert find("FC St Pauli", fuzzy=False) == "FC St. Pauli"
+    assert find("Borusia Dortmund", fuzzy=False) is None
+    assert find("Man Utd.", fuzzy=False) == "Manchester United"
+    assert find("Munchen", fuzzy=False) is None
+
+    assert find("Bayern Muenchen") == "FC Bayern München"
+    assert find("Bayern München 2") == "FC Bayern München"
+    assert find("Bayern Munchen II") == "Bayern München II"
+    assert find("Bayern München U19") is None
+    assert find("Borusia Dortmund") == "Borussia Dortmund"
+    assert find("Man Utd") == "Manchester United"
+    assert find("Sankt Pauli") == "FC St. Pauli"
+    assert find("Real Madrid") is None
+    assert find("Team 102a") is None
+
+    index.add("Bayern", teams["Borussia Dortmund"])
+    assert find("Bayern") == "Borussia Dortmund"
+    index.add("FC Bayern", teams["FC Bayern München"])
+    assert find("Bayern") is None
+
+
+def test_teamname_converter_feed_names(monkeypatch):
+    storage = SimpleNamespace(get=lambda *args, **kwargs: {}, save=lambda *args, **kwargs: None)
+    monkeypatch.setattr(liveticker_module, "Storage", lambda: storage)
+    monkeypatch.setattr(teamnames_module, "Storage", lambda: storage)
+    converter = TeamnameConverter(liveticker())
+    barca = converter.add("FC Barcelona", "Barcelona", "BAR")
+
+    # names from the data sources are matched exactly, names typed by users are normalized
+    assert not converter.get("Barcelona SC")
+    assert converter.get("Barcelona SC", fuzzy=True) is barca
+    assert converter.get("barcelona") is barca
+    added = converter.get("Barcelona SC", add_if_nonexist=True)
+    assert added is not barca
+    assert added.long_name == "Barcelona SC"
+    assert converter.get("Barcelona SC") is added
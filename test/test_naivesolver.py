@@ -0,0 +1,53 @@
+# pylint: disable=missing-function-docstring
+import asyncio
+import random
+
+import pytest
+
+from plugins.wordle.game import Game
+from plugins.wordle.naivesolver import NaiveSolver
+from plugins.wordle.utils import OutOfOptions
+from plugins.wordle.wordlist import WordList
+from .wordlehelpers import build_wordlist
+
+pytest.importorskip("numpy")
+
+def play(wordlist: WordList, solution: str, seed: int, vectorized: bool):
+    random.seed(seed)
+    game = Game(wordlist, solution)
+    try:
+        NaiveSolver(game, vectorized=vectorized).solve()
+    except OutOfOptions:
+        pass
+    return [guess.word for guess in game.guesses]
+
+
+def test_naivesolver_engine_equivalence(monkeypatch):
+    monkeypatch.setattr("plugins.wordle.naivesolver.execute_anything_sync", lambda *args, **kwargs: None)
+    wordlist = build_wordlist(2000)
+    rnd = random.Random(1)
+    for seed in range(40):
+        solution = rnd.choice(wordlist.solutions)
+        assert play(wordlist, solution, seed, True) == play(wordlist, solution, seed, False)
+
+
+def test_naivesolver_out_of_options_report(monkeypatch):
+    reports = []
+    monkeypatch.setattr("plugins.wordle.naivesolver.execute_anything_sync", reports.append)
+    monkeypatch.setattr("plugins.wordle.naivesolver.log_exception", lambda e, **kwargs: e)
+    wordlist = build_wordlist(100)
+
+    def out_of_options():
+        solver = NaiveSolver(Game(wordlist, wordlist.solutions[0]), vectorized=False)
+        solver.filter_candidates = lambda: []
+        with pytest.raises(OutOfOptions):
+            solver.current_candidates()
+
+    # e.g. in a benchmark worker process
+    out_of_options()
+    assert not reports
+
+    async def on_loop():
+        out_of_options()
+    asyncio.run(on_loop())
+    assert len(reports) == 1
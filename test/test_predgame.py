@@ -0,0 +1,152 @@
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from plugins.sport import _predgame
+from plugins.sport._predgame import PredictionSnapshot, _Predgame
+from services.liveticker import TeamnameDict
+
+# pylint: disable=missing-function-docstring,missing-class-docstring,protected-access,unused-argument
+
+HEADER = ["Datum", "Zeit", "Heim", "", "", "Gast", "A", "", "B", ""]
+
+
+class DummyConverter:
+    """Resolves every team name except 'Unknown' to itself"""
+
+    @staticmethod
+    def get_many(names, fuzzy=False):
+        return {name: TeamnameDict(None, name, emoji="x") for name in names if name and name != "Unknown"}
+
+
+def team(name):
+    return TeamnameDict(None, name, emoji="x")
+
+
+def row(kickoff: datetime, team1: str, team2: str, *preds):
+    return [kickoff.strftime("Xx %d.%m."), kickoff.strftime("%H:%M"), team1, "", "", team2, *preds]
+
+
+def snapshot(rows, league="bl", settings=None):
+    return PredictionSnapshot(league, settings or {}, [["A", "B", ""]], [[1, 2]], [HEADER] + rows, DummyConverter())
+
+
+def test_find_by_teams():
+    kickoff = datetime(datetime.now().year, 5, 14, 15, 30)
+    s = snapshot([row(kickoff, "Team A", "Team B", "2", "1"),
+                  row(kickoff, "Unknown", "Team B"),
+                  row(kickoff + timedelta(days=7), "Team A", "Team B", "0"),
+                  row(kickoff, "Team C", "Team D")])
+    rows = s.find(team("Team A"), team("Team B"))
+    assert [r.index for r in rows] == [0, 2]
+    assert rows[0].preds == ["A 2:1", "B -:-"]
+    assert rows[1].preds == ["A 0:-", "B -:-"]
+    assert [r.index for r in s.find(team("Team A"), team("Team B"), kickoff)] == [0]
+    assert not s.find(team("Team B"), team("Team A"))
+    assert not s.find(team("Team A"), team("Team B"), kickoff + timedelta(hours=1))
+
+
+def test_find_by_kickoff():
+    # without teams, only running matches at that kickoff are found
+    kickoff = datetime.now().replace(second=0, microsecond=0)
+    s = snapshot([row(kickoff, "Team A", "Team B"),
+                  row(kickoff - timedelta(minutes=1), "Team C", "Team D"),
+                  row(kickoff + timedelta(days=1), "Team E", "Team F"),
+                  row(kickoff, "Team G", "Team H")])
+    assert [r.index for r in s.find(kickoff=kickoff)] == [0, 3]
+    assert not s.find(kickoff=kickoff + timedelta(minutes=1))
+    assert not s.find(kickoff=kickoff + timedelta(days=1))
+
+
+def test_find_running():
+    now = datetime.now().replace(second=0, microsecond=0)
+    s = snapshot([row(now + timedelta(days=1), "Team A", "Team B"),
+                  row(now, "Team C", "Team D"),
+                  row(now - timedelta(hours=5), "Team E", "Team F")])
+    assert [r.team1.long_name for r in s.find()] == ["Team C"]
+
+
+class DummyClient:
+    """Sheets client that serves the ranges of `sheets` and counts the fetches"""
+    sheets = {}
+    fetches = []
+
+    def __init__(self, bot, spreadsheet_id):
+        self.spreadsheet_id = spreadsheet_id
+
+    async def get_multiple_async(self, ranges):
+        self.fetches.append(self.spreadsheet_id)
+        await asyncio.sleep(0)
+        result = self.sheets[self.spreadsheet_id]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+@pytest.fixture(name="predgame")
+def fixture_predgame(monkeypatch):
+    storage = {"predictions": {
+        "bl": {"name": "Bundesliga", "sheet": "bl_sheet", "name_range": "A", "points_range": "B",
+               "prediction_range": "C"},
+        "cl": {"name": "Champions League", "sheet": "cl_sheet", "name_range": "A", "points_range": "B",
+               "prediction_range": "C"},
+    }}
+    kickoff = datetime(datetime.now().year, 5, 14, 15, 30)
+    DummyClient.sheets = {sheet: ([["A"]], [[1]], [HEADER, row(kickoff, "Team A", "Team B")])
+                          for sheet in ("bl_sheet", "cl_sheet")}
+    DummyClient.fetches = []
+    monkeypatch.setattr(_predgame, "Storage", SimpleNamespace(get=lambda plugin: storage))
+    monkeypatch.setattr(_predgame, "Config", SimpleNamespace(get=lambda plugin: {"predgame": {"snapshot_interval": 5}}))
+    monkeypatch.setattr(_predgame.sheetsclient, "Client", DummyClient)
+    return _Predgame(SimpleNamespace(liveticker=SimpleNamespace(teamname_converter=DummyConverter())))
+
+
+def test_refresh_once_per_league(predgame):
+    async def run():
+        return await asyncio.gather(predgame.refresh_predictions("bl"), predgame.refresh_predictions(),
+                                    predgame.refresh_predictions("bl", "cl"))
+
+    assert asyncio.run(run()) == [{}, {}, {}]
+    assert sorted(DummyClient.fetches) == ["bl_sheet", "cl_sheet"]
+    assert not predgame._snapshot_tasks
+    assert set(predgame._snapshots) == {"bl", "cl"}
+
+
+def test_get_snapshots(predgame):
+    snapshots = asyncio.run(predgame._get_snapshots("Bundesliga"))
+    assert [s.league for s in snapshots] == ["bl"]
+    assert DummyClient.fetches == ["bl_sheet"]
+
+    # fresh snapshots are reused
+    assert asyncio.run(predgame._get_snapshots("bl")) == snapshots
+    assert DummyClient.fetches == ["bl_sheet"]
+
+    # outdated snapshots are refreshed
+    assert asyncio.run(predgame._get_snapshots("bl", max_age=-1)) != snapshots
+    assert DummyClient.fetches == ["bl_sheet", "bl_sheet"]
+
+
+def test_get_snapshots_settings_changed(predgame):
+    old = asyncio.run(predgame._get_snapshots("bl"))[0]
+    _predgame.Storage.get(predgame)["predictions"]["bl"]["prediction_range"] = "D"
+    new = asyncio.run(predgame._get_snapshots("bl"))[0]
+    assert new is not old
+    assert new.settings["prediction_range"] == "D"
+    assert DummyClient.fetches == ["bl_sheet", "bl_sheet"]
+
+
+def test_get_snapshots_refresh_failed(predgame):
+    old = asyncio.run(predgame._get_snapshots())
+    DummyClient.sheets["bl_sheet"] = ValueError("sheet not reachable")
+
+    # the previous snapshot is kept
+    assert asyncio.run(predgame._get_snapshots(max_age=-1))[0] is old[0]
+    assert predgame._snapshots["bl"] is old[0]
+
+    # no snapshot at all
+    del predgame._snapshots["bl"]
+    with pytest.raises(ValueError):
+        asyncio.run(predgame._get_snapshots("bl"))
+    assert not predgame._snapshot_tasks
@@ -0,0 +1,96 @@
+# pylint: disable=missing-function-docstring,too-few-public-methods,protected-access
+import asyncio
+from types import SimpleNamespace
+
+from nextcord import PartialEmoji
+
+from base.data import Config
+from services.reactions import ReactionListener, ReactionAction, ReactionAddedEvent
+
+
+class FakeChannel:
+    """Channel that counts the message fetches"""
+
+    def __init__(self):
+        self.fetches = 0
+
+    async def fetch_message(self, message_id):
+        self.fetches += 1
+        return SimpleNamespace(id=message_id)
+
+
+class FakeBot:
+    """Bot with a single channel"""
+
+    def __init__(self):
+        self.channel = FakeChannel()
+        self.guild = SimpleNamespace(get_member=lambda user_id: None)
+
+    def listen(self):
+        return lambda f: f
+
+    def get_user(self, user_id):
+        return user_id
+
+    def get_channel(self, _channel_id):
+        return self.channel
+
+
+def payload(message_id, emoji):
+    return SimpleNamespace(message_id=message_id, user_id=1, channel_id=2, emoji=PartialEmoji.from_str(emoji))
+
+
+def test_reaction_listener(monkeypatch):
+    bot = FakeBot()
+    monkeypatch.setattr(Config(), "_bot", bot)
+    listener = ReactionListener()
+    events = []
+
+    async def callback(event):
+        events.append((event.data, str(event.emoji)))
+
+    msg1 = SimpleNamespace(id=1)
+    msg2 = SimpleNamespace(id=2)
+    reg1 = listener.register(msg1, callback, data="all")
+    listener.register(msg1, callback, data="eyes", emojis=["\U0001F440"])
+    listener.register(msg2, callback, data="other")
+    assert len(listener.registrations) == 3
+
+    asyncio.run(listener._check(payload(1, "\U0001F440"), ReactionAction.ADD))
+    assert events == [("all", "\U0001F440"), ("eyes", "\U0001F440")]
+    assert bot.channel.fetches == 1
+
+    events.clear()
+    asyncio.run(listener._check(payload(1, "✅"), ReactionAction.ADD))
+    asyncio.run(listener._check(payload(3, "✅"), ReactionAction.ADD))
+    assert events == [("all", "✅")]
+
+    reg1.deregister()
+    reg1.deregister()
+    events.clear()
+    asyncio.run(listener._check(payload(1, "✅"), ReactionAction.ADD))
+    assert not events
+    assert len(listener.registrations) == 2
+
+
+def test_reaction_listener_deregister_in_callback(monkeypatch):
+    monkeypatch.setattr(Config(), "_bot", FakeBot())
+    listener = ReactionListener()
+    events = []
+
+    async def first(event):
+        assert isinstance(event, ReactionAddedEvent)
+        events.append("first")
+        event.data.deregister()
+        second_reg.deregister()
+
+    async def second(_):
+        events.append("second")
+
+    msg = SimpleNamespace(id=1)
+    first_reg = listener.register(msg, first)
+    first_reg.data = first_reg
+    second_reg = listener.register(msg, second)
+    asyncio.run(listener._check(payload(1, "✅"), ReactionAction.ADD))
+    assert events == ["first"]
+    assert not listener.registrations
@@ -0,0 +1,123 @@
+import asyncio
+import json
+
+import pytest
+
+from botutils.restclient import ResponseCache, CacheEntry, Client, Transport
+
+# pylint: disable=missing-function-docstring,missing-class-docstring
+
+
+def test_cache_key_ignores_params():
+    cache = ResponseCache(ignore_params=("geckirandom",))
+    a = cache.build_key("GET", "http://example.com/a", {"x": 1, "geckirandom": 123})
+    b = cache.build_key("GET", "http://example.com/a", {"geckirandom": 456, "x": "1"})
+    c = cache.build_key("GET", "http://example.com/a", {"x": 2})
+    assert a == b
+    assert a != c
+
+
+def test_cache_ttls():
+    cache = ResponseCache(ttl=30, ttls={"soccer/*/standings": 300, "api_count.php": 0})
+    assert cache.get_ttl("/soccer/ger.1/standings") == 300
+    assert cache.get_ttl("soccer/ger.1/scoreboard") == 30
+    assert cache.get_ttl("api_count.php") == 0
+
+
+def test_cache_lru():
+    cache = ResponseCache(maxsize=2)
+    cache.put(("GET", "a", ()), CacheEntry("a", 0))
+    cache.put(("GET", "b", ()), CacheEntry("b", 0))
+    assert cache.get(("GET", "a", ())).body == "a"
+    cache.put(("GET", "c", ()), CacheEntry("c", 0))
+    assert len(cache) == 2
+    assert cache.get(("GET", "b", ())) is None
+    assert cache.get(("GET", "a", ())) is not None
+    assert not cache.get(("GET", "c", ())).is_fresh()
+
+
+class DummyResponse:
+    def __init__(self, status, body, headers):
+        self.status = status
+        self.body = body
+        self.headers = headers
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    async def text(self):
+        return self.body
+
+
+class DummySession:
+    """Answers requests with the queued `(status, body, headers)` responses and records the request headers"""
+    closed = False
+
+    def __init__(self):
+        self.responses = []
+        self.requests = []
+
+    def get(self, url, headers=None, data=None):
+        # pylint: disable=unused-argument
+        self.requests.append((url, dict(headers)))
+        status, body, headers = self.responses.pop(0)
+        return DummyResponse(status, body, headers)
+
+
+@pytest.fixture(name="session")
+def fixture_session(monkeypatch):
+    session = DummySession()
+    monkeypatch.setattr(Transport, "_session", session)
+    return session
+
+
+def test_request_cache_hit(session):
+    client = Client("example.com", cache=ResponseCache(ttl=60))
+    session.responses.append((200, json.dumps({"a": 1}), {}))
+
+    async def run():
+        assert await client.request("a", params={"x": 1}) == {"a": 1}
+        assert await client.request("a", params={"x": 1}) == {"a": 1}
+        # ttl override bypasses the cache
+        session.responses.append((200, json.dumps({"a": 2}), {}))
+        assert await client.request("a", params={"x": 1}, cache_ttl=0) == {"a": 2}
+
+    asyncio.run(run())
+    assert len(session.requests) == 2
+    assert (client.cache.hits, client.cache.misses) == (1, 1)
+
+
+def test_request_cache_revalidation(session):
+    client = Client("example.com", cache=ResponseCache(ttl=60))
+    session.responses.append((200, json.dumps({"a": 1}), {"ETag": "\"v1\""}))
+
+    async def run():
+        assert await client.request("a") == {"a": 1}
+        client.cache.get(client.cache.build_key("GET", client.url("a"), None)).expires = 0
+        session.responses.append((304, "", {}))
+        assert await client.request("a") == {"a": 1}
+        # refreshed by the revalidation
+        assert await client.request("a") == {"a": 1}
+
+    asyncio.run(run())
+    assert "If-None-Match" not in session.requests[0][1]
+    assert session.requests[1][1]["If-None-Match"] == "\"v1\""
+    assert len(session.requests) == 2
+    assert (client.cache.hits, client.cache.revalidations) == (1, 1)
+
+
+def test_request_cache_status(session):
+    client = Client("example.com", cache=ResponseCache(ttl=60))
+    session.responses += [(404, json.dumps({"error": 1}), {}), (200, json.dumps({"a": 1}), {})]
+
+    async def run():
+        assert await client.request("a") == {"error": 1}
+        assert await client.request("a") == {"a": 1}
+        assert await client.request("a") == {"a": 1}
+
+    asyncio.run(run())
+    assert len(session.requests) == 2
+    assert len(client.cache) == 1
@@ -0,0 +1,97 @@
+import asyncio
+import io
+import json
+import urllib.error
+from types import SimpleNamespace
+
+import pytest
+
+from botutils.sheetsclient import Client, ServiceAccount, SheetsApiError
+
+# pylint: disable=missing-function-docstring,protected-access,unused-argument
+
+ERROR = {"error": {"code": 403, "status": "PERMISSION_DENIED", "message": "denied"}}
+
+
+def client(api_key="key"):
+    return Client(SimpleNamespace(GOOGLE_API_KEY=api_key), "sheet")
+
+
+def test_requests():
+    c = client()
+    assert c._get_request("A1:B2", True) == \
+        ("GET", "sheet/values/A1:B2", [("valueRenderOption", "FORMATTED_VALUE")], None, True)
+    assert c._get_multiple_request(["A1", "Tab!B2"], False) == \
+        ("GET", "sheet/values:batchGet",
+         [("valueRenderOption", "UNFORMATTED_VALUE"), ("ranges", "A1"), ("ranges", "Tab!B2")], None, True)
+    assert c._update_multiple_request({"A1": [["x"]], "B2": [["y"]]}, False) == \
+        ("POST", "sheet/values:batchUpdate", None,
+         {"valueInputOption": "USER_ENTERED", "data": [{"range": "A1", "values": [["x"]]},
+                                                       {"range": "B2", "values": [["y"]]}]}, False)
+    assert c._batch_update_request([{"findReplace": {}}]) == \
+        ("POST", "sheet:batchUpdate", None, {"requests": [{"findReplace": {}}]}, False)
+
+
+def test_prepare():
+    # reads use the API key
+    route, params, headers, needs_token = client()._prepare("sheet/values/Tab 1!A1", [("a", 1)], None, True)
+    assert route == "sheet/values/Tab%201%21A1"
+    assert params == [("a", 1), ("key", "key")]
+    assert not headers
+    assert not needs_token
+
+    # writes and reads without API key use the service account
+    route, params, headers, needs_token = client()._prepare("sheet:batchUpdate", None, {}, False)
+    assert not params
+    assert headers == {"Content-Type": "application/json"}
+    assert needs_token
+    _, params, _, needs_token = client(api_key=None)._prepare("sheet/values/A1", None, None, True)
+    assert not params
+    assert needs_token
+
+
+def test_check():
+    assert Client._check({"values": []}) == {"values": []}
+    with pytest.raises(SheetsApiError) as e:
+        Client._check(ERROR)
+    assert e.value.code == 403
+    assert e.value.status == "PERMISSION_DENIED"
+
+
+def test_execute_sync_http_error(monkeypatch):
+    c = client()
+    requests = []
+
+    def make_request(route, params=None, data=None, headers=None, method="GET"):
+        requests.append((method, route, params, headers))
+        raise urllib.error.HTTPError("url", 403, "Forbidden", {}, io.BytesIO(json.dumps(ERROR).encode("utf-8")))
+
+    monkeypatch.setattr(c, "make_request", make_request)
+    monkeypatch.setattr(ServiceAccount, "token_sync", classmethod(lambda cls: "token"))
+    with pytest.raises(SheetsApiError):
+        c.get("A1")
+    with pytest.raises(SheetsApiError):
+        c.update_multiple({"A1": [["x"]]})
+    assert requests[0][2] == [("valueRenderOption", "FORMATTED_VALUE"), ("key", "key")]
+    assert "Authorization" not in requests[0][3]
+    assert requests[1][3]["Authorization"] == "Bearer token"
+
+
+def test_get_async(monkeypatch):
+    c = client(api_key=None)
+    responses = [{"values": [["x"]]}, ERROR]
+    requests = []
+
+    async def request(route, params=None, data=None, headers=None, method="GET"):
+        requests.append(headers)
+        return responses.pop(0)
+
+    async def token(cls):
+        return "token"
+
+    monkeypatch.setattr(c, "request", request)
+    monkeypatch.setattr(ServiceAccount, "token", classmethod(token))
+    assert asyncio.run(c.get_async("A1")) == [["x"]]
+    with pytest.raises(SheetsApiError):
+        asyncio.run(c.get_async("A1"))
+    assert requests[0]["Authorization"] == "Bearer token"
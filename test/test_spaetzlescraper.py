@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+
+from plugins.spaetzle.scraper import ForumScraper, parse_page
+
+pytest.importorskip("bs4")
+
+# pylint: disable=missing-function-docstring
+
+THREAD = "/spaetzle/thread/forum/1/thread/42"
+PAGES = 5
+POSTS_PER_PAGE = 2
+
+
+def post_html(post_id: int) -> str:
+    return f"""
+    <div class="box">
+        <div class="post-header-datum"> 01.01.2022 - 12:{post_id:02d} </div>
+        <a class="forum-user" href="/user/{post_id}">user{post_id}</a>
+        <div class="forum-post-data">Team A - Team B  2:1\nTeam C – Team D   0:0</div>
+        <span class="link-zum-post"><a href="{THREAD}/post/{post_id}">#{post_id}</a></span>
+    </div>"""
+
+
+def page_html(number: int, pages: int = PAGES) -> str:
+    """:return: html of a thread page whose pagination shows the neighbouring pages only"""
+    init = ""
+    if number == 1:
+        init = '<div id="initialPost"><div class="forum-post-data">Spieltag 1\nTeam A - Team B</div></div>'
+    posts = "".join(post_html((number - 1) * POSTS_PER_PAGE + i) for i in range(POSTS_PER_PAGE))
+    items = []
+    for n in range(max(number - 1, 1), min(number + 1, pages) + 1):
+        items.append(f'<li class="tm-pagination__list-item"><a href="{THREAD}/page/{n}">{n}</a></li>')
+    if number < pages:
+        items.append('<li class="tm-pagination__list-item tm-pagination__list-item--icon-next-page">'
+                     f'<a href="{THREAD}/page/{number + 1}">&gt;</a></li>')
+    return f'<html><body>{init}<div id="postList">{posts}</div><ul>{"".join(items)}</ul></body></html>'
+
+
+def test_parse_page():
+    page = parse_page(page_html(1), 1)
+    assert page.init == ["Spieltag 1", "Team A - Team B"]
+    assert [post_id for post_id, _ in page.posts] == ["#0", "#1"]
+    assert page.posts[1][1] == {"user": "user1", "time": "01.01.2022 - 12:01", "link": f"{THREAD}/post/1",
+                                "content": ["Team A - Team B 2:1", "Team C - Team D 0:0"]}
+    assert page.last_page == 2
+    assert page.next_href == f"{THREAD}/page/2"
+
+    page = parse_page(page_html(PAGES), PAGES)
+    assert page.init is None
+    assert page.last_page == PAGES
+    assert page.next_href is None
+
+
+def scrape(pages: int, start_page: int = 1, page_href: str = None):
+    """:return: scrape result and the numbers of the fetched pages"""
+    fetched = []
+
+    async def run():
+        scraper = ForumScraper("https://www.transfermarkt.de" + THREAD)
+
+        async def fetch(url, number):
+            assert url.endswith(THREAD if number == 1 else f"{THREAD}/page/{number}")
+            fetched.append(number)
+            return parse_page(page_html(number, pages=pages), number)
+
+        scraper.fetch = fetch
+        return await scraper.scrape(start_page=start_page, page_href=page_href)
+
+    return asyncio.run(run()), fetched
+
+
+def test_scrape_next_links():
+    # the pagination of the first page only shows page 2; the rest is found by the next page links
+    (init, posts, last_page, page_href), fetched = scrape(PAGES)
+    assert init == ["Spieltag 1", "Team A - Team B"]
+    assert list(posts) == ["#{}".format(i) for i in range(PAGES * POSTS_PER_PAGE)]
+    assert last_page == PAGES
+    assert page_href == f"{THREAD}/page/2"
+    assert sorted(fetched) == list(range(1, PAGES + 1))
+
+
+def test_scrape_incremental():
+    (init, posts, last_page, _), fetched = scrape(PAGES, start_page=3, page_href=f"{THREAD}/page/2")
+    assert init is None
+    assert list(posts) == ["#{}".format(i) for i in range(2 * POSTS_PER_PAGE, PAGES * POSTS_PER_PAGE)]
+    assert last_page == PAGES
+    assert sorted(fetched) == [3, 4, 5]
+
+    # the thread did not grow since the last scrape
+    (_, posts, last_page, _), fetched = scrape(PAGES, start_page=PAGES, page_href=f"{THREAD}/page/2")
+    assert list(posts) == ["#8", "#9"]
+    assert last_page == PAGES
+    assert fetched == [PAGES]
+
+    # without page link template, the scrape starts at the first page
+    (init, _, _, _), fetched = scrape(2, start_page=2)
+    assert init is not None
+    assert fetched == [1, 2]
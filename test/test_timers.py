@@ -1,10 +1,13 @@
+import asyncio
 import logging
 
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
 
+from base.data import Config
 from services import timers
 
-# pylint: disable=missing-function-docstring
+# pylint: disable=missing-function-docstring,protected-access
 
 DEBUG = False
 
@@ -215,3 +218,139 @@ def test_cron_alg_futureyearpastmonth():
     timedict = timers.timedict(year=2031, month=6, monthday=23, hour=15, minute=12)
     expected = datetime(year=2031, month=6, day=23, hour=15, minute=12)
     tcase_cron_alg(now, timedict, expected)
+
+
+def test_cron_alg_impossible():
+    now = datetime(year=2021, month=7, day=25, hour=12, minute=11)
+    timedict = timers.timedict(month=2, monthday=30)
+    tcase_cron_alg(now, timedict, None)
+
+
+def test_cron_alg_sparse_weekday():
+    # next sunday 31st in a month
+    now = datetime(year=2021, month=7, day=25, hour=12, minute=11)
+    timedict = timers.timedict(monthday=31, weekday=7, hour=8, minute=30)
+    expected = datetime(year=2021, month=10, day=31, hour=8, minute=30)
+    tcase_cron_alg(now, timedict, expected)
+
+
+def run_mothership(monkeypatch, coro):
+    """
+    Runs `coro(mothership)` with a fresh Mothership on a stub bot.
+    """
+    bot = SimpleNamespace(timers=None)
+    monkeypatch.setattr(Config(), "_bot", bot)
+
+    async def run():
+        bot.timers = timers.Mothership()
+        await coro(bot.timers)
+    asyncio.run(run())
+
+
+def future_td():
+    """:return: timedict that is due on the first of january next year"""
+    return timers.timedict(year=date.today().year + 1, month=1, monthday=1, hour=0, minute=0)
+
+
+def test_mothership_wakeup_together(monkeypatch):
+    async def coro(ms):
+        fired = []
+        batches = []
+        pop_due = ms._pop_due
+
+        def recording_pop_due(now):
+            r = pop_due(now)
+            if r:
+                batches.append(r)
+            return r
+        ms._pop_due = recording_pop_due
+
+        jobs = [ms.schedule(fired.append, future_td()) for _ in range(3)]
+        soon = datetime.now() + timedelta(milliseconds=50)
+        ms.push(jobs[0], soon)
+        ms.push(jobs[1], soon)
+        await asyncio.sleep(0.3)
+
+        assert batches == [jobs[:2]]
+        assert fired == jobs[:2]
+        # repeating jobs are pushed again with their next execution
+        for job in jobs:
+            assert job.heap_entry is not None
+            assert job.heap_entry[0] == job.next_execution()
+        assert len(ms.jobs) == 3
+    run_mothership(monkeypatch, coro)
+
+
+def test_mothership_cancel_compaction(monkeypatch):
+    async def coro(ms):
+        jobs = [ms.schedule(lambda _job: None, future_td()) for _ in range(100)]
+        assert len(ms._heap) == 100
+
+        # cancelled entries stay in the heap until compaction
+        for job in jobs[:64]:
+            job.cancel()
+        assert len(ms._heap) == 100
+        assert ms._dead == 64
+        assert all(job.heap_entry is None for job in jobs[:64])
+        assert sum(1 for entry in ms._heap if entry[2] is None) == 64
+
+        jobs[64].cancel()
+        assert len(ms._heap) == 35
+        assert ms._dead == 0
+
+        for job in jobs[65:70]:
+            job.cancel()
+        assert len(ms._heap) == 35
+        assert ms._dead == 5
+        assert ms.jobs == jobs[70:]
+
+        due = ms._pop_due(datetime.now() + timedelta(days=400))
+        assert due == jobs[70:]
+        assert ms._dead == 0
+        assert not ms._heap
+    run_mothership(monkeypatch, coro)
+
+
+def test_job_fire_oneshot(monkeypatch):
+    async def coro(ms):
+        fired = []
+        job = ms.schedule(fired.append, future_td(), repeat=False)
+        assert job in ms.jobs
+        ms._pop_due(job.heap_entry[0])
+
+        await job.fire()
+        assert fired == [job]
+        assert job not in ms.jobs
+        assert job.heap_entry is None
+        assert not job.is_scheduled
+    run_mothership(monkeypatch, coro)
+
+
+def test_job_fire_repeat(monkeypatch):
+    async def coro(ms):
+        fired = []
+        job = ms.schedule(fired.append, future_td())
+        ms._pop_due(job.heap_entry[0])
+        assert job.heap_entry is None
+
+        await job.fire()
+        assert fired == [job]
+        assert job in ms.jobs
+        assert job.heap_entry is not None and ms._heap == [job.heap_entry]
+        assert job.is_scheduled
+    run_mothership(monkeypatch, coro)
+
+
+def test_job_execute_oneshot(monkeypatch):
+    async def coro(ms):
+        fired = []
+        job = ms.schedule(fired.append, future_td(), repeat=False)
+        entry = job.heap_entry
+
+        job.execute()
+        assert fired == [job]
+        assert job not in ms.jobs
+        assert job.heap_entry is None
+        assert entry[2] is None and ms._dead == 1
+        assert ms._pop_due(entry[0]) == []
+    run_mothership(monkeypatch, coro)
@@ -0,0 +1,37 @@
+# pylint: disable=missing-function-docstring
+import asyncio
+
+from plugins.wordle.benchmark import BenchmarkResult, GameRecord, run_benchmark
+from plugins.wordle.wordlist import WordList, Parsers
+
+
+def test_benchmark_result():
+    records = [
+        GameRecord("crane", ["slate", "crane"], True, False, 0.001),
+        GameRecord("crane", ["slate", "brine", "crane"], True, False, 0.002),
+        GameRecord("crane", ["slate"] * 6, False, False, 0.003),
+        GameRecord("crane", ["slate"], False, True, 0.004),
+    ]
+    result = BenchmarkResult("naive", records, 2)
+    assert result.distribution() == {0: 1, 1: 0, 2: 1, 3: 1, 4: 0, 5: 0, 6: 0}
+    assert result.success_rate == 0.5
+    assert result.score == (5 + 4) / 4
+    assert result.games_per_second == 2
+    assert result.latency(50) == 0.002
+    assert result.latency(100) == 0.004
+    assert len(result.failures()) == 2
+
+
+def test_run_benchmark():
+    wordlist = WordList("https://example.org", Parsers.NYTIMES, ("crane", "slate"), ("brine",))
+    progress = []
+
+    async def on_progress(played, total):
+        progress.append((played, total))
+
+    result = asyncio.run(run_benchmark(wordlist, "dice", 5, processes=1, chunk_size=2, progress=on_progress))
+    assert result.games == 5
+    assert progress[-1] == (5, 5)
+    for record in result.records:
+        game = record.replay(wordlist)
+        assert len(game.guesses) == len(record.guesses)
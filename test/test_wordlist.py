@@ -0,0 +1,45 @@
+# pylint: disable=missing-function-docstring
+import pytest
+
+from plugins.wordle.wordlist import WordList, Parsers, WORDLENGTH
+
+
+def build_wordlist():
+    return WordList("https://example.org", Parsers.NYTIMES, ("crane", "gecki"), ("aahed", "zymic"))
+
+
+def test_wordlist_contains():
+    wl = build_wordlist()
+    for word in ("crane", "gecki", "aahed", "zymic"):
+        assert word in wl
+    assert "cran" not in wl
+    assert "zzzzz" not in wl
+    assert len(wl) == 4
+    assert wl.words == ("aahed", "zymic", "crane", "gecki")
+
+
+def test_wordlist_encoded():
+    wl = build_wordlist()
+    assert len(wl.encoded) == len(wl) * WORDLENGTH
+    assert wl.encode("aahed") == bytes([0, 0, 7, 4, 3])
+    for i, word in enumerate(wl.words):
+        assert wl.index(word) == i
+        assert wl.decode(wl.encoded[i * WORDLENGTH:(i + 1) * WORDLENGTH]) == word
+    with pytest.raises(ValueError):
+        wl.encode("ab1de")
+
+
+def test_wordlist_invalidate_cache():
+    wl = build_wordlist()
+    assert len(wl.encoded) == 4 * WORDLENGTH
+    wl.solutions = wl.solutions + ("sorry",)
+    wl.invalidate_cache()
+    assert "sorry" in wl
+    assert wl.index("sorry") == 4
+    assert len(wl.encoded) == 5 * WORDLENGTH
+
+
+def test_wordlist_serialize():
+    wl = WordList.deserialize(build_wordlist().serialize())
+    assert "gecki" in wl
+    assert "crane" in wl
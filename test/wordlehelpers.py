@@ -0,0 +1,22 @@
+import random
+
+from plugins.wordle.wordlist import WordList, Parsers
+
+LETTERS = "eeeeeetttttaaaaoooiiinnnsssshhrrdlcumwfgypbvk"
+"""Letter pool with roughly english letter frequencies"""
+
+
+def build_wordlist(size: int, seed: int = 0) -> WordList:
+    """
+    Builds a reproducible word list of random words.
+
+    :param size: total amount of words
+    :param seed: random seed
+    :return: word list with a quarter of the words as solutions
+    """
+    rnd = random.Random(seed)
+    words = set()
+    while len(words) < size:
+        words.add("".join(rnd.choice(LETTERS) for _ in range(5)))
+    words = sorted(words)
+    return WordList("https://example.org", Parsers.NYTIMES, tuple(words[:size // 4]), tuple(words[size // 4:]))
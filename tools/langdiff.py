@@ -1,13 +1,17 @@
 #!/usr/bin/env python3
 
 ###
-# Lists all lang strings that are not present in every language that is present in the respective lang file.
+# Lists all lang strings that are not present in every language that is present in the respective lang file
+# and all lang strings whose format placeholders differ between languages.
 ###
 
 import json
 import os
 import sys
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from botutils.formatutils import format_placeholders  # pylint: disable=wrong-import-position
+
 LANGDIR = "lang"
 
 
@@ -62,6 +66,30 @@ class Found:
                 yield "  {}{} not found in {}".format(prefix, langstring, ", ".join(el))
 
 
+def placeholder_diff(s: dict) -> dict:
+    """
+    Compares the placeholders of all lang strings between the languages of a lang file.
+
+    :param s: lang file content
+    :return: dict langstring -> {langcode: placeholder description} for every mismatch or invalid format string
+    """
+    r = {}
+    for langstring in {langstring for strings in s.values() for langstring in strings}:
+        found = {}
+        for langcode, strings in s.items():
+            text = strings.get(langstring)
+            if not isinstance(text, str):
+                continue
+            try:
+                positional, named = format_placeholders(text)
+                found[langcode] = ", ".join(["{} positional".format(positional)] + sorted(named))
+            except ValueError as e:
+                found[langcode] = "invalid format string ({})".format(e)
+        if len(set(found.values())) > 1 or any(el.startswith("invalid") for el in found.values()):
+            r[langstring] = found
+    return r
+
+
 def diff(filename: str) -> bool:
     """
     Does the diff for a specific file, also does the output
@@ -83,12 +111,18 @@ def diff(filename: str) -> bool:
                 if langstring not in s[diffto]:
                     found.append(key, langstring, diffto)
 
-    if not found:
+    mismatches = placeholder_diff(s)
+    if not found and not mismatches:
         return False
 
     print("{}:".format(filename))
     for msg in found.to_messages(prefix="  "):
         print(msg)
+    if mismatches:
+        print("  placeholder mismatches:")
+        for langstring in sorted(mismatches):
+            print("    {}: {}".format(langstring, "; ".join("{}: {}".format(langcode, el)
+                                                         for langcode, el in mismatches[langstring].items())))
     print()
     return True
 